@@ -0,0 +1,257 @@
+"""
+Benchmarks for fastapi-event overhead.
+
+Requests are sent to an in-memory ASGI client, so no network is used.
+
+    python benchmarks/run.py
+    python benchmarks/run.py --quick --output result.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+from starlette.types import ASGIApp, Receive, Scope, Send  # noqa: E402
+
+from fastapi_event import (  # noqa: E402
+    BaseEvent,
+    EventHandlerMiddleware,
+    EventListener,
+    event_handler,
+)
+from fastapi_event.handler import EventHandler, EventHandlerValidator  # noqa: E402
+
+
+class BenchmarkParameter(BaseModel):
+    id: int
+
+
+class BenchmarkEvent(BaseEvent):
+    async def run(self, parameter=None) -> None:
+        pass
+
+
+class OrderedBenchmarkEvent(BaseEvent):
+    ORDER = 1
+
+    async def run(self, parameter=None) -> None:
+        pass
+
+
+async def request(app: ASGIApp, path: str = "/") -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("testclient", 50000),
+        "server": ("testserver", 80),
+    }
+    status = 0
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def plain_app(scope: Scope, receive: Receive, send: Send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
+
+
+def make_storing_app(events: int) -> ASGIApp:
+    @EventListener()
+    async def store() -> None:
+        for id in range(events):
+            await event_handler.store(
+                event=BenchmarkEvent, parameter=BenchmarkParameter(id=id),
+            )
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        await store()
+        await plain_app(scope, receive, send)
+
+    return app
+
+
+def make_fastapi_app(events: int) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(EventHandlerMiddleware)
+
+    @EventListener()
+    async def store() -> None:
+        for id in range(events):
+            await event_handler.store(
+                event=BenchmarkEvent, parameter=BenchmarkParameter(id=id),
+            )
+
+    @app.get("/")
+    async def index():
+        await store()
+        return {}
+
+    return app
+
+
+async def timeit(func: Callable[[], Awaitable[Any]], iterations: int) -> Dict[str, float]:
+    for _ in range(min(iterations, 100)):
+        await func()
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await func()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "iterations": iterations,
+        "total_s": elapsed,
+        "per_op_us": elapsed / iterations * 1e6,
+        "ops_per_s": iterations / elapsed,
+    }
+
+
+async def bench_middleware(iterations: int, events: int) -> Dict[str, Any]:
+    wrapped = EventHandlerMiddleware(plain_app)
+    storing = EventHandlerMiddleware(make_storing_app(events=events))
+    result = {
+        "plain": await timeit(lambda: request(plain_app), iterations),
+        "middleware": await timeit(lambda: request(wrapped), iterations),
+        f"middleware_with_{events}_events": await timeit(
+            lambda: request(storing), iterations,
+        ),
+    }
+    result["overhead_us"] = (
+        result["middleware"]["per_op_us"] - result["plain"]["per_op_us"]
+    )
+    return result
+
+
+async def bench_store(iterations: int) -> Dict[str, Any]:
+    handler = EventHandler(validator=EventHandlerValidator())
+    parameter = BenchmarkParameter(id=1)
+
+    async def store() -> None:
+        await handler.store(event=BenchmarkEvent, parameter=parameter)
+        if len(handler.events) >= 1000:
+            handler._clear()
+
+    async def store_without_parameter() -> None:
+        await handler.store(event=BenchmarkEvent)
+        if len(handler.events) >= 1000:
+            handler._clear()
+
+    return {
+        "store": await timeit(store, iterations),
+        "store_without_parameter": await timeit(store_without_parameter, iterations),
+    }
+
+
+async def bench_publish(iterations: int, events: int) -> Dict[str, Any]:
+    handler = EventHandler(validator=EventHandlerValidator())
+    parameters = [BenchmarkParameter(id=id) for id in range(events)]
+    result = {}
+
+    for name, options in (
+        ("run_at_once_true", {"run_at_once": True}),
+        ("run_at_once_false", {"run_at_once": False}),
+        ("run_at_once_eager", {"run_at_once": True, "eager": True}),
+    ):
+        async def publish() -> None:
+            for id, parameter in enumerate(parameters):
+                event = OrderedBenchmarkEvent if id % 2 else BenchmarkEvent
+                await handler.store(event=event, parameter=parameter)
+            await handler._publish(**options)
+
+        result[name] = await timeit(publish, iterations)
+
+    return {f"{events}_events": result}
+
+
+async def bench_latency(rounds: int, concurrency: int, events: int) -> Dict[str, Any]:
+    app = make_fastapi_app(events=events)
+    latencies: List[float] = []
+
+    async def timed_request() -> None:
+        started = time.perf_counter()
+        await request(app)
+        latencies.append(time.perf_counter() - started)
+
+    for _ in range(rounds):
+        await asyncio.gather(*[timed_request() for _ in range(concurrency)])
+
+    latencies.sort()
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "events_per_request": events,
+        "p50_ms": quantiles[49] * 1e3,
+        "p99_ms": quantiles[98] * 1e3,
+        "max_ms": latencies[-1] * 1e3,
+    }
+
+
+async def main(args: argparse.Namespace) -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "middleware": await bench_middleware(
+            iterations=args.iterations, events=args.events,
+        ),
+        "store": await bench_store(iterations=args.iterations),
+        "publish": await bench_publish(
+            iterations=max(args.iterations // args.events, 1), events=args.events,
+        ),
+        "latency": await bench_latency(
+            rounds=args.rounds, concurrency=args.concurrency, events=args.events,
+        ),
+    }
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--events", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--quick", action="store_true", help="run fewer iterations")
+    parser.add_argument("--output", help="write JSON result to this file")
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.iterations = 1000
+        args.rounds = 5
+
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args(sys.argv[1:])
+    result = asyncio.run(main(args))
+    text = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    print(text)
@@ -1,11 +1,30 @@
 from fastapi_event.base import BaseEvent
+from fastapi_event.connection import EventConnection
+from fastapi_event.dispatcher import EventDispatcher
 from fastapi_event.handler import event_handler
+from fastapi_event.lane import Lane, LaneDispatcher
 from fastapi_event.listener import EventListener
 from fastapi_event.middleware import EventHandlerMiddleware
+from fastapi_event.topic import subscribe
+from fastapi_event.transport import (
+    BaseTransport,
+    InProcessTransport,
+    MultiprocessingTransport,
+    UnixSocketTransport,
+)
 
 __all__ = [
     "event_handler",
     "BaseEvent",
     "EventListener",
     "EventHandlerMiddleware",
+    "EventConnection",
+    "subscribe",
+    "EventDispatcher",
+    "Lane",
+    "LaneDispatcher",
+    "BaseTransport",
+    "InProcessTransport",
+    "MultiprocessingTransport",
+    "UnixSocketTransport",
 ]
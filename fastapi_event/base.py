@@ -1,12 +1,65 @@
+import dataclasses
 from abc import ABC, abstractmethod
-from typing import Type, Union
+from typing import Any, List, Type, Union
 
 from pydantic import BaseModel
 
+DEDUP_KEEP_ALL = "keep_all"
+DEDUP_KEEP_FIRST = "keep_first"
+DEDUP_KEEP_LAST = "keep_last"
+
+
+def is_parameter_type(value: Any) -> bool:
+    """
+    Whether `value` is a class events accept as parameter:
+    a `BaseModel`, dataclass, NamedTuple or dict.
+    """
+    if not isinstance(value, type):
+        return False
+
+    return (
+        issubclass(value, (BaseModel, dict))
+        or dataclasses.is_dataclass(value)
+        or (issubclass(value, tuple) and hasattr(value, "_fields"))
+    )
+
 
 class BaseEvent(ABC):
+    NAME = None
     ORDER = None
+    TIMEOUT = None
+    CONCURRENCY = None
+    EXECUTOR = None
+    BATCH_MAX_SIZE = 100
+    BATCH_MAX_WAIT_MS = 50
+    DEDUP = DEDUP_KEEP_ALL
+    SINGLETON = False
+    RETRY = None
+    CIRCUIT_BREAKER = None
+    DEPENDS_ON = ()
+    LIMIT = None
+    LANE = None
 
     @abstractmethod
     async def run(self, parameter: Union[Type[BaseModel], None] = None) -> None:
         pass
+
+    async def batch_run(self, parameters: List[Union[BaseModel, None]]) -> None:
+        """
+        Override to receive every parameter stored for this event
+        in one call instead of calling `run()` for each of them.
+        """
+        raise NotImplementedError
+
+    async def startup(self) -> None:
+        """
+        Called once before the first run of a `SINGLETON` event.
+        Open clients, pools or caches that every run shares here.
+        """
+        pass
+
+    async def shutdown(self) -> None:
+        """
+        Called by `event_handler.shutdown()` to release what `startup()` opened.
+        """
+        pass
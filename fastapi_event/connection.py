@@ -0,0 +1,183 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from fastapi_event.exceptions import InvalidFlushPolicyException
+from fastapi_event.handler import (
+    ON_ERROR_RAISE,
+    EventHandlerDelegator,
+    _Checkpoint,
+    _handler_context,
+    event_handler,
+)
+from fastapi_event.listener import EventListener
+from fastapi_event.transport import BaseTransport
+
+logger = logging.getLogger(__name__)
+
+
+class EventConnection:
+    """
+    Event scope of a long-lived connection such as a WebSocket. One handler
+    is used for the whole connection, and events stored in `message()`
+    are published every `flush_every` messages or `flush_interval_ms`
+    after the first unpublished message, and once more when the connection ends.
+    """
+
+    def __init__(
+        self,
+        flush_every: int = 1,
+        flush_interval_ms: Optional[float] = None,
+        run_at_once: bool = True,
+        waves: bool = False,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        dispatcher: Optional[BaseTransport] = None,
+        on_error: str = ON_ERROR_RAISE,
+        eager: bool = False,
+    ):
+        if (
+            isinstance(flush_every, bool)
+            or not isinstance(flush_every, int)
+            or flush_every <= 0
+        ):
+            raise InvalidFlushPolicyException
+
+        if flush_interval_ms is not None and flush_interval_ms <= 0:
+            raise InvalidFlushPolicyException
+
+        listener = EventListener(
+            run_at_once=run_at_once,
+            waves=waves,
+            concurrency=concurrency,
+            timeout=timeout,
+            dispatcher=dispatcher,
+            on_error=on_error,
+            eager=eager,
+        )
+        self.flush_every = flush_every
+        self.flush_interval = (
+            flush_interval_ms / 1000 if flush_interval_ms is not None else None
+        )
+        self.messages = 0
+        self._options = listener._get_publish_options()
+        self._scope: Optional[EventHandlerDelegator] = None
+        self._message = _MessageScope(connection=self)
+        self._flushed_at = 0.0
+        self._checkpoint: Optional[_Checkpoint] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushing: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "EventConnection":
+        # Reuse the scope of `EventHandlerMiddleware` if there is one
+        if _handler_context.get() is None:
+            self._scope = event_handler()
+            self._scope.__enter__()
+
+        self._flushed_at = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            self._cancel_timer()
+            await self._wait_flushing()
+            if exc_type is None:
+                await self.flush()
+        finally:
+            scope, self._scope = self._scope, None
+            if scope is not None:
+                scope.__exit__(exc_type, exc_value, traceback)
+
+    def message(self) -> "_MessageScope":
+        """
+        Scope of one message. If it raises, only the events
+        stored in this message are discarded.
+        """
+        return self._message
+
+    async def flush(self) -> None:
+        self._cancel_timer()
+        self.messages = 0
+        self._flushed_at = time.monotonic()
+        await event_handler._publish(**self._options)
+
+    async def _begin_message(self) -> None:
+        # Events stored while a timed flush is publishing would be cleared by it
+        await self._wait_flushing()
+        handler = event_handler._get_event_handler()
+        self._checkpoint = handler._checkpoint()
+
+    async def _end_message(self) -> None:
+        self._checkpoint = None
+        self.messages += 1
+        if self.messages >= self.flush_every or (
+            self.flush_interval is not None
+            and time.monotonic() - self._flushed_at >= self.flush_interval
+        ):
+            await self.flush()
+        else:
+            self._start_timer()
+
+    def _discard(self) -> None:
+        checkpoint, self._checkpoint = self._checkpoint, None
+        handler = event_handler._get_event_handler(create=False)
+        if handler is not None and checkpoint is not None:
+            handler._rollback(checkpoint=checkpoint)
+
+        if self.messages:
+            # Events of earlier messages are still waiting for the interval
+            self._start_timer()
+
+    def _start_timer(self) -> None:
+        """
+        Publish after the interval even if no other message comes.
+        """
+        if self.flush_interval is None or self._timer is not None:
+            return
+
+        delay = self._flushed_at + self.flush_interval - time.monotonic()
+        self._timer = asyncio.get_running_loop().call_later(
+            max(delay, 0), self._flush_on_timer,
+        )
+
+    def _flush_on_timer(self) -> None:
+        self._timer = None
+        if self._checkpoint is not None:
+            # A message is open, it flushes when it ends
+            return
+
+        self._flushing = asyncio.ensure_future(self._flush_in_background())
+
+    async def _flush_in_background(self) -> None:
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Events of the connection could not be published")
+
+    async def _wait_flushing(self) -> None:
+        flushing, self._flushing = self._flushing, None
+        if flushing is not None:
+            await flushing
+
+    def _cancel_timer(self) -> None:
+        timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+
+
+class _MessageScope:
+    __slots__ = ("connection",)
+
+    def __init__(self, connection: EventConnection):
+        self.connection = connection
+
+    async def __aenter__(self) -> EventConnection:
+        await self.connection._begin_message()
+        return self.connection
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            await self.connection._end_message()
+        else:
+            self.connection._discard()
@@ -0,0 +1,198 @@
+import asyncio
+import logging
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from pydantic import BaseModel
+
+from fastapi_event.base import BaseEvent
+from fastapi_event.exceptions import (
+    InvalidOverflowPolicyException,
+    InvalidConcurrencyException,
+    DispatcherNotRunningException,
+    EventQueueFullException,
+)
+from fastapi_event.metrics import get_metrics_sink
+from fastapi_event.runner import EventRunner
+from fastapi_event.transport import BaseTransport
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_REJECT = "reject"
+
+
+class EventDispatcher(BaseTransport):
+    OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_REJECT)
+
+    def __init__(
+        self,
+        workers: int = 4,
+        queue_size: int = 1000,
+        overflow: str = OVERFLOW_BLOCK,
+        runner: Optional[EventRunner] = None,
+        name: str = "dispatcher",
+    ):
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise InvalidOverflowPolicyException
+
+        if workers <= 0:
+            raise InvalidConcurrencyException
+
+        self.workers = workers
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.name = name
+        self.runner = runner or EventRunner()
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._running = False
+        self._batches: Dict[Type[BaseEvent], List[Optional[BaseModel]]] = {}
+        self._batch_timers: Dict[Type[BaseEvent], asyncio.TimerHandle] = {}
+        self._flushing: Set[asyncio.Task] = set()
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def qsize(self) -> int:
+        if self._queue is None:
+            return 0
+
+        return self._queue.qsize()
+
+    async def start(self) -> None:
+        if self._running:
+            return
+
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._tasks = [
+            asyncio.create_task(self._work()) for _ in range(self.workers)
+        ]
+        self._running = True
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting events, wait for queued events to finish
+        until `timeout` and cancel the workers.
+        """
+        if not self._running:
+            return
+
+        self._running = False
+        try:
+            await asyncio.wait_for(self._drain(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Dispatcher stopped with %d events left in queue", self.qsize,
+            )
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def dispatch(
+        self, events: Iterable[Tuple[Type[BaseEvent], Optional[BaseModel]]],
+    ) -> None:
+        if not self._running:
+            raise DispatcherNotRunningException
+
+        for event, parameter in events:
+            descriptor = self.runner.registry.get(event=event)
+            if descriptor.batchable:
+                await self._add_to_batch(event=event, parameter=parameter)
+            else:
+                await self._put(item=(event, parameter, False))
+
+    async def _drain(self) -> None:
+        for event in list(self._batches):
+            await self._flush(event=event)
+        if self._flushing:
+            await asyncio.gather(*self._flushing, return_exceptions=True)
+
+        await self._join()
+
+    async def _join(self) -> None:
+        await self._queue.join()
+
+    async def _add_to_batch(
+        self, event: Type[BaseEvent], parameter: Optional[BaseModel] = None,
+    ) -> None:
+        descriptor = self.runner.registry.get(event=event)
+        parameters = self._batches.setdefault(event, [])
+        parameters.append(parameter)
+
+        if len(parameters) >= descriptor.batch_max_size:
+            await self._flush(event=event)
+        elif len(parameters) == 1:
+            loop = asyncio.get_running_loop()
+            self._batch_timers[event] = loop.call_later(
+                descriptor.batch_max_wait, self._flush_later, event,
+            )
+
+    def _flush_later(self, event: Type[BaseEvent]) -> None:
+        task = asyncio.ensure_future(self._flush_in_background(event=event))
+        self._flushing.add(task)
+        task.add_done_callback(self._flushing.discard)
+
+    async def _flush_in_background(self, event: Type[BaseEvent]) -> None:
+        try:
+            await self._flush(event=event)
+        except Exception:
+            logger.exception("Batch of `%s` could not be queued", event.__name__)
+
+    async def _flush(self, event: Type[BaseEvent]) -> None:
+        timer = self._batch_timers.pop(event, None)
+        if timer is not None:
+            timer.cancel()
+
+        parameters = self._batches.pop(event, None)
+        if parameters:
+            await self._put(item=(event, parameters, True))
+
+    async def _put(
+        self, item: Tuple[Type[BaseEvent], object, bool],
+    ) -> None:
+        if self.overflow == OVERFLOW_BLOCK:
+            await self._queue.put(item)
+        else:
+            if self._queue.full():
+                if self.overflow == OVERFLOW_REJECT:
+                    raise EventQueueFullException
+
+                self._queue.get_nowait()
+                self._queue.task_done()
+
+            self._queue.put_nowait(item)
+
+        self._record_queue_depth()
+
+    def _record_queue_depth(self) -> None:
+        sink = get_metrics_sink()
+        if sink is not None:
+            sink.record_queue_depth(queue=self.name, depth=self._queue.qsize())
+
+    async def _work(self) -> None:
+        while True:
+            event, parameter, is_batch = await self._queue.get()
+            self._record_queue_depth()
+            try:
+                await self._run(event=event, parameter=parameter, is_batch=is_batch)
+            finally:
+                self._queue.task_done()
+
+    async def _run(
+        self, event: Type[BaseEvent], parameter: object, is_batch: bool,
+    ) -> None:
+        try:
+            # A worker has nothing else to do, so it retries the event itself
+            if is_batch:
+                await self.runner.run_batch(
+                    event=event, parameters=parameter, retry_inline=True,
+                )
+            else:
+                await self.runner.run(event=event, parameter=parameter, retry_inline=True)
+        except Exception:
+            logger.exception("Event `%s` failed", event.__name__)
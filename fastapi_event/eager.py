@@ -0,0 +1,39 @@
+import asyncio
+import sys
+import warnings
+from typing import Any, Coroutine
+
+EAGER_SUPPORTED = sys.version_info >= (3, 12)
+
+_warned = False
+
+
+def create_eager_task(coro: Coroutine) -> "asyncio.Future[Any]":
+    """
+    Start `coro` right away instead of on the next loop iteration, so if it
+    finishes without suspending no loop iteration is spent on it.
+    Before Python 3.12 this is a plain task, so eager mode has no effect:
+    stepping the coroutine outside its own task would break
+    `asyncio.current_task()`, `asyncio.timeout()` and cancel scopes inside the event.
+    """
+    loop = asyncio.get_running_loop()
+    if EAGER_SUPPORTED:
+        return asyncio.Task(coro, loop=loop, eager_start=True)
+
+    return loop.create_task(coro)
+
+
+def warn_if_unsupported() -> None:
+    """
+    Warn once that eager mode has no effect before Python 3.12.
+    """
+    global _warned
+    if EAGER_SUPPORTED or _warned:
+        return
+
+    _warned = True
+    warnings.warn(
+        "eager=True has no effect before Python 3.12, events run as plain tasks",
+        RuntimeWarning,
+        stacklevel=3,
+    )
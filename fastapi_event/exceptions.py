@@ -5,7 +5,9 @@ class InvalidEventTypeException(Exception):
 
 class InvalidParameterTypeException(Exception):
     def __init__(self):
-        super().__init__("Parameter must inherit BaseModel")
+        super().__init__(
+            "Parameter must be an instance of BaseModel, dataclass, NamedTuple or dict"
+        )
 
 
 class EmptyContextException(Exception):
@@ -26,3 +28,155 @@ class RequiredParameterException(Exception):
 class InvalidOrderTypeException(Exception):
     def __init__(self):
         super().__init__("ORDER must be type of `int`")
+
+
+class InvalidDispatchModeException(Exception):
+    def __init__(self):
+        super().__init__("dispatch must be one of `inline`, `after_response`")
+
+
+class InvalidTimeoutException(Exception):
+    def __init__(self):
+        super().__init__("Timeout must be a positive number")
+
+
+class InvalidConcurrencyException(Exception):
+    def __init__(self):
+        super().__init__("Concurrency must be a positive `int`")
+
+
+class InvalidOverflowPolicyException(Exception):
+    def __init__(self):
+        super().__init__("overflow must be one of `block`, `drop_oldest`, `reject`")
+
+
+class DispatcherNotRunningException(Exception):
+    def __init__(self):
+        super().__init__("Dispatcher is not running. check if it is started in lifespan")
+
+
+class EventQueueFullException(Exception):
+    def __init__(self):
+        super().__init__("Event queue is full")
+
+
+class InvalidExecutorException(Exception):
+    def __init__(self):
+        super().__init__("EXECUTOR must be one of `thread`, `process`")
+
+
+class InvalidBatchSettingException(Exception):
+    def __init__(self):
+        super().__init__("BATCH_MAX_SIZE and BATCH_MAX_WAIT_MS must be positive numbers")
+
+
+class InvalidDedupPolicyException(Exception):
+    def __init__(self):
+        super().__init__("DEDUP must be one of `keep_all`, `keep_first`, `keep_last`")
+
+
+class UnknownEventException(Exception):
+    def __init__(self, name):
+        super().__init__(f"`{name}` event is not registered")
+
+
+class InvalidSerializedParameterException(Exception):
+    def __init__(self, type_name):
+        super().__init__(f"`{type_name}` can not be deserialized as parameter")
+
+
+class InvalidRetryPolicyException(Exception):
+    def __init__(self):
+        super().__init__("RETRY must be a `RetryPolicy` with positive max_attempts")
+
+
+class InvalidCircuitBreakerException(Exception):
+    def __init__(self):
+        super().__init__(
+            "CIRCUIT_BREAKER must be a `CircuitBreakerPolicy` "
+            "with positive failure_threshold and recovery_timeout"
+        )
+
+
+class CircuitOpenException(Exception):
+    def __init__(self, name):
+        super().__init__(f"Circuit of `{name}` event is open")
+
+
+class CircularDependencyException(Exception):
+    def __init__(self, name):
+        super().__init__(f"`{name}` event depends on itself through DEPENDS_ON")
+
+
+class UnsupportedDependencyException(Exception):
+    def __init__(self):
+        super().__init__("DEPENDS_ON can not be honoured for events sent to a dispatcher")
+
+
+class InvalidTopicException(Exception):
+    def __init__(self, pattern):
+        super().__init__(
+            f"`{pattern}` is not a valid topic. Segments are separated by `.` "
+            "and `*` or `#` must be a whole segment"
+        )
+
+
+class SchedulerNotRunningException(Exception):
+    def __init__(self):
+        super().__init__("Scheduler is not running. check if it is started in lifespan")
+
+
+class InvalidScheduleException(Exception):
+    def __init__(self):
+        super().__init__("Pass either `delay` as a non-negative number or `at` as datetime")
+
+
+class InvalidLimitException(Exception):
+    def __init__(self):
+        super().__init__(
+            "LIMIT must be a `RateLimit`, `Throttle` or `Debounce` with positive settings"
+        )
+
+
+class InvalidFlushPolicyException(Exception):
+    def __init__(self):
+        super().__init__("flush_every and flush_interval_ms must be positive numbers")
+
+
+class InvalidErrorPolicyException(Exception):
+    def __init__(self):
+        super().__init__("on_error must be one of `raise`, `cancel`, `collect`, `isolate`")
+
+
+class InvalidParameterFactoryException(Exception):
+    def __init__(self):
+        super().__init__("Pass either `parameter` or a callable `parameter_factory`")
+
+
+class InvalidLaneException(Exception):
+    def __init__(self):
+        super().__init__("LANE must be type of `str`")
+
+
+class InvalidLaneSettingException(Exception):
+    def __init__(self):
+        super().__init__(
+            "Lanes must have unique names, positive weight, queue_size and concurrency"
+        )
+
+
+class UnknownLaneException(Exception):
+    def __init__(self, name: str):
+        super().__init__(f"Lane `{name}` is not configured in the dispatcher")
+
+
+try:
+    class EventExceptionGroup(ExceptionGroup):  # noqa: F821
+        pass
+except NameError:
+    # Python < 3.11
+    class EventExceptionGroup(Exception):
+        def __init__(self, message, exceptions):
+            super().__init__(message, list(exceptions))
+            self.message = message
+            self.exceptions = tuple(exceptions)
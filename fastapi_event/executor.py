@@ -0,0 +1,87 @@
+import asyncio
+import inspect
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Optional, Type, Union
+
+from pydantic import BaseModel
+
+from fastapi_event.base import BaseEvent
+
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+
+
+class EventExecutor:
+    def __init__(
+        self,
+        thread_workers: Optional[int] = None,
+        process_workers: Optional[int] = None,
+    ):
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers
+        self._pools: Dict[str, Executor] = {}
+
+    def configure(
+        self,
+        thread_workers: Optional[int] = None,
+        process_workers: Optional[int] = None,
+    ) -> None:
+        """
+        Set pool sizes. Pools that are already running are shut down
+        and re-created with the new size on next use.
+        """
+        self.shutdown(wait=False)
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers
+
+    async def run(
+        self,
+        executor: str,
+        event: Union[Type[BaseEvent], BaseEvent],
+        parameter: Optional[BaseModel] = None,
+    ) -> Any:
+        """
+        Run `event` in the pool. An instance is used as is,
+        a class is instantiated in the worker.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_pool(executor=executor), _execute, event, parameter,
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.shutdown(wait=wait)
+
+    def _get_pool(self, executor: str) -> Executor:
+        pool = self._pools.get(executor)
+        if pool is not None:
+            return pool
+
+        if executor == EXECUTOR_PROCESS:
+            pool = ProcessPoolExecutor(max_workers=self.process_workers)
+        else:
+            pool = ThreadPoolExecutor(
+                max_workers=self.thread_workers,
+                thread_name_prefix="fastapi-event",
+            )
+
+        self._pools[executor] = pool
+        return pool
+
+
+def _execute(
+    event: Union[Type[BaseEvent], BaseEvent], parameter: Optional[BaseModel] = None,
+) -> Any:
+    if isinstance(event, type):
+        event = event()
+
+    result = event.run(parameter=parameter)
+    if inspect.iscoroutine(result):
+        return asyncio.run(result)
+
+    return result
+
+
+event_executor = EventExecutor()
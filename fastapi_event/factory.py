@@ -0,0 +1,36 @@
+import inspect
+from typing import Any, Callable, Optional
+
+
+class ParameterFactory:
+    """
+    Stands in for the parameter of a stored event until it is about to run,
+    so the parameter is never built for events that are skipped.
+    """
+
+    __slots__ = ("factory", "validate")
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        validate: Optional[Callable[..., None]] = None,
+    ):
+        self.factory = factory
+        self.validate = validate
+
+    async def build(self) -> Any:
+        parameter = self.factory()
+        if inspect.isawaitable(parameter):
+            parameter = await parameter
+
+        if self.validate is not None:
+            self.validate(parameter=parameter)
+
+        return parameter
+
+
+async def resolve_parameter(parameter: Any) -> Any:
+    if isinstance(parameter, ParameterFactory):
+        return await parameter.build()
+
+    return parameter
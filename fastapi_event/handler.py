@@ -1,151 +1,944 @@
 import asyncio
-import inspect
+import functools
+import logging
+import time
+from bisect import insort
 from contextvars import ContextVar
-from pydantic import BaseModel
-from typing import Type, Dict, Union, Optional, List
+from datetime import datetime
+from typing import (
+    Type,
+    Dict,
+    Optional,
+    List,
+    Iterable,
+    Iterator,
+    Tuple,
+    Any,
+    Callable,
+    Coroutine,
+    Set,
+)
 
-from fastapi_event.base import BaseEvent
+from fastapi_event.base import (
+    BaseEvent,
+    is_parameter_type,
+    DEDUP_KEEP_ALL,
+    DEDUP_KEEP_FIRST,
+    DEDUP_KEEP_LAST,
+)
 from fastapi_event.exceptions import (
-    InvalidEventTypeException,
     InvalidParameterTypeException,
     EmptyContextException,
     RequiredParameterException,
-    ParameterCountException,
-    InvalidOrderTypeException,
+    InvalidErrorPolicyException,
+    InvalidParameterFactoryException,
+    UnsupportedDependencyException,
+    SchedulerNotRunningException,
+    EventExceptionGroup,
+)
+from fastapi_event.eager import create_eager_task
+from fastapi_event.factory import ParameterFactory, resolve_parameter
+from fastapi_event.limiter import Debounce
+from fastapi_event.metrics import get_metrics_sink
+from fastapi_event.registry import (
+    EventDescriptor,
+    EventPlan,
+    EventRegistry,
+    event_registry,
 )
+from fastapi_event.resilience import CircuitBreaker
+from fastapi_event.runner import EventOutcome, EventRunner
+from fastapi_event.scheduler import EventScheduler, ScheduledEvent, event_scheduler
+from fastapi_event.topic import TopicRegistry, topic_registry
+from fastapi_event.transport import BaseTransport
 
-_handler_context: ContextVar[Optional, "EventHandler"] = ContextVar(
+logger = logging.getLogger(__name__)
+
+ON_ERROR_RAISE = "raise"
+ON_ERROR_CANCEL = "cancel"
+ON_ERROR_COLLECT = "collect"
+ON_ERROR_ISOLATE = "isolate"
+ON_ERROR_POLICIES = (ON_ERROR_RAISE, ON_ERROR_CANCEL, ON_ERROR_COLLECT, ON_ERROR_ISOLATE)
+
+_handler_context: ContextVar[Optional["EventHandlerDelegator"]] = ContextVar(
     "_handler_context",
     default=None,
 )
 
 
-class EventAndParameter(BaseModel):
-    event: Type[BaseEvent]
-    parameter: Optional[BaseModel] = None
+class EventRecord:
+    __slots__ = ("event", "parameter", "parameters", "result", "exception", "done")
+
+    def __init__(
+        self,
+        event: Type[BaseEvent],
+        parameter: Any = None,
+        parameters: Optional[List[Any]] = None,
+    ):
+        self.event = event
+        self.parameter = parameter
+        self.parameters = parameters
+        self.result: Any = None
+        self.exception: Optional[BaseException] = None
+        self.done = False
+
+    def __iter__(self) -> Iterator[Tuple[Type[BaseEvent], Any]]:
+        if self.parameters is None:
+            yield self.event, self.parameter
+        else:
+            for parameter in self.parameters:
+                yield self.event, parameter
+
+
+_Checkpoint = Tuple[int, int, List[Tuple[EventRecord, Any, Optional[List[Any]], int]]]
+
+
+class EventResult:
+    """
+    Outcome of a published event. `done` is False if it failed,
+    was skipped, is being retried or was sent to a dispatcher.
+    """
+
+    __slots__ = ("event", "parameter", "result", "exception", "done")
+
+    def __init__(
+        self,
+        event: Type[BaseEvent],
+        parameter: Any,
+        result: Any,
+        exception: Optional[BaseException],
+        done: bool,
+    ):
+        self.event = event
+        self.parameter = parameter
+        self.result = result
+        self.exception = exception
+        self.done = done
 
 
 class EventHandlerValidator:
-    EVENT_PARAMETER_COUNT = 2
+    def __init__(self, registry: EventRegistry = event_registry):
+        self.registry = registry
 
-    async def validate(
-        self, event: Type[BaseEvent], parameter: BaseModel = None,
-    ) -> None:
-        if not issubclass(event, BaseEvent):
-            raise InvalidEventTypeException
+    async def validate(self, event: Type[BaseEvent], parameter: Any = None) -> None:
+        descriptor = self.registry.get(event=event)
+        self.validate_parameter(descriptor=descriptor, parameter=parameter)
 
-        if parameter and not isinstance(parameter, BaseModel):
+    def validate_parameter(
+        self, descriptor: EventDescriptor, parameter: Any = None,
+    ) -> None:
+        if parameter is None:
+            if descriptor.parameter_required:
+                raise RequiredParameterException(cls_name=descriptor.event.__name__)
+        elif descriptor.parameter_type is not None:
+            # The annotation of `run()` is the contract
+            if not isinstance(parameter, descriptor.parameter_type):
+                raise InvalidParameterTypeException
+        elif not is_parameter_type(type(parameter)):
             raise InvalidParameterTypeException
 
-        signature = inspect.signature(event.run)
-        func_parameters = signature.parameters
-        if len(func_parameters) != self.EVENT_PARAMETER_COUNT:
-            raise ParameterCountException
 
-        base_parameter = func_parameters.get("parameter")
-        if base_parameter.default is not None and not parameter:
-            raise RequiredParameterException(
-                cls_name=base_parameter.__class__.__name__,
+class EventHandler:
+    def __init__(
+        self,
+        validator: EventHandlerValidator,
+        runner: Optional[EventRunner] = None,
+        topics: TopicRegistry = topic_registry,
+        scheduler: EventScheduler = event_scheduler,
+    ):
+        self.events: List[EventRecord] = []
+        self.deferred: List[Tuple["EventHandler", Dict[str, Any]]] = []
+        self.validator = validator
+        self.runner = runner or EventRunner(registry=validator.registry)
+        self.topics = topics
+        self.scheduler = scheduler
+        self._scheduled: List[ScheduledEvent] = []
+        # Whether a stored event has `LIMIT`, so publishing can skip the check
+        self._limited = False
+        self._on_error = ON_ERROR_RAISE
+        self._errors: List[Exception] = []
+        self._eager = False
+        self._records: Dict[Type[BaseEvent], EventRecord] = {}
+        # Records bucketed by `ORDER` as they are stored, with the
+        # non-None orders kept sorted so publishing never sorts.
+        self._buckets: Dict[Optional[int], List[EventRecord]] = {}
+        self._orders: List[int] = []
+
+    async def store(
+        self,
+        event: Type[BaseEvent],
+        parameter: Any = None,
+        trusted: bool = False,
+        delay: Optional[float] = None,
+        at: Optional[datetime] = None,
+        parameter_factory: Optional[Callable[[], Any]] = None,
+    ) -> Optional[ScheduledEvent]:
+        """
+        With `trusted=True` the parameter is stored without validation.
+        With `delay` seconds or `at`, the event is handed to the scheduler
+        on publish instead of running, and its handle is returned.
+        `parameter_factory` is called, or awaited, for the parameter
+        only when the event is about to run.
+        """
+        descriptor = self.validator.registry.get(event=event)
+        if parameter_factory is not None:
+            if parameter is not None or not callable(parameter_factory):
+                raise InvalidParameterFactoryException
+
+            validate = None
+            if not trusted:
+                validate = functools.partial(
+                    self.validator.validate_parameter, descriptor=descriptor,
+                )
+            parameter = ParameterFactory(factory=parameter_factory, validate=validate)
+        elif not trusted:
+            self.validator.validate_parameter(descriptor=descriptor, parameter=parameter)
+
+        handle = None
+        if delay is None and at is None:
+            self._check_scheduler(descriptor=descriptor)
+            self._append(descriptor=descriptor, parameter=parameter)
+        else:
+            handle = self.scheduler.create(
+                event=event, parameter=parameter, delay=delay, at=at,
             )
+            self._scheduled.append(handle)
 
+        sink = get_metrics_sink()
+        if sink is not None:
+            sink.record_store(event=descriptor.name)
 
-class EventHandler:
-    def __init__(self, validator: EventHandlerValidator):
-        self.events: Dict[Type[BaseEvent], Union[BaseModel, None]] = {}
-        self.validator = validator
+        return handle
+
+    async def store_many(
+        self,
+        event: Type[BaseEvent],
+        parameters: Iterable[Any],
+        trusted: bool = False,
+    ) -> None:
+        descriptor = self.validator.registry.get(event=event)
+        parameters = list(parameters)
+        if not trusted:
+            for parameter in parameters:
+                self.validator.validate_parameter(
+                    descriptor=descriptor, parameter=parameter,
+                )
+
+        self._check_scheduler(descriptor=descriptor)
+        for parameter in parameters:
+            self._append(descriptor=descriptor, parameter=parameter)
+
+        sink = get_metrics_sink()
+        if sink is not None:
+            sink.record_store(event=descriptor.name, count=len(parameters))
+
+    async def emit(self, topic: str, payload: Any = None, trusted: bool = False) -> None:
+        """
+        Store `payload` for every event subscribed to `topic`.
+        """
+        registry = self.validator.registry
+        descriptors = [registry.get(event=event) for event in self.topics.get(topic)]
+        if not trusted:
+            for descriptor in descriptors:
+                self.validator.validate_parameter(
+                    descriptor=descriptor, parameter=payload,
+                )
+
+        for descriptor in descriptors:
+            self._check_scheduler(descriptor=descriptor)
+        for descriptor in descriptors:
+            self._append(descriptor=descriptor, parameter=payload)
+
+        sink = get_metrics_sink()
+        if sink is not None:
+            for descriptor in descriptors:
+                sink.record_store(event=descriptor.name)
+
+    def _append(
+        self, descriptor: EventDescriptor, parameter: Any = None,
+    ) -> None:
+        event = descriptor.event
+        record = self._records.get(event)
+        if record is not None:
+            if descriptor.dedup == DEDUP_KEEP_FIRST:
+                return
+            elif descriptor.dedup == DEDUP_KEEP_LAST:
+                if record.parameters is None:
+                    record.parameter = parameter
+                else:
+                    record.parameters = [parameter]
+                return
+            elif record.parameters is not None:
+                record.parameters.append(parameter)
+                return
+
+        if descriptor.batchable:
+            record = EventRecord(event=event, parameters=[parameter])
+        else:
+            record = EventRecord(event=event, parameter=parameter)
+
+        self._add(descriptor=descriptor, record=record)
+
+    def _add(self, descriptor: EventDescriptor, record: EventRecord) -> None:
+        self.events.append(record)
+        if descriptor.limiter is not None:
+            self._limited = True
+        if descriptor.batchable or descriptor.dedup != DEDUP_KEEP_ALL:
+            self._records[descriptor.event] = record
+
+        bucket = self._buckets.get(descriptor.order)
+        if bucket is None:
+            bucket = self._buckets[descriptor.order] = []
+            if descriptor.order is not None:
+                insort(self._orders, descriptor.order)
+        bucket.append(record)
+
+    def _get_buckets(self) -> List[List[EventRecord]]:
+        buckets = [self._buckets[order] for order in self._orders]
+        if None in self._buckets:
+            buckets.append(self._buckets[None])
+
+        return buckets
+
+    async def _apply_limits(self) -> None:
+        registry = self.validator.registry
+        # Fail before anything is cleared, so no stored event is lost
+        for record in self.events:
+            self._check_scheduler(descriptor=registry.get(event=record.event))
+
+        records, scheduled = self.events, self._scheduled
+        self._clear()
+        self._scheduled = scheduled
+
+        for record in records:
+            descriptor = registry.get(event=record.event)
+            limiter = descriptor.limiter
+            for _, parameter in record:
+                if limiter is not None:
+                    if limiter.limit.key is not None:
+                        # The key is taken from the parameter, so it is built here
+                        parameter = await resolve_parameter(parameter)
+                    if not self._acquire(descriptor=descriptor, parameter=parameter):
+                        continue
+
+                self._append(descriptor=descriptor, parameter=parameter)
+
+        self._limited = False
+
+    def _check_scheduler(self, descriptor: EventDescriptor) -> None:
+        """
+        `Debounce` runs events through the scheduler.
+        """
+        if (
+            descriptor.limiter is not None
+            and isinstance(descriptor.limiter.limit, Debounce)
+            and not self.scheduler.is_running
+        ):
+            raise SchedulerNotRunningException
+
+    def _acquire(self, descriptor: EventDescriptor, parameter: Any = None) -> bool:
+        limiter = descriptor.limiter
+        if not isinstance(limiter.limit, Debounce):
+            return limiter.acquire(parameter=parameter)
+
+        handle = self.scheduler.create(
+            event=descriptor.event, parameter=parameter, delay=limiter.limit.window,
+        )
+        previous = limiter.replace(parameter=parameter, value=handle)
+        if previous is not None:
+            previous.cancel()
 
-    async def store(self, event: Type[BaseEvent], parameter: BaseModel = None) -> None:
-        await self.validator.validate(event=event, parameter=parameter)
-        self.events[event] = parameter
+        self._scheduled.append(handle)
+        return False
 
-    async def _publish(self, run_at_once: bool = True) -> None:
-        if run_at_once is True:
-            await self._run_at_once()
+    def _checkpoint(self) -> "_Checkpoint":
+        """
+        Mark the events stored so far, so the ones stored
+        after it can be dropped with `_rollback()`.
+        """
+        records = [
+            (
+                record,
+                record.parameter,
+                record.parameters,
+                len(record.parameters) if record.parameters is not None else 0,
+            )
+            for record in self._records.values()
+        ]
+        return len(self.events), len(self._scheduled), records
+
+    def _rollback(self, checkpoint: "_Checkpoint") -> None:
+        count, scheduled, records = checkpoint
+        for handle in self._scheduled[scheduled:]:
+            handle.cancel()
+        del self._scheduled[scheduled:]
+
+        # Undo `DEDUP` replacements and batch parameters added to earlier records
+        for record, parameter, parameters, length in records:
+            record.parameter = parameter
+            if parameters is not None:
+                del parameters[length:]
+            record.parameters = parameters
+
+        events, scheduled_handles = self.events[:count], self._scheduled
+        self._clear()
+        self._scheduled = scheduled_handles
+        registry = self.validator.registry
+        for record in events:
+            self._add(descriptor=registry.get(event=record.event), record=record)
+
+    def _clear(self) -> None:
+        self.events = []
+        self._scheduled = []
+        self._limited = False
+        self._records = {}
+        self._buckets = {}
+        self._orders = []
+
+    async def publish(
+        self,
+        run_at_once: bool = True,
+        waves: bool = False,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        dispatcher: Optional[BaseTransport] = None,
+        on_error: str = ON_ERROR_RAISE,
+        eager: bool = False,
+    ) -> List["EventResult"]:
+        """
+        Publish the events stored so far and return the result
+        of each of them, in the order they were stored.
+        """
+        records = await self._publish(
+            run_at_once=run_at_once,
+            waves=waves,
+            concurrency=concurrency,
+            timeout=timeout,
+            dispatcher=dispatcher,
+            on_error=on_error,
+            eager=eager,
+        )
+        return [
+            EventResult(
+                event=record.event,
+                parameter=record.parameter if record.parameters is None else record.parameters,
+                result=record.result,
+                exception=record.exception,
+                done=record.done,
+            )
+            for record in records
+        ]
+
+    async def _publish(
+        self,
+        run_at_once: bool = True,
+        waves: bool = False,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        dispatcher: Optional[BaseTransport] = None,
+        on_error: str = ON_ERROR_RAISE,
+        eager: bool = False,
+    ) -> List[EventRecord]:
+        started = time.perf_counter()
+        try:
+            return await self._publish_events(
+                run_at_once=run_at_once,
+                waves=waves,
+                concurrency=concurrency,
+                timeout=timeout,
+                dispatcher=dispatcher,
+                on_error=on_error,
+                eager=eager,
+            )
+        finally:
+            sink = get_metrics_sink()
+            if sink is not None:
+                sink.record_publish(duration=time.perf_counter() - started)
+
+    async def _publish_events(
+        self,
+        run_at_once: bool = True,
+        waves: bool = False,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        dispatcher: Optional[BaseTransport] = None,
+        on_error: str = ON_ERROR_RAISE,
+        eager: bool = False,
+    ) -> List[EventRecord]:
+        if on_error not in ON_ERROR_POLICIES:
+            raise InvalidErrorPolicyException
+
+        # Workers of a dispatcher run events independently of each other
+        if dispatcher is not None and self._get_plan() is not None:
+            raise UnsupportedDependencyException
+
+        if self._limited:
+            await self._apply_limits()
+
+        if self._scheduled:
+            self.scheduler.schedule(handles=self._scheduled)
+            self._scheduled = []
+
+        records = self.events
+        if dispatcher is not None:
+            await dispatcher.dispatch(
+                events=[
+                    (event, await resolve_parameter(parameter))
+                    for record in records
+                    for event, parameter in record
+                ],
+            )
+            self._clear()
+            return records
+
+        self._on_error = on_error
+        self._errors = []
+        self._eager = eager
+        if run_at_once is True and waves is True:
+            coro = self._run_in_waves(concurrency=concurrency)
+        elif run_at_once is True:
+            coro = self._run_at_once(concurrency=concurrency)
         else:
-            await self._run_sequentially()
+            coro = self._run_sequentially()
 
-        self.events.clear()
+        if timeout is None:
+            await coro
+        else:
+            await asyncio.wait_for(coro, timeout=timeout)
 
-    async def _run_at_once(self) -> None:
-        futures = []
-        event: Type[BaseEvent]
-        for event, parameter in self.events.items():
-            task = asyncio.create_task(event().run(parameter=parameter))
-            futures.append(task)
+        self._clear()
+        errors, self._errors = self._errors, []
+        if errors and on_error == ON_ERROR_COLLECT:
+            raise EventExceptionGroup(f"{len(errors)} events failed", errors)
 
-        await asyncio.gather(*futures)
+        return records
 
-    async def _run_sequentially(self) -> None:
-        event_maps = await self._get_sorted_event_maps()
-        keys = await self._get_sorted_keys(maps=event_maps)
-
-        for key in keys:
-            info = event_maps.get(key)
-            for each in info:
-                await each.event().run(parameter=each.parameter)
-
-    async def _get_sorted_keys(
-        self, maps: Dict[Optional[int], List[EventAndParameter]]
-    ) -> List[Optional[int]]:
-        keys: List[Optional[int]] = sorted(
-            [key for key in maps.keys() if key is not None]
+    def _defer(self, **kwargs) -> None:
+        handler = EventHandler(
+            validator=self.validator,
+            runner=self.runner,
+            topics=self.topics,
+            scheduler=self.scheduler,
         )
-        if maps.get(None):
-            keys.append(None)
+        handler.events, handler._records = self.events, self._records
+        handler._scheduled, handler._limited = self._scheduled, self._limited
+        handler._buckets, handler._orders = self._buckets, self._orders
+        self._clear()
+        self.deferred.append((handler, kwargs))
 
-        return keys
+    async def _publish_deferred(self) -> None:
+        """
+        The response has been sent, so errors are logged
+        and do not keep the other deferred events from running.
+        """
+        while self.deferred:
+            handler, kwargs = self.deferred.pop(0)
+            try:
+                await handler._publish(**kwargs)
+            except Exception:
+                logger.exception("Deferred events failed")
+
+    def _get_plan(self) -> Optional[EventPlan]:
+        if not self.events:
+            return None
+
+        return self.validator.registry.get_plan(
+            events=frozenset(record.event for record in self.events),
+        )
 
-    async def _get_sorted_event_maps(
+    async def _run_at_once(self, concurrency: Optional[int] = None) -> None:
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+        plan = self._get_plan()
+        if plan is None:
+            await self._gather(records=self.events, semaphore=semaphore)
+        else:
+            await self._run_plan(waves=[plan], semaphore=semaphore)
+
+    async def _run_plan(
         self,
-    ) -> Dict[Optional[int], List[EventAndParameter]]:
+        waves: List[EventPlan],
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> None:
         """
-        event_maps = {
-            1: [EventAndParameter],
-            2: [EventAndParameter],
-            None: [EventAndParameter],
-        }
+        Run the waves of a plan one after another. Within a wave, each
+        event starts as soon as its dependencies have finished.
         """
-        event_maps: Dict[Optional[int], List[EventAndParameter]] = {None: []}
+        records: Dict[Type[BaseEvent], List[EventRecord]] = {}
+        for record in self.events:
+            records.setdefault(record.event, []).append(record)
+
+        # The plan is in topological order, so tasks of dependencies exist
+        tasks: Dict[Type[BaseEvent], asyncio.Task] = {}
+        for wave in waves:
+            wave_tasks = []
+            for event, dependencies in wave:
+                tasks[event] = self._create_task(
+                    self._run_after(
+                        dependencies=[tasks[dependency] for dependency in dependencies],
+                        records=records[event],
+                        semaphore=semaphore,
+                    ),
+                )
+                wave_tasks.append(tasks[event])
+
+            await self._wait(tasks=wave_tasks)
+
+    async def _run_after(
+        self,
+        dependencies: List[asyncio.Task],
+        records: List[EventRecord],
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> bool:
+        if dependencies:
+            await asyncio.wait(dependencies)
+            # A failed dependency is reported by its own task, dependents are skipped
+            if any(
+                task.cancelled() or task.exception() or task.result() is False
+                for task in dependencies
+            ):
+                return False
+
+        return await self._gather(records=records, semaphore=semaphore)
+
+    async def _run_in_waves(self, concurrency: Optional[int] = None) -> None:
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+        plan = self._get_plan()
+        if plan is not None:
+            await self._run_plan(waves=self._split_plan(plan=plan), semaphore=semaphore)
+            return
+
+        for bucket in self._get_buckets():
+            await self._gather(records=bucket, semaphore=semaphore)
+
+    def _split_plan(self, plan: EventPlan) -> List[EventPlan]:
+        """
+        Split `plan` into waves by `ORDER`. An event whose dependency is in
+        a later wave moves to that wave and runs after the dependency there.
+        """
+        registry = self.validator.registry
+        keys: Dict[Type[BaseEvent], Tuple[bool, int]] = {}
+        for event, dependencies in plan:
+            order = registry.get(event=event).order
+            keys[event] = max(
+                [(order is None, order or 0)]
+                + [keys[dependency] for dependency in dependencies],
+            )
+
+        waves: Dict[Tuple[bool, int], list] = {}
+        for event, dependencies in plan:
+            waves.setdefault(keys[event], []).append((event, dependencies))
 
-        for event, parameter in self.events.items():
-            if event.ORDER and not isinstance(event.ORDER, int):
-                raise InvalidOrderTypeException
+        return [tuple(waves[key]) for key in sorted(waves)]
 
-            info = EventAndParameter(event=event, parameter=parameter)
-            if not event.ORDER:
-                event_maps.get(None).append(info)
-            elif event.ORDER not in event_maps:
-                event_maps[event.ORDER] = [info]
+    async def _gather(
+        self,
+        records: List[EventRecord],
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> bool:
+        tasks = []
+        for record in records:
+            tasks.append(self._create_task(self._run(record=record, semaphore=semaphore)))
+
+        succeeded = await self._wait(tasks=tasks)
+        # Dependents do not run after a dependency that was retried or skipped
+        return succeeded and all(record.done for record in records)
+
+    async def _wait(self, tasks: List[asyncio.Task]) -> bool:
+        """
+        Wait for `tasks` as `on_error` says. Return whether all of them
+        succeeded, or raise the error for `raise` and `cancel`.
+        """
+        on_error = self._on_error
+        if all(task.done() for task in tasks):
+            # Everything finished eagerly (Python 3.12+), so there is nothing to wait for
+            return self._check(tasks=tasks)
+
+        if on_error == ON_ERROR_RAISE:
+            await asyncio.gather(*tasks)
+            return True
+
+        if on_error == ON_ERROR_CANCEL:
+            try:
+                _, pending = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_EXCEPTION,
+                )
+            except asyncio.CancelledError:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+            if pending:
+                for task in pending:
+                    task.cancel()
+                await asyncio.wait(pending)
+
+            for task in tasks:
+                if not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+
+            return True
+
+        succeeded = True
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, BaseException):
+                succeeded = False
+                if isinstance(result, Exception):
+                    self._errors.append(result)
+
+        return succeeded
+
+    def _check(self, tasks: List["asyncio.Future[Any]"]) -> bool:
+        succeeded = True
+        for task in tasks:
+            if task.cancelled():
+                if self._on_error in (ON_ERROR_RAISE, ON_ERROR_CANCEL):
+                    raise asyncio.CancelledError
+                succeeded = False
+                continue
+
+            exception = task.exception()
+            if exception is not None:
+                if self._on_error in (ON_ERROR_RAISE, ON_ERROR_CANCEL):
+                    raise exception
+                succeeded = False
+                self._errors.append(exception)
+
+        return succeeded
+
+    def _create_task(self, coro: Coroutine) -> "asyncio.Future[Any]":
+        if self._eager:
+            return create_eager_task(coro)
+
+        return asyncio.create_task(coro)
+
+    async def _run(
+        self, record: EventRecord, semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Any:
+        try:
+            if record.parameters is None:
+                if isinstance(record.parameter, ParameterFactory):
+                    record.parameter = await record.parameter.build()
+                result = await self.runner.run(
+                    event=record.event, parameter=record.parameter, semaphore=semaphore,
+                )
             else:
-                event_maps.get(event.ORDER).append(info)
+                record.parameters = [
+                    await resolve_parameter(parameter) for parameter in record.parameters
+                ]
+                result = await self.runner.run_batch(
+                    event=record.event, parameters=record.parameters, semaphore=semaphore,
+                )
+        except BaseException as e:
+            record.exception = e
+            if self._on_error == ON_ERROR_ISOLATE and isinstance(e, Exception):
+                logger.error("%s failed", record.event.__name__, exc_info=e)
+            raise
+
+        if isinstance(result, EventOutcome):
+            # Retried in the background or skipped by an open circuit
+            return None
+
+        record.result = result
+        record.done = True
+        return result
 
-        return event_maps
+    async def _run_sequentially(self) -> None:
+        records = [record for bucket in self._get_buckets() for record in bucket]
+        plan = self._get_plan()
+        dependencies: Dict[Type[BaseEvent], Tuple[Type[BaseEvent], ...]] = {}
+        if plan is not None:
+            dependencies = dict(plan)
+            records = _sort_by_plan(records=records, dependencies=dependencies)
+
+        # Events that failed or were skipped, so their dependents are skipped
+        skipped: Set[Type[BaseEvent]] = set()
+        for record in records:
+            if any(
+                dependency in skipped
+                for dependency in dependencies.get(record.event, ())
+            ):
+                skipped.add(record.event)
+                continue
+
+            try:
+                await self._run(record=record)
+            except Exception as e:
+                if self._on_error in (ON_ERROR_RAISE, ON_ERROR_CANCEL):
+                    raise
+
+                self._errors.append(e)
+
+            if not record.done:
+                skipped.add(record.event)
+
+
+def _sort_by_plan(
+    records: List[EventRecord],
+    dependencies: Dict[Type[BaseEvent], Tuple[Type[BaseEvent], ...]],
+) -> List[EventRecord]:
+    """
+    Stable topological sort: records keep their order unless
+    a record of one of their dependencies is still to come.
+    """
+    left: Dict[Type[BaseEvent], int] = {}
+    for record in records:
+        left[record.event] = left.get(record.event, 0) + 1
+
+    pending = list(records)
+    ordered = []
+    while pending:
+        for index, record in enumerate(pending):
+            if not any(
+                left.get(dependency) for dependency in dependencies.get(record.event, ())
+            ):
+                break
+
+        ordered.append(pending.pop(index))
+        left[record.event] -= 1
+
+    return ordered
 
 
 class EventHandlerMeta(type):
-    async def store(self, event: Type[BaseEvent], parameter: BaseModel = None) -> None:
+    async def store(
+        self,
+        event: Type[BaseEvent],
+        parameter: Any = None,
+        trusted: bool = False,
+        delay: Optional[float] = None,
+        at: Optional[datetime] = None,
+        parameter_factory: Optional[Callable[[], Any]] = None,
+    ) -> Optional[ScheduledEvent]:
         handler = self._get_event_handler()
-        await handler.store(event=event, parameter=parameter)
+        return await handler.store(
+            event=event,
+            parameter=parameter,
+            trusted=trusted,
+            delay=delay,
+            at=at,
+            parameter_factory=parameter_factory,
+        )
+
+    async def store_many(
+        self,
+        event: Type[BaseEvent],
+        parameters: Iterable[Any],
+        trusted: bool = False,
+    ) -> None:
+        handler = self._get_event_handler()
+        await handler.store_many(event=event, parameters=parameters, trusted=trusted)
 
-    async def _publish(self, run_at_once: bool = True) -> None:
+    async def emit(self, topic: str, payload: Any = None, trusted: bool = False) -> None:
         handler = self._get_event_handler()
-        await handler._publish(run_at_once=run_at_once)
+        await handler.emit(topic=topic, payload=payload, trusted=trusted)
 
-    def _get_event_handler(self) -> EventHandler:
-        try:
-            return _handler_context.get()
-        except LookupError:
+    async def publish(
+        self,
+        run_at_once: bool = True,
+        waves: bool = False,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        dispatcher: Optional[BaseTransport] = None,
+        on_error: str = ON_ERROR_RAISE,
+        eager: bool = False,
+    ) -> List[EventResult]:
+        handler = self._get_event_handler(create=False)
+        if handler is None:
+            return []
+
+        return await handler.publish(
+            run_at_once=run_at_once,
+            waves=waves,
+            concurrency=concurrency,
+            timeout=timeout,
+            dispatcher=dispatcher,
+            on_error=on_error,
+            eager=eager,
+        )
+
+    async def _publish(
+        self,
+        run_at_once: bool = True,
+        waves: bool = False,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        dispatcher: Optional[BaseTransport] = None,
+        on_error: str = ON_ERROR_RAISE,
+        eager: bool = False,
+    ) -> None:
+        handler = self._get_event_handler(create=False)
+        if handler is None:
+            return
+
+        await handler._publish(
+            run_at_once=run_at_once,
+            waves=waves,
+            concurrency=concurrency,
+            timeout=timeout,
+            dispatcher=dispatcher,
+            on_error=on_error,
+            eager=eager,
+        )
+
+    def _defer(self, **kwargs) -> None:
+        handler = self._get_event_handler(create=False)
+        if handler is not None:
+            handler._defer(**kwargs)
+
+    async def _publish_deferred(self) -> None:
+        handler = self._get_event_handler(create=False)
+        if handler is not None:
+            await handler._publish_deferred()
+
+    def warm(
+        self, events: Optional[Iterable[Type[BaseEvent]]] = None,
+    ) -> List[EventDescriptor]:
+        return self.validator.registry.warm(events=events)
+
+    async def startup(
+        self, events: Optional[Iterable[Type[BaseEvent]]] = None,
+    ) -> None:
+        self.topics.freeze()
+        await self.validator.registry.startup(events=events)
+        await self.scheduler.start()
+
+    async def shutdown(self, timeout: Optional[float] = None) -> None:
+        await self.scheduler.stop(timeout=timeout)
+        await self.runner.wait_retries(timeout=timeout)
+        await self.validator.registry.shutdown()
+
+    def circuit_breakers(self) -> Dict[str, CircuitBreaker]:
+        return self.validator.registry.get_circuit_breakers()
+
+    def _get_event_handler(self, create: bool = True) -> Optional[EventHandler]:
+        delegator = _handler_context.get()
+        if delegator is None:
             raise EmptyContextException
 
+        if delegator.handler is None and create:
+            delegator.handler = EventHandler(
+                validator=self.validator,
+                runner=self.runner,
+                topics=self.topics,
+                scheduler=self.scheduler,
+            )
+
+        return delegator.handler
+
 
 class EventHandlerDelegator(metaclass=EventHandlerMeta):
     validator = EventHandlerValidator()
+    runner = EventRunner(registry=validator.registry)
+    topics = topic_registry
+    scheduler = event_scheduler
 
     def __init__(self):
         self.token = None
+        # Created on the first `store()` so scopes without events stay cheap
+        self.handler: Optional[EventHandler] = None
 
     def __enter__(self):
-        self.token = _handler_context.set(EventHandler(validator=self.validator))
+        self.token = _handler_context.set(self)
         return type(self)
 
     def __exit__(self, exc_type, exc_value, traceback):
@@ -0,0 +1,231 @@
+import asyncio
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from fastapi_event.base import BaseEvent
+from fastapi_event.dispatcher import (
+    EventDispatcher,
+    OVERFLOW_BLOCK,
+    OVERFLOW_DROP_OLDEST,
+    OVERFLOW_REJECT,
+)
+from fastapi_event.exceptions import (
+    EventQueueFullException,
+    InvalidLaneSettingException,
+    UnknownLaneException,
+)
+from fastapi_event.metrics import get_metrics_sink
+from fastapi_event.runner import EventRunner
+
+DEFAULT_LANE = "default"
+
+
+class Lane:
+    __slots__ = ("name", "weight", "queue_size", "concurrency", "overflow")
+
+    def __init__(
+        self,
+        name: str,
+        weight: int = 1,
+        queue_size: int = 1000,
+        concurrency: Optional[int] = None,
+        overflow: Optional[str] = None,
+    ):
+        self.name = name
+        self.weight = weight
+        self.queue_size = queue_size
+        self.concurrency = concurrency
+        # None uses the overflow policy of the dispatcher
+        self.overflow = overflow
+
+
+class _LaneQueue:
+    __slots__ = ("lane", "overflow", "items", "running", "credit")
+
+    def __init__(self, lane: Lane, overflow: str):
+        self.lane = lane
+        self.overflow = overflow
+        self.items: Deque[Tuple[Type[BaseEvent], object, bool]] = deque()
+        self.running = 0
+        self.credit = 0
+
+    @property
+    def is_ready(self) -> bool:
+        return bool(self.items) and (
+            self.lane.concurrency is None or self.running < self.lane.concurrency
+        )
+
+
+class LaneDispatcher(EventDispatcher):
+    """
+    Dispatcher with a bounded queue per lane. Workers pick the next event
+    with smooth weighted round-robin over the lanes that have queued events
+    and are under their concurrency cap, so every lane gets its share.
+    """
+
+    def __init__(
+        self,
+        lanes: Iterable[Lane] = (),
+        workers: int = 4,
+        queue_size: int = 1000,
+        overflow: str = OVERFLOW_BLOCK,
+        runner: Optional[EventRunner] = None,
+        name: str = "dispatcher",
+    ):
+        super().__init__(
+            workers=workers,
+            queue_size=queue_size,
+            overflow=overflow,
+            runner=runner,
+            name=name,
+        )
+
+        lanes = list(lanes)
+        names = {lane.name for lane in lanes}
+        if len(names) != len(lanes) or not all(
+            self._is_valid_lane(lane=lane) for lane in lanes
+        ):
+            raise InvalidLaneSettingException
+
+        if DEFAULT_LANE not in names:
+            lanes.append(Lane(name=DEFAULT_LANE, queue_size=queue_size))
+
+        self.lanes: Dict[str, Lane] = {lane.name: lane for lane in lanes}
+        self._queues: Dict[str, _LaneQueue] = {}
+        self._condition: Optional[asyncio.Condition] = None
+        self._unfinished = 0
+
+    @property
+    def qsize(self) -> int:
+        return sum(len(queue.items) for queue in self._queues.values())
+
+    def depths(self) -> Dict[str, int]:
+        """
+        Number of queued events of each lane.
+        """
+        return {
+            name: len(self._queues[name].items) if name in self._queues else 0
+            for name in self.lanes
+        }
+
+    async def start(self) -> None:
+        if self._running:
+            return
+
+        self._condition = asyncio.Condition()
+        self._queues = {
+            name: _LaneQueue(lane=lane, overflow=lane.overflow or self.overflow)
+            for name, lane in self.lanes.items()
+        }
+        self._unfinished = 0
+        self._tasks = [
+            asyncio.create_task(self._work()) for _ in range(self.workers)
+        ]
+        self._running = True
+
+    async def dispatch(
+        self, events: Iterable[Tuple[Type[BaseEvent], Optional[BaseModel]]],
+    ) -> None:
+        events = list(events)
+        # Fail before anything is queued or collected into a batch
+        for event, _ in events:
+            self._get_lane_name(event=event)
+
+        await super().dispatch(events=events)
+
+    async def _join(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._unfinished == 0)
+
+    async def _put(
+        self, item: Tuple[Type[BaseEvent], object, bool],
+    ) -> None:
+        queue = self._queues[self._get_lane_name(event=item[0])]
+        async with self._condition:
+            while len(queue.items) >= queue.lane.queue_size:
+                if queue.overflow == OVERFLOW_REJECT:
+                    raise EventQueueFullException
+
+                if queue.overflow == OVERFLOW_DROP_OLDEST:
+                    queue.items.popleft()
+                    self._unfinished -= 1
+                else:
+                    await self._condition.wait()
+
+            queue.items.append(item)
+            self._unfinished += 1
+            self._condition.notify_all()
+
+        self._record_lane_depth(queue=queue)
+
+    async def _work(self) -> None:
+        while True:
+            async with self._condition:
+                queue = self._select()
+                while queue is None:
+                    await self._condition.wait()
+                    queue = self._select()
+
+                event, parameter, is_batch = queue.items.popleft()
+                queue.running += 1
+                if not queue.items:
+                    # An idle lane does not save up credit for later
+                    queue.credit = 0
+                # Wake up producers waiting for room in this lane
+                self._condition.notify_all()
+
+            self._record_lane_depth(queue=queue)
+            try:
+                await self._run(event=event, parameter=parameter, is_batch=is_batch)
+            finally:
+                async with self._condition:
+                    queue.running -= 1
+                    self._unfinished -= 1
+                    self._condition.notify_all()
+
+    def _select(self) -> Optional[_LaneQueue]:
+        selected: Optional[_LaneQueue] = None
+        total = 0
+        for queue in self._queues.values():
+            if not queue.is_ready:
+                continue
+
+            queue.credit += queue.lane.weight
+            total += queue.lane.weight
+            if selected is None or queue.credit > selected.credit:
+                selected = queue
+
+        if selected is not None:
+            selected.credit -= total
+
+        return selected
+
+    def _get_lane_name(self, event: Type[BaseEvent]) -> str:
+        name = self.runner.registry.get(event=event).lane or DEFAULT_LANE
+        if name not in self.lanes:
+            raise UnknownLaneException(name=name)
+
+        return name
+
+    def _record_lane_depth(self, queue: _LaneQueue) -> None:
+        sink = get_metrics_sink()
+        if sink is not None:
+            sink.record_queue_depth(
+                queue=f"{self.name}:{queue.lane.name}", depth=len(queue.items),
+            )
+
+    def _is_valid_lane(self, lane: Lane) -> bool:
+        return (
+            isinstance(lane, Lane)
+            and isinstance(lane.name, str)
+            and _is_positive_int(lane.weight)
+            and _is_positive_int(lane.queue_size)
+            and (lane.concurrency is None or _is_positive_int(lane.concurrency))
+            and (lane.overflow is None or lane.overflow in self.OVERFLOW_POLICIES)
+        )
+
+
+def _is_positive_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value > 0
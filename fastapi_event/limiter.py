@@ -0,0 +1,138 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+KeyFunc = Callable[[Any], Hashable]
+
+
+class BaseLimit:
+    __slots__ = ("key", "max_keys")
+
+    def __init__(self, key: Optional[KeyFunc] = None, max_keys: int = 10000):
+        self.key = key
+        self.max_keys = max_keys
+
+    def get_key(self, parameter: Any) -> Hashable:
+        if self.key is None:
+            return None
+
+        return self.key(parameter)
+
+    def acquire(self, state: Any, now: float) -> Tuple[bool, Any]:
+        """
+        Return whether a run is allowed and the new state of its key.
+        """
+        raise NotImplementedError
+
+
+class RateLimit(BaseLimit):
+    """
+    Token bucket allowing `rate` runs per `per` seconds,
+    with bursts of up to `burst` runs.
+    """
+
+    __slots__ = ("rate", "per", "burst")
+
+    def __init__(
+        self,
+        rate: float,
+        per: float = 1.0,
+        burst: Optional[int] = None,
+        key: Optional[KeyFunc] = None,
+        max_keys: int = 10000,
+    ):
+        super().__init__(key=key, max_keys=max_keys)
+        self.rate = rate
+        self.per = per
+        self.burst = burst if burst is not None else max(int(rate), 1)
+
+    def acquire(self, state: Optional[Tuple[float, float]], now: float):
+        if state is None:
+            tokens = float(self.burst)
+        else:
+            tokens, updated = state
+            tokens = min(self.burst, tokens + (now - updated) * self.rate / self.per)
+
+        if tokens >= 1:
+            return True, (tokens - 1, now)
+
+        return False, (tokens, now)
+
+
+class Throttle(BaseLimit):
+    """
+    Allow at most one run per `window` seconds. Others are dropped.
+    """
+
+    __slots__ = ("window",)
+
+    def __init__(
+        self, window: float, key: Optional[KeyFunc] = None, max_keys: int = 10000,
+    ):
+        super().__init__(key=key, max_keys=max_keys)
+        self.window = window
+
+    def acquire(self, state: Optional[float], now: float):
+        if state is not None and now - state < self.window:
+            return False, state
+
+        return True, now
+
+
+class Debounce(BaseLimit):
+    """
+    Run once `window` seconds after the last store, with its parameter.
+    Stores within the window replace the pending run.
+    """
+
+    __slots__ = ("window",)
+
+    def __init__(
+        self, window: float, key: Optional[KeyFunc] = None, max_keys: int = 10000,
+    ):
+        super().__init__(key=key, max_keys=max_keys)
+        self.window = window
+
+
+class Limiter:
+    """
+    State of a limit per key, shared by every request. The least recently
+    used keys are dropped once there are more than `max_keys` of them.
+    """
+
+    __slots__ = ("limit", "_states")
+
+    def __init__(self, limit: BaseLimit):
+        self.limit = limit
+        self._states: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def acquire(self, parameter: Any) -> bool:
+        key = self.limit.get_key(parameter)
+        allowed, state = self.limit.acquire(self._get(key), time.monotonic())
+        self._set(key, state)
+        return allowed
+
+    def replace(self, parameter: Any, value: Any) -> Any:
+        """
+        Store `value` for the key of `parameter` and return the previous one.
+        """
+        key = self.limit.get_key(parameter)
+        previous = self._get(key)
+        self._set(key, value)
+        return previous
+
+    def _get(self, key: Hashable) -> Any:
+        state = self._states.get(key)
+        if state is not None:
+            self._states.move_to_end(key)
+
+        return state
+
+    def _set(self, key: Hashable, state: Any) -> None:
+        self._states[key] = state
+        self._states.move_to_end(key)
+        if len(self._states) > self.limit.max_keys:
+            self._states.popitem(last=False)
@@ -1,9 +1,61 @@
-from fastapi_event.handler import event_handler
+from typing import Any, Dict, Optional
+
+from fastapi_event.eager import warn_if_unsupported
+from fastapi_event.exceptions import (
+    InvalidDispatchModeException,
+    InvalidConcurrencyException,
+    InvalidTimeoutException,
+    InvalidErrorPolicyException,
+)
+from fastapi_event.handler import ON_ERROR_POLICIES, ON_ERROR_RAISE, event_handler
+from fastapi_event.transport import BaseTransport
+
+DISPATCH_INLINE = "inline"
+DISPATCH_AFTER_RESPONSE = "after_response"
 
 
 class EventListener:
-    def __init__(self, run_at_once: bool = True):
+    """
+    Publish the events stored in the decorated function once it returns.
+    `eager=True` starts events right away instead of on the next loop
+    iteration. It needs Python 3.12+ and has no effect on older versions.
+    """
+
+    DISPATCH_MODES = (DISPATCH_INLINE, DISPATCH_AFTER_RESPONSE)
+
+    def __init__(
+        self,
+        run_at_once: bool = True,
+        dispatch: str = DISPATCH_INLINE,
+        waves: bool = False,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        dispatcher: Optional[BaseTransport] = None,
+        on_error: str = ON_ERROR_RAISE,
+        eager: bool = False,
+    ):
+        if dispatch not in self.DISPATCH_MODES:
+            raise InvalidDispatchModeException
+
+        if concurrency is not None and concurrency <= 0:
+            raise InvalidConcurrencyException
+
+        if timeout is not None and timeout <= 0:
+            raise InvalidTimeoutException
+
+        if on_error not in ON_ERROR_POLICIES:
+            raise InvalidErrorPolicyException
+
         self.run_at_once = run_at_once
+        self.dispatch = dispatch
+        self.waves = waves
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.dispatcher = dispatcher
+        self.on_error = on_error
+        self.eager = eager
+        if eager:
+            warn_if_unsupported()
 
     def __call__(self, func):
         async def _inner(*args, **kwargs):
@@ -12,7 +64,21 @@ class EventListener:
             except Exception as e:
                 raise e from None
 
-            await event_handler._publish(run_at_once=self.run_at_once)
+            if self.dispatch == DISPATCH_AFTER_RESPONSE:
+                event_handler._defer(**self._get_publish_options())
+            else:
+                await event_handler._publish(**self._get_publish_options())
             return result
 
         return _inner
+
+    def _get_publish_options(self) -> Dict[str, Any]:
+        return {
+            "run_at_once": self.run_at_once,
+            "waves": self.waves,
+            "concurrency": self.concurrency,
+            "timeout": self.timeout,
+            "dispatcher": self.dispatcher,
+            "on_error": self.on_error,
+            "eager": self.eager,
+        }
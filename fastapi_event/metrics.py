@@ -0,0 +1,176 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from starlette.types import Receive, Scope, Send
+
+
+class BaseMetricsSink(ABC):
+    @abstractmethod
+    def record_store(self, event: str, count: int = 1) -> None:
+        pass
+
+    @abstractmethod
+    def record_run(self, event: str, duration: float, failed: bool = False) -> None:
+        pass
+
+    @abstractmethod
+    def record_publish(self, duration: float) -> None:
+        pass
+
+    @abstractmethod
+    def record_queue_depth(self, queue: str, depth: int) -> None:
+        pass
+
+
+class Histogram:
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        result = []
+        total = 0
+        for bucket, count in zip(self.buckets, self.counts):
+            total += count
+            result.append((_format_value(bucket), total))
+
+        result.append(("+Inf", self.count))
+        return result
+
+
+class PrometheusMetricsSink(BaseMetricsSink):
+    DEFAULT_BUCKETS = (
+        0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+    )
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        prefix: str = "fastapi_event",
+    ):
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self.stored: Dict[str, int] = {}
+        self.runs: Dict[str, int] = {}
+        self.failures: Dict[str, int] = {}
+        self.run_durations: Dict[str, Histogram] = {}
+        self.publish_duration = Histogram(buckets=self.buckets)
+        self.queue_depths: Dict[str, int] = {}
+
+    def record_store(self, event: str, count: int = 1) -> None:
+        self.stored[event] = self.stored.get(event, 0) + count
+
+    def record_run(self, event: str, duration: float, failed: bool = False) -> None:
+        self.runs[event] = self.runs.get(event, 0) + 1
+        if failed:
+            self.failures[event] = self.failures.get(event, 0) + 1
+
+        histogram = self.run_durations.get(event)
+        if histogram is None:
+            histogram = self.run_durations[event] = Histogram(buckets=self.buckets)
+        histogram.observe(duration)
+
+    def record_publish(self, duration: float) -> None:
+        self.publish_duration.observe(duration)
+
+    def record_queue_depth(self, queue: str, depth: int) -> None:
+        self.queue_depths[queue] = depth
+
+    def render(self) -> str:
+        prefix = self.prefix
+        lines: List[str] = []
+        self._render_counter(
+            lines, f"{prefix}_stored_total", "Number of stored events.", self.stored,
+        )
+        self._render_counter(
+            lines, f"{prefix}_runs_total", "Number of event runs.", self.runs,
+        )
+        self._render_counter(
+            lines, f"{prefix}_failures_total", "Number of failed event runs.", self.failures,
+        )
+
+        name = f"{prefix}_run_duration_seconds"
+        lines.append(f"# HELP {name} Event run latency in seconds.")
+        lines.append(f"# TYPE {name} histogram")
+        for event, histogram in self.run_durations.items():
+            self._render_histogram(lines, name, histogram, f'event="{_escape(event)}"')
+
+        name = f"{prefix}_publish_duration_seconds"
+        lines.append(f"# HELP {name} Publish latency in seconds.")
+        lines.append(f"# TYPE {name} histogram")
+        self._render_histogram(lines, name, self.publish_duration)
+
+        name = f"{prefix}_queue_depth"
+        lines.append(f"# HELP {name} Number of events waiting in queue.")
+        lines.append(f"# TYPE {name} gauge")
+        for queue, depth in self.queue_depths.items():
+            lines.append(f'{name}{{queue="{_escape(queue)}"}} {depth}')
+
+        return "\n".join(lines) + "\n"
+
+    async def app(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        ASGI app serving metrics in Prometheus text format.
+        """
+        body = self.render().encode()
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [
+                (b"content-type", b"text/plain; version=0.0.4; charset=utf-8"),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    def _render_counter(
+        self, lines: List[str], name: str, help: str, values: Dict[str, int],
+    ) -> None:
+        lines.append(f"# HELP {name} {help}")
+        lines.append(f"# TYPE {name} counter")
+        for event, value in values.items():
+            lines.append(f'{name}{{event="{_escape(event)}"}} {value}')
+
+    def _render_histogram(
+        self, lines: List[str], name: str, histogram: Histogram, labels: str = "",
+    ) -> None:
+        separator = "," if labels else ""
+        for le, count in histogram.cumulative():
+            lines.append(f'{name}_bucket{{{labels}{separator}le="{le}"}} {count}')
+
+        suffix = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{suffix} {_format_value(histogram.sum)}")
+        lines.append(f"{name}_count{suffix} {histogram.count}")
+
+
+_sink: Optional[BaseMetricsSink] = None
+
+
+def set_metrics_sink(sink: Optional[BaseMetricsSink]) -> None:
+    """
+    Set the sink events are recorded to. Pass `None` to disable recording.
+    """
+    global _sink
+    _sink = sink
+
+
+def get_metrics_sink() -> Optional[BaseMetricsSink]:
+    return _sink
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value))
@@ -1,15 +1,60 @@
+import fnmatch
+import re
+from typing import Optional, Pattern, Sequence
+
 from starlette.types import ASGIApp, Receive, Scope, Send
 
 from fastapi_event.handler import event_handler
 
 
 class EventHandlerMiddleware:
-    def __init__(self, app: ASGIApp) -> None:
+    def __init__(
+        self,
+        app: ASGIApp,
+        scope_types: Sequence[str] = ("http", "websocket"),
+        include: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+    ) -> None:
         self.app = app
+        self.scope_types = frozenset(scope_types)
+        self.include = self._compile(patterns=include)
+        self.exclude = self._compile(patterns=exclude)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self._is_target(scope=scope):
+            await self.app(scope, receive, send)
+            return
+
         try:
             with event_handler():
                 await self.app(scope, receive, send)
+                # The response has been sent once the app returns, so events
+                # deferred with `dispatch="after_response"` run off the latency path.
+                await event_handler._publish_deferred()
         except Exception as e:
             raise e
+
+    def _is_target(self, scope: Scope) -> bool:
+        if scope["type"] not in self.scope_types:
+            return False
+
+        if self.include is None and self.exclude is None:
+            return True
+
+        path = scope.get("path", "")
+        if self.include is not None and not self.include.match(path):
+            return False
+
+        if self.exclude is not None and self.exclude.match(path):
+            return False
+
+        return True
+
+    def _compile(self, patterns: Optional[Sequence[str]]) -> Optional[Pattern]:
+        """
+        Compile glob patterns like `/health` or `/static/*` into one regex.
+        """
+        if not patterns:
+            return None
+
+        return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
@@ -0,0 +1,318 @@
+import argparse
+import asyncio
+import importlib
+import logging
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel
+
+from fastapi_event.base import BaseEvent
+from fastapi_event.registry import EventRegistry, event_registry
+from fastapi_event.runner import EventOutcome, EventRunner
+from fastapi_event.serializer import ParameterSerializer, parameter_serializer
+from fastapi_event.transport import BaseTransport
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ATTEMPTS = 5
+
+
+class OutboxRow:
+    __slots__ = ("id", "event", "parameter_type", "parameter", "attempts")
+
+    def __init__(
+        self,
+        id: int,
+        event: str,
+        parameter_type: Optional[str],
+        parameter: Optional[str],
+        attempts: int,
+    ):
+        self.id = id
+        self.event = event
+        self.parameter_type = parameter_type
+        self.parameter = parameter
+        self.attempts = attempts
+
+
+class SQLiteOutbox(BaseTransport):
+    TABLE_NAME = "fastapi_event_outbox"
+
+    def __init__(
+        self,
+        path: str,
+        registry: EventRegistry = event_registry,
+        serializer: ParameterSerializer = parameter_serializer,
+    ):
+        self.path = path
+        self.registry = registry
+        self.serializer = serializer
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="fastapi-event-outbox",
+        )
+        self._connection: Optional[sqlite3.Connection] = None
+
+    async def dispatch(
+        self, events: Iterable[Tuple[Type[BaseEvent], Optional[BaseModel]]],
+    ) -> None:
+        rows = []
+        created_at = time.time()
+        for event, parameter in events:
+            name = self.registry.get(event=event).name
+            parameter_type, data = self.serializer.dumps(parameter=parameter)
+            rows.append((name, parameter_type, data, created_at))
+
+        if rows:
+            await self._execute(self._insert, rows)
+
+    async def fetch(
+        self, limit: int = 100, max_attempts: Optional[int] = None,
+    ) -> List[OutboxRow]:
+        return await self._execute(self._fetch, limit, max_attempts)
+
+    async def delete(self, ids: Sequence[int]) -> None:
+        if ids:
+            await self._execute(self._delete, ids)
+
+    async def mark_failed(self, ids: Sequence[int]) -> None:
+        if ids:
+            await self._execute(self._mark_failed, ids)
+
+    async def count(self) -> int:
+        return await self._execute(self._count)
+
+    async def close(self) -> None:
+        await self._execute(self._close)
+        self._executor.shutdown(wait=True)
+
+    async def _execute(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            connection = sqlite3.connect(self.path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE_NAME} ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "event TEXT NOT NULL, "
+                "parameter_type TEXT, "
+                "parameter TEXT, "
+                "attempts INTEGER NOT NULL DEFAULT 0, "
+                "created_at REAL NOT NULL)"
+            )
+            connection.commit()
+            self._connection = connection
+
+        return self._connection
+
+    def _insert(self, rows: List[Tuple[str, Optional[str], Optional[str], float]]) -> None:
+        connection = self._connect()
+        with connection:
+            connection.executemany(
+                f"INSERT INTO {self.TABLE_NAME} "
+                "(event, parameter_type, parameter, created_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def _fetch(self, limit: int, max_attempts: Optional[int]) -> List[OutboxRow]:
+        query = f"SELECT id, event, parameter_type, parameter, attempts FROM {self.TABLE_NAME}"
+        parameters: Tuple = ()
+        if max_attempts is not None:
+            query += " WHERE attempts < ?"
+            parameters = (max_attempts,)
+
+        # Rows that keep failing go last, so they do not hold back newer rows
+        cursor = self._connect().execute(
+            query + " ORDER BY attempts, id LIMIT ?", parameters + (limit,),
+        )
+        return [OutboxRow(*row) for row in cursor.fetchall()]
+
+    def _delete(self, ids: Sequence[int]) -> None:
+        connection = self._connect()
+        with connection:
+            connection.executemany(
+                f"DELETE FROM {self.TABLE_NAME} WHERE id = ?", [(id,) for id in ids],
+            )
+
+    def _mark_failed(self, ids: Sequence[int]) -> None:
+        connection = self._connect()
+        with connection:
+            connection.executemany(
+                f"UPDATE {self.TABLE_NAME} SET attempts = attempts + 1 WHERE id = ?",
+                [(id,) for id in ids],
+            )
+
+    def _count(self) -> int:
+        cursor = self._connect().execute(f"SELECT COUNT(*) FROM {self.TABLE_NAME}")
+        return cursor.fetchone()[0]
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+class OutboxWorker:
+    def __init__(
+        self,
+        outbox: SQLiteOutbox,
+        chunk_size: int = 100,
+        interval: float = 1.0,
+        max_attempts: Optional[int] = DEFAULT_MAX_ATTEMPTS,
+        runner: Optional[EventRunner] = None,
+    ):
+        self.outbox = outbox
+        self.chunk_size = chunk_size
+        self.interval = interval
+        self.max_attempts = max_attempts
+        self.runner = runner or EventRunner(registry=outbox.registry)
+        self._task: Optional[asyncio.Task] = None
+        self._stopped: Optional[asyncio.Event] = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._stopped = asyncio.Event()
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for the chunk in progress to finish until `timeout`.
+        Rows of an interrupted chunk stay in the outbox and run again later.
+        """
+        task, self._task = self._task, None
+        if task is None:
+            return
+
+        self._stopped.set()
+        done, _ = await asyncio.wait([task], timeout=timeout)
+        if not done:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def run_forever(self) -> None:
+        if self._stopped is None:
+            self._stopped = asyncio.Event()
+
+        while not self._stopped.is_set():
+            processed, succeeded = await self._run_chunk()
+            # Only go on at once if the chunk was full and made progress
+            if processed < self.chunk_size or not succeeded:
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), timeout=self.interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def run_once(self) -> int:
+        processed, _ = await self._run_chunk()
+        return processed
+
+    async def _run_chunk(self) -> Tuple[int, int]:
+        rows = await self.outbox.fetch(
+            limit=self.chunk_size, max_attempts=self.max_attempts,
+        )
+        if not rows:
+            return 0, 0
+
+        done: List[int] = []
+        failed: List[int] = []
+        runs = self._get_runs(rows=rows, failed=failed)
+        results = await asyncio.gather(
+            *[coro for _, coro in runs], return_exceptions=True,
+        )
+        for (ids, _), result in zip(runs, results):
+            if isinstance(result, BaseException):
+                logger.error("Outbox rows %s failed", ids, exc_info=result)
+                failed.extend(ids)
+            elif isinstance(result, EventOutcome):
+                # Skipped by an open circuit, so the rows are kept for later
+                failed.extend(ids)
+            else:
+                done.extend(ids)
+
+        await self.outbox.delete(ids=done)
+        await self.outbox.mark_failed(ids=failed)
+        return len(rows), len(done)
+
+    def _get_runs(self, rows: List[OutboxRow], failed: List[int]):
+        # Retries are awaited in the runs, so a row is only deleted once it succeeds
+        batches: Dict[Type[BaseEvent], Tuple[List[int], List[Optional[BaseModel]]]] = {}
+        runs = []
+        for row in rows:
+            try:
+                descriptor = self.outbox.registry.get_by_name(name=row.event)
+                parameter = self.outbox.serializer.loads(
+                    type_name=row.parameter_type,
+                    data=row.parameter,
+                    descriptor=descriptor,
+                )
+            except Exception:
+                logger.exception("Outbox row %d can not be loaded", row.id)
+                failed.append(row.id)
+                continue
+
+            if descriptor.batchable:
+                ids, parameters = batches.setdefault(descriptor.event, ([], []))
+                ids.append(row.id)
+                parameters.append(parameter)
+            else:
+                runs.append(
+                    (
+                        [row.id],
+                        self.runner.run(
+                            event=descriptor.event, parameter=parameter, retry_inline=True,
+                        ),
+                    ),
+                )
+
+        for event, (ids, parameters) in batches.items():
+            runs.append(
+                (
+                    ids,
+                    self.runner.run_batch(
+                        event=event, parameters=parameters, retry_inline=True,
+                    ),
+                ),
+            )
+
+        return runs
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Drain fastapi-event SQLite outbox")
+    parser.add_argument("path", help="path of the SQLite outbox database")
+    parser.add_argument(
+        "--import",
+        dest="modules",
+        action="append",
+        default=[],
+        help="module that defines events (can be repeated)",
+    )
+    parser.add_argument("--chunk-size", type=int, default=100)
+    parser.add_argument("--interval", type=float, default=1.0)
+    parser.add_argument("--max-attempts", type=int, default=DEFAULT_MAX_ATTEMPTS)
+    args = parser.parse_args(argv)
+
+    for module in args.modules:
+        importlib.import_module(module)
+
+    logging.basicConfig(level=logging.INFO)
+    worker = OutboxWorker(
+        outbox=SQLiteOutbox(path=args.path),
+        chunk_size=args.chunk_size,
+        interval=args.interval,
+        max_attempts=args.max_attempts,
+    )
+    try:
+        asyncio.run(worker.run_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,481 @@
+import asyncio
+import inspect
+import logging
+import types
+import weakref
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Type, Union
+
+from fastapi_event.base import (
+    BaseEvent,
+    is_parameter_type,
+    DEDUP_KEEP_ALL,
+    DEDUP_KEEP_FIRST,
+    DEDUP_KEEP_LAST,
+)
+from fastapi_event.exceptions import (
+    InvalidEventTypeException,
+    InvalidOrderTypeException,
+    ParameterCountException,
+    InvalidTimeoutException,
+    InvalidConcurrencyException,
+    InvalidExecutorException,
+    InvalidBatchSettingException,
+    InvalidDedupPolicyException,
+    UnknownEventException,
+    InvalidRetryPolicyException,
+    InvalidCircuitBreakerException,
+    CircularDependencyException,
+    InvalidLaneException,
+    InvalidLimitException,
+)
+from fastapi_event.executor import EXECUTOR_THREAD, EXECUTOR_PROCESS
+from fastapi_event.limiter import BaseLimit, Limiter, RateLimit
+from fastapi_event.resilience import CircuitBreaker, CircuitBreakerPolicy, RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class EventDescriptor:
+    __slots__ = (
+        "event",
+        "name",
+        "parameter_count",
+        "parameter_required",
+        "parameter_type",
+        "order",
+        "timeout",
+        "concurrency",
+        "_semaphores",
+        "executor",
+        "batchable",
+        "batch_max_size",
+        "batch_max_wait",
+        "dedup",
+        "singleton",
+        "started",
+        "retry",
+        "breaker",
+        "depends_on",
+        "limiter",
+        "lane",
+    )
+
+    def __init__(
+        self,
+        event: Type[BaseEvent],
+        name: str,
+        parameter_count: int,
+        parameter_required: bool,
+        parameter_type: Optional[type],
+        order: Optional[int],
+        timeout: Optional[float] = None,
+        concurrency: Optional[int] = None,
+        executor: Optional[str] = None,
+        batchable: bool = False,
+        batch_max_size: Optional[int] = None,
+        batch_max_wait: Optional[float] = None,
+        dedup: str = DEDUP_KEEP_ALL,
+        singleton: bool = False,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        depends_on: Tuple[Type[BaseEvent], ...] = (),
+        limiter: Optional[Limiter] = None,
+        lane: Optional[str] = None,
+    ):
+        self.event = event
+        self.name = name
+        self.parameter_count = parameter_count
+        self.parameter_required = parameter_required
+        self.parameter_type = parameter_type
+        self.order = order
+        self.timeout = timeout
+        self.concurrency = concurrency
+        # A semaphore binds to one event loop, so there is one per loop
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.executor = executor
+        self.batchable = batchable
+        self.batch_max_size = batch_max_size
+        self.batch_max_wait = batch_max_wait
+        self.dedup = dedup
+        self.singleton = singleton
+        # Resolves to the started instance of a singleton event
+        self.started: Optional[asyncio.Future] = None
+        self.retry = retry
+        self.breaker = breaker
+        self.depends_on = depends_on
+        self.limiter = limiter
+        self.lane = lane
+
+    def get_semaphore(self) -> Optional[asyncio.Semaphore]:
+        """
+        Semaphore of `CONCURRENCY` for the running event loop.
+        """
+        if self.concurrency is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.concurrency)
+
+        return semaphore
+
+
+EventPlan = Tuple[Tuple[Type[BaseEvent], Tuple[Type[BaseEvent], ...]], ...]
+
+
+class EventRegistry:
+    EVENT_PARAMETER_COUNT = 2
+    MAX_PLANS = 1024
+
+    def __init__(self):
+        self._descriptors: Dict[Type[BaseEvent], EventDescriptor] = {}
+        self._names: Dict[str, Type[BaseEvent]] = {}
+        self._compiling: Set[Type[BaseEvent]] = set()
+        self._plans: Dict[FrozenSet[Type[BaseEvent]], Optional[EventPlan]] = {}
+
+    def get(self, event: Type[BaseEvent]) -> EventDescriptor:
+        descriptor = self._descriptors.get(event)
+        if descriptor is None:
+            # Dependencies are compiled with the event, so reaching an event
+            # that is still compiling means DEPENDS_ON has a cycle
+            if event in self._compiling:
+                raise CircularDependencyException(name=self._get_name(event=event))
+
+            self._compiling.add(event)
+            try:
+                descriptor = self._compile(event=event)
+            finally:
+                self._compiling.discard(event)
+
+            self._descriptors[event] = descriptor
+            self._names[descriptor.name] = event
+
+        return descriptor
+
+    def get_plan(self, events: FrozenSet[Type[BaseEvent]]) -> Optional[EventPlan]:
+        """
+        Return `(event, dependencies)` pairs of the given events in topological
+        order, or `None` if none of them depends on another. Dependencies that
+        are not in `events` are skipped through to their own dependencies.
+        """
+        try:
+            return self._plans[events]
+        except KeyError:
+            pass
+
+        plan = self._build_plan(events=events)
+        if len(self._plans) >= self.MAX_PLANS:
+            self._plans.clear()
+
+        self._plans[events] = plan
+        return plan
+
+    def get_by_name(self, name: str) -> EventDescriptor:
+        event = self._names.get(name)
+        if event is not None:
+            return self.get(event=event)
+
+        for event in self._get_concrete_events():
+            if self._get_name(event=event) == name:
+                return self.get(event=event)
+
+        raise UnknownEventException(name=name)
+
+    def warm(
+        self, events: Optional[Iterable[Type[BaseEvent]]] = None,
+    ) -> List[EventDescriptor]:
+        """
+        Compile every given event (or every concrete `BaseEvent` subclass)
+        so that misconfigured events fail at startup.
+        """
+        if events is None:
+            events = self._get_concrete_events()
+
+        return [self.get(event=event) for event in events]
+
+    async def get_instance(self, descriptor: EventDescriptor) -> BaseEvent:
+        """
+        Return a new instance, or the shared one of a singleton event.
+        A singleton is created and started on first use if `startup()`
+        was not called.
+        """
+        if not descriptor.singleton:
+            return descriptor.event()
+
+        started = descriptor.started
+        if started is not None and started.get_loop() is not asyncio.get_running_loop():
+            # Started in an event loop that has been replaced, e.g. by an app restart
+            started = descriptor.started = None
+
+        if started is None:
+            started = descriptor.started = asyncio.ensure_future(
+                _start(event=descriptor.event),
+            )
+            started.add_done_callback(
+                lambda future: _reset_failed(descriptor=descriptor, future=future),
+            )
+
+        if not started.done():
+            # Shielded so a cancelled run does not cancel startup for the others
+            await asyncio.shield(started)
+
+        return started.result()
+
+    async def startup(
+        self, events: Optional[Iterable[Type[BaseEvent]]] = None,
+    ) -> None:
+        """
+        Compile the given events (or every concrete `BaseEvent` subclass)
+        and start the singletons among them.
+        """
+        for descriptor in self.warm(events=events):
+            if descriptor.singleton:
+                await self.get_instance(descriptor=descriptor)
+
+    async def shutdown(self) -> None:
+        """
+        Call `shutdown()` of every started singleton. The next run
+        creates and starts a new instance.
+        """
+        for descriptor in list(self._descriptors.values()):
+            started, descriptor.started = descriptor.started, None
+            if started is None:
+                continue
+
+            try:
+                if started.get_loop() is asyncio.get_running_loop():
+                    instance = await started
+                elif started.done() and not started.cancelled():
+                    # A future of another loop can not be awaited here
+                    instance = started.result()
+                else:
+                    continue
+
+                await instance.shutdown()
+            except Exception:
+                logger.exception("Shutdown of %s failed", descriptor.name)
+
+    def get_circuit_breakers(self) -> Dict[str, CircuitBreaker]:
+        return {
+            descriptor.name: descriptor.breaker
+            for descriptor in self._descriptors.values()
+            if descriptor.breaker is not None
+        }
+
+    def clear(self) -> None:
+        self._descriptors.clear()
+        self._names.clear()
+        self._plans.clear()
+
+    def _build_plan(self, events: FrozenSet[Type[BaseEvent]]) -> Optional[EventPlan]:
+        dependencies: Dict[Type[BaseEvent], Tuple[Type[BaseEvent], ...]] = {}
+        for event in events:
+            found: List[Type[BaseEvent]] = []
+            stack = list(self.get(event=event).depends_on)
+            seen: Set[Type[BaseEvent]] = set()
+            while stack:
+                dependency = stack.pop()
+                if dependency in seen:
+                    continue
+
+                seen.add(dependency)
+                if dependency in events:
+                    found.append(dependency)
+                else:
+                    stack.extend(self.get(event=dependency).depends_on)
+
+            dependencies[event] = tuple(found)
+
+        if not any(dependencies.values()):
+            return None
+
+        plan: List[Tuple[Type[BaseEvent], Tuple[Type[BaseEvent], ...]]] = []
+        visited: Set[Type[BaseEvent]] = set()
+
+        def visit(event: Type[BaseEvent]) -> None:
+            if event in visited:
+                return
+
+            visited.add(event)
+            for dependency in dependencies[event]:
+                visit(dependency)
+            plan.append((event, dependencies[event]))
+
+        for event in dependencies:
+            visit(event)
+
+        return tuple(plan)
+
+    def _compile(self, event: Type[BaseEvent]) -> EventDescriptor:
+        if not isinstance(event, type) or not issubclass(event, BaseEvent):
+            raise InvalidEventTypeException
+
+        func_parameters = inspect.signature(event.run).parameters
+        if len(func_parameters) != self.EVENT_PARAMETER_COUNT:
+            raise ParameterCountException
+
+        base_parameter = func_parameters.get("parameter")
+        if base_parameter is None:
+            raise ParameterCountException
+
+        order = event.ORDER
+        if order and not isinstance(order, int):
+            raise InvalidOrderTypeException
+
+        timeout = event.TIMEOUT
+        if timeout is not None and not _is_positive(timeout, (int, float)):
+            raise InvalidTimeoutException
+
+        concurrency = event.CONCURRENCY
+        if concurrency is not None and not _is_positive(concurrency, int):
+            raise InvalidConcurrencyException
+
+        executor = event.EXECUTOR
+        if executor is None and not inspect.iscoroutinefunction(event.run):
+            executor = EXECUTOR_THREAD
+
+        if executor is not None and executor not in (EXECUTOR_THREAD, EXECUTOR_PROCESS):
+            raise InvalidExecutorException
+
+        batchable = event.batch_run is not BaseEvent.batch_run
+        if batchable and not (
+            _is_positive(event.BATCH_MAX_SIZE, int)
+            and _is_positive(event.BATCH_MAX_WAIT_MS, (int, float))
+        ):
+            raise InvalidBatchSettingException
+
+        if event.DEDUP not in (DEDUP_KEEP_ALL, DEDUP_KEEP_FIRST, DEDUP_KEEP_LAST):
+            raise InvalidDedupPolicyException
+
+        depends_on = tuple(
+            self.get(event=dependency).event for dependency in event.DEPENDS_ON
+        )
+
+        retry = event.RETRY
+        if retry is not None and not (
+            isinstance(retry, RetryPolicy)
+            and _is_positive(retry.max_attempts, int)
+            and retry.backoff >= 0
+        ):
+            raise InvalidRetryPolicyException
+
+        breaker_policy = event.CIRCUIT_BREAKER
+        if breaker_policy is not None and not (
+            isinstance(breaker_policy, CircuitBreakerPolicy)
+            and _is_positive(breaker_policy.failure_threshold, int)
+            and _is_positive(breaker_policy.recovery_timeout, (int, float))
+        ):
+            raise InvalidCircuitBreakerException
+
+        limit = event.LIMIT
+        if limit is not None and not _is_valid_limit(limit):
+            raise InvalidLimitException
+
+        if event.LANE is not None and not isinstance(event.LANE, str):
+            raise InvalidLaneException
+
+        return EventDescriptor(
+            event=event,
+            name=self._get_name(event=event),
+            parameter_count=len(func_parameters),
+            parameter_required=base_parameter.default is not None,
+            parameter_type=self._get_parameter_type(parameter=base_parameter),
+            order=order or None,
+            timeout=timeout,
+            concurrency=concurrency or None,
+            executor=executor,
+            batchable=batchable,
+            batch_max_size=event.BATCH_MAX_SIZE if batchable else None,
+            batch_max_wait=event.BATCH_MAX_WAIT_MS / 1000 if batchable else None,
+            dedup=event.DEDUP,
+            # Process workers can not share an instance with this process
+            singleton=bool(event.SINGLETON) and executor != EXECUTOR_PROCESS,
+            retry=retry,
+            breaker=CircuitBreaker(policy=breaker_policy) if breaker_policy else None,
+            depends_on=depends_on,
+            limiter=Limiter(limit=limit) if limit is not None else None,
+            lane=event.LANE,
+        )
+
+    def _get_name(self, event: Type[BaseEvent]) -> str:
+        return event.NAME or f"{event.__module__}.{event.__qualname__}"
+
+    def _get_parameter_type(self, parameter: inspect.Parameter) -> Optional[type]:
+        annotation = parameter.annotation
+        if _is_union(annotation) and type(None) in annotation.__args__:
+            # `Optional[X]` or `X | None`
+            others = [arg for arg in annotation.__args__ if arg is not type(None)]
+            if len(others) == 1:
+                annotation = others[0]
+
+        # `Dict[str, Any]` and the like
+        annotation = getattr(annotation, "__origin__", annotation)
+        if _is_typed_dict(annotation):
+            # A TypedDict can not be used with `isinstance()`, its values are dicts
+            return dict
+
+        if is_parameter_type(annotation):
+            return annotation
+
+        return None
+
+    def _get_concrete_events(self) -> List[Type[BaseEvent]]:
+        events: List[Type[BaseEvent]] = []
+        stack = list(BaseEvent.__subclasses__())
+        while stack:
+            event = stack.pop()
+            stack.extend(event.__subclasses__())
+            if not inspect.isabstract(event) and event not in events:
+                events.append(event)
+
+        return events
+
+
+async def _start(event: Type[BaseEvent]) -> BaseEvent:
+    instance = event()
+    await instance.startup()
+    return instance
+
+
+def _reset_failed(descriptor: EventDescriptor, future: asyncio.Future) -> None:
+    if descriptor.started is future and (
+        future.cancelled() or future.exception() is not None
+    ):
+        descriptor.started = None
+
+
+def _is_valid_limit(limit) -> bool:
+    if not isinstance(limit, BaseLimit) or not _is_positive(limit.max_keys, int):
+        return False
+
+    if isinstance(limit, RateLimit):
+        return (
+            _is_positive(limit.rate, (int, float))
+            and _is_positive(limit.per, (int, float))
+            and _is_positive(limit.burst, int)
+        )
+
+    return _is_positive(getattr(limit, "window", None), (int, float))
+
+
+def _is_typed_dict(annotation) -> bool:
+    return (
+        isinstance(annotation, type)
+        and issubclass(annotation, dict)
+        and hasattr(annotation, "__total__")
+    )
+
+
+def _is_union(annotation) -> bool:
+    union_type = getattr(types, "UnionType", None)
+    return getattr(annotation, "__origin__", None) is Union or (
+        union_type is not None and isinstance(annotation, union_type)
+    )
+
+
+def _is_positive(value, types) -> bool:
+    return not isinstance(value, bool) and isinstance(value, types) and value > 0
+
+
+event_registry = EventRegistry()
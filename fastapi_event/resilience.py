@@ -0,0 +1,101 @@
+import random
+import time
+from typing import Optional
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class RetryPolicy:
+    __slots__ = ("max_attempts", "backoff", "max_backoff", "jitter")
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.1,
+        max_backoff: float = 10.0,
+        jitter: bool = True,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+
+    def get_delay(self, attempt: int) -> float:
+        """
+        Delay before `attempt` (2 for the first retry). It doubles every attempt
+        up to `max_backoff`, and with `jitter` a random part of it is used.
+        """
+        delay = min(self.backoff * 2 ** (attempt - 2), self.max_backoff)
+        if self.jitter:
+            return random.uniform(0, delay)
+
+        return delay
+
+
+class CircuitBreakerPolicy:
+    __slots__ = ("failure_threshold", "recovery_timeout", "fail_fast")
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        fail_fast: bool = True,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.fail_fast = fail_fast
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` failures in a row. While open, runs are
+    rejected until `recovery_timeout` passed, then one run is let through
+    to probe the dependency. Its success closes the circuit again.
+    """
+
+    __slots__ = ("policy", "failures", "_state", "_opened_at")
+
+    def __init__(self, policy: CircuitBreakerPolicy):
+        self.policy = policy
+        self.failures = 0
+        self._state = CIRCUIT_CLOSED
+        self._opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self._state == CIRCUIT_OPEN and self._is_recovered():
+            return CIRCUIT_HALF_OPEN
+
+        return self._state
+
+    def allow(self) -> bool:
+        if self._state == CIRCUIT_CLOSED:
+            return True
+
+        if not self._is_recovered():
+            return False
+
+        # Let one probe through. Another one is allowed if it does not
+        # finish within `recovery_timeout`.
+        self._state = CIRCUIT_HALF_OPEN
+        self._opened_at = time.monotonic()
+        return True
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._state = CIRCUIT_CLOSED
+        self._opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if (
+            self._state == CIRCUIT_HALF_OPEN
+            or self.failures >= self.policy.failure_threshold
+        ):
+            self._state = CIRCUIT_OPEN
+            self._opened_at = time.monotonic()
+
+    def _is_recovered(self) -> bool:
+        return time.monotonic() - self._opened_at >= self.policy.recovery_timeout
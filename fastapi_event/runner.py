@@ -0,0 +1,282 @@
+import asyncio
+import logging
+import time
+from typing import (
+    Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type,
+)
+
+from pydantic import BaseModel
+
+from fastapi_event.base import BaseEvent
+from fastapi_event.exceptions import CircuitOpenException
+from fastapi_event.executor import EXECUTOR_PROCESS, EventExecutor, event_executor
+from fastapi_event.metrics import get_metrics_sink
+from fastapi_event.registry import EventDescriptor, EventRegistry, event_registry
+
+logger = logging.getLogger(__name__)
+
+
+class EventOutcome:
+    """
+    Returned by the runner instead of a result when `run()` did not succeed,
+    yet there is no error to raise.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"<{self.name}>"
+
+
+# The run failed and later attempts were scheduled in the background
+RETRY_SCHEDULED = EventOutcome(name="retry_scheduled")
+# The circuit is open and `fail_fast` is off, so `run()` was not called
+SKIPPED = EventOutcome(name="skipped")
+
+
+class EventRunner:
+    def __init__(
+        self,
+        registry: EventRegistry = event_registry,
+        executor: EventExecutor = event_executor,
+    ):
+        self.registry = registry
+        self.executor = executor
+        self._retries: Set[asyncio.Task] = set()
+
+    @property
+    def pending_retries(self) -> int:
+        return len(self._retries)
+
+    async def wait_retries(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait for scheduled retries until `timeout` and cancel the rest.
+        """
+        tasks = set(self._retries)
+        if not tasks:
+            return
+
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+
+    async def run_many(
+        self, events: Iterable[Tuple[Type[BaseEvent], Optional[BaseModel]]],
+    ) -> List[Any]:
+        """
+        Run the given pairs at once. Parameters of batchable events
+        are collected into one `batch_run()` call per event.
+        """
+        futures = []
+        batches: Dict[Type[BaseEvent], List[Optional[BaseModel]]] = {}
+        for event, parameter in events:
+            if self.registry.get(event=event).batchable:
+                batches.setdefault(event, []).append(parameter)
+            else:
+                futures.append(self.run(event=event, parameter=parameter))
+
+        for event, parameters in batches.items():
+            futures.append(self.run_batch(event=event, parameters=parameters))
+
+        return await asyncio.gather(*futures)
+
+    async def run(
+        self,
+        event: Type[BaseEvent],
+        parameter: Optional[BaseModel] = None,
+        semaphore: Optional[asyncio.Semaphore] = None,
+        retry_inline: bool = False,
+    ) -> Any:
+        """
+        Return the result of `run()`, or `RETRY_SCHEDULED` or `SKIPPED`.
+        With `retry_inline=True` retries are awaited here and the error
+        of the last attempt is raised.
+        """
+        descriptor = self.registry.get(event=event)
+        return await self._execute_resilient(
+            descriptor=descriptor,
+            call=lambda: self._call(descriptor=descriptor, parameter=parameter),
+            semaphore=semaphore,
+            retry_inline=retry_inline,
+        )
+
+    async def run_batch(
+        self,
+        event: Type[BaseEvent],
+        parameters: List[Optional[BaseModel]],
+        semaphore: Optional[asyncio.Semaphore] = None,
+        retry_inline: bool = False,
+    ) -> Any:
+        descriptor = self.registry.get(event=event)
+        return await self._execute_resilient(
+            descriptor=descriptor,
+            call=lambda: self._call_batch(descriptor=descriptor, parameters=parameters),
+            semaphore=semaphore,
+            retry_inline=retry_inline,
+        )
+
+    async def _execute_resilient(
+        self,
+        descriptor: EventDescriptor,
+        call: Callable[[], Awaitable[Any]],
+        semaphore: Optional[asyncio.Semaphore] = None,
+        retry_inline: bool = False,
+    ) -> Any:
+        if descriptor.retry is None and descriptor.breaker is None:
+            return await self._execute(
+                descriptor=descriptor, call=call, semaphore=semaphore,
+            )
+
+        try:
+            return await self._attempt(
+                descriptor=descriptor, call=call, semaphore=semaphore,
+            )
+        except CircuitOpenException:
+            raise
+        except Exception:
+            if descriptor.retry is None or descriptor.retry.max_attempts < 2:
+                raise
+
+        if retry_inline:
+            return await self._retry(descriptor=descriptor, call=call)
+
+        # Later attempts run in the background so the caller is not held
+        task = asyncio.ensure_future(
+            self._retry_in_background(descriptor=descriptor, call=call),
+        )
+        self._retries.add(task)
+        task.add_done_callback(self._retries.discard)
+        return RETRY_SCHEDULED
+
+    async def _retry(
+        self, descriptor: EventDescriptor, call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        retry = descriptor.retry
+        for attempt in range(2, retry.max_attempts + 1):
+            await asyncio.sleep(retry.get_delay(attempt=attempt))
+            try:
+                return await self._attempt(descriptor=descriptor, call=call)
+            except Exception:
+                if attempt == retry.max_attempts:
+                    raise
+
+    async def _retry_in_background(
+        self, descriptor: EventDescriptor, call: Callable[[], Awaitable[Any]],
+    ) -> None:
+        try:
+            await self._retry(descriptor=descriptor, call=call)
+        except Exception:
+            logger.exception(
+                "%s failed after %d attempts",
+                descriptor.name,
+                descriptor.retry.max_attempts,
+            )
+
+    async def _attempt(
+        self,
+        descriptor: EventDescriptor,
+        call: Callable[[], Awaitable[Any]],
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Any:
+        breaker = descriptor.breaker
+        if breaker is None:
+            return await self._execute(
+                descriptor=descriptor, call=call, semaphore=semaphore,
+            )
+
+        if not breaker.allow():
+            if breaker.policy.fail_fast:
+                raise CircuitOpenException(name=descriptor.name)
+
+            return SKIPPED
+
+        try:
+            result = await self._execute(
+                descriptor=descriptor, call=call, semaphore=semaphore,
+            )
+        except Exception:
+            breaker.record_failure()
+            raise
+
+        breaker.record_success()
+        return result
+
+    async def _execute(
+        self,
+        descriptor: EventDescriptor,
+        call: Callable[[], Awaitable[Any]],
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> Any:
+        if semaphore is None:
+            return await self._execute_limited(descriptor=descriptor, call=call)
+
+        async with semaphore:
+            return await self._execute_limited(descriptor=descriptor, call=call)
+
+    async def _execute_limited(
+        self, descriptor: EventDescriptor, call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        semaphore = descriptor.get_semaphore()
+        if semaphore is None:
+            return await self._measure(descriptor=descriptor, call=call)
+
+        async with semaphore:
+            return await self._measure(descriptor=descriptor, call=call)
+
+    async def _measure(
+        self, descriptor: EventDescriptor, call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        sink = get_metrics_sink()
+        if sink is None:
+            return await self._call_with_timeout(descriptor=descriptor, call=call)
+
+        started = time.perf_counter()
+        try:
+            result = await self._call_with_timeout(descriptor=descriptor, call=call)
+        except BaseException:
+            sink.record_run(
+                event=descriptor.name,
+                duration=time.perf_counter() - started,
+                failed=True,
+            )
+            raise
+
+        sink.record_run(event=descriptor.name, duration=time.perf_counter() - started)
+        return result
+
+    async def _call_with_timeout(
+        self, descriptor: EventDescriptor, call: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        if descriptor.timeout is None:
+            return await call()
+
+        return await asyncio.wait_for(call(), timeout=descriptor.timeout)
+
+    async def _call(
+        self, descriptor: EventDescriptor, parameter: Optional[BaseModel] = None,
+    ) -> Any:
+        if descriptor.executor == EXECUTOR_PROCESS:
+            return await self.executor.run(
+                executor=descriptor.executor,
+                event=descriptor.event,
+                parameter=parameter,
+            )
+
+        instance = await self.registry.get_instance(descriptor=descriptor)
+        if descriptor.executor is None:
+            return await instance.run(parameter=parameter)
+
+        return await self.executor.run(
+            executor=descriptor.executor,
+            event=instance,
+            parameter=parameter,
+        )
+
+    async def _call_batch(
+        self, descriptor: EventDescriptor, parameters: List[Optional[BaseModel]],
+    ) -> Any:
+        instance = await self.registry.get_instance(descriptor=descriptor)
+        return await instance.batch_run(parameters=parameters)
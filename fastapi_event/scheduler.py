@@ -0,0 +1,217 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from datetime import datetime
+from typing import Any, List, Optional, Set, Tuple, Type
+
+from fastapi_event.base import BaseEvent
+from fastapi_event.exceptions import (
+    InvalidScheduleException,
+    SchedulerNotRunningException,
+)
+from fastapi_event.factory import resolve_parameter
+from fastapi_event.runner import EventRunner
+
+logger = logging.getLogger(__name__)
+
+_STATE_CREATED = 0
+_STATE_QUEUED = 1
+_STATE_DONE = 2
+_STATE_CANCELLED = 3
+
+
+class ScheduledEvent:
+    """
+    Handle of a delayed event. `cancel()` works both before and
+    after the request that stored it is published.
+    """
+
+    __slots__ = ("event", "parameter", "when", "_scheduler", "_state")
+
+    def __init__(
+        self,
+        event: Type[BaseEvent],
+        parameter: Any,
+        when: float,
+        scheduler: "EventScheduler",
+    ):
+        self.event = event
+        self.parameter = parameter
+        self.when = when
+        self._scheduler = scheduler
+        self._state = _STATE_CREATED
+
+    @property
+    def cancelled(self) -> bool:
+        return self._state == _STATE_CANCELLED
+
+    @property
+    def done(self) -> bool:
+        return self._state == _STATE_DONE
+
+    def cancel(self) -> bool:
+        if self._state in (_STATE_DONE, _STATE_CANCELLED):
+            return False
+
+        queued = self._state == _STATE_QUEUED
+        self._state = _STATE_CANCELLED
+        if queued:
+            self._scheduler._discard()
+
+        return True
+
+
+class EventScheduler:
+    """
+    Run events at a given time from a single background task. Timers are
+    kept in a heap, so only the earliest one is registered on the loop.
+    Pending timers live in memory and are dropped on shutdown.
+    """
+
+    def __init__(self, runner: Optional[EventRunner] = None):
+        self.runner = runner or EventRunner()
+        self._heap: List[Tuple[float, int, ScheduledEvent]] = []
+        self._sequence = itertools.count()
+        self._pending = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._running: Set[asyncio.Task] = set()
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the timer task, cancel pending events and wait
+        for events already started until `timeout`.
+        """
+        task, self._task = self._task, None
+        if task is None:
+            return
+
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        heap, self._heap = self._heap, []
+        self._pending = 0
+        for _, _, handle in heap:
+            if handle._state == _STATE_QUEUED:
+                handle._state = _STATE_CANCELLED
+
+        if self._running:
+            await asyncio.wait(set(self._running), timeout=timeout)
+
+    def create(
+        self,
+        event: Type[BaseEvent],
+        parameter: Any = None,
+        delay: Optional[float] = None,
+        at: Optional[datetime] = None,
+    ) -> ScheduledEvent:
+        """
+        Create a handle that runs after `delay` seconds or at `at`.
+        It is not queued until passed to `schedule()`.
+        """
+        if self._task is None:
+            raise SchedulerNotRunningException
+
+        if (delay is None) == (at is None):
+            raise InvalidScheduleException
+
+        if at is not None:
+            if not isinstance(at, datetime):
+                raise InvalidScheduleException
+            delay = max(at.timestamp() - time.time(), 0.0)
+        elif isinstance(delay, bool) or not isinstance(delay, (int, float)) or delay < 0:
+            raise InvalidScheduleException
+
+        when = asyncio.get_running_loop().time() + delay
+        return ScheduledEvent(event=event, parameter=parameter, when=when, scheduler=self)
+
+    def schedule(self, handles: List[ScheduledEvent]) -> None:
+        if self._task is None:
+            raise SchedulerNotRunningException
+
+        head = self._heap[0][0] if self._heap else None
+        for handle in handles:
+            if handle._state != _STATE_CREATED:
+                continue
+
+            handle._state = _STATE_QUEUED
+            heapq.heappush(self._heap, (handle.when, next(self._sequence), handle))
+            self._pending += 1
+
+        if self._heap and (head is None or self._heap[0][0] < head):
+            self._wakeup.set()
+
+    def _discard(self) -> None:
+        self._pending -= 1
+        # Cancelled handles are skipped when popped. Rebuild the heap
+        # once they make up most of it so memory does not grow.
+        if len(self._heap) > 64 and self._pending < len(self._heap) // 2:
+            self._heap = [item for item in self._heap if item[2]._state == _STATE_QUEUED]
+            heapq.heapify(self._heap)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+            timer = None
+            if self._heap:
+                when = self._heap[0][0]
+                if when <= loop.time():
+                    self._run_due(now=loop.time())
+                    continue
+
+                timer = loop.call_at(when, self._wakeup.set)
+
+            try:
+                await self._wakeup.wait()
+            finally:
+                if timer is not None:
+                    timer.cancel()
+
+    def _run_due(self, now: float) -> None:
+        events = []
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, _, handle = heapq.heappop(heap)
+            if handle._state != _STATE_QUEUED:
+                continue
+
+            handle._state = _STATE_DONE
+            self._pending -= 1
+            events.append((handle.event, handle.parameter))
+
+        if events:
+            task = asyncio.ensure_future(self._run_events(events=events))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run_events(self, events: List[Tuple[Type[BaseEvent], Any]]) -> None:
+        resolved = []
+        for event, parameter in events:
+            try:
+                resolved.append((event, await resolve_parameter(parameter)))
+            except Exception:
+                logger.exception("Parameter of `%s` could not be built", event.__name__)
+
+        try:
+            await self.runner.run_many(events=resolved)
+        except Exception:
+            logger.exception("Scheduled events failed")
+
+
+event_scheduler = EventScheduler()
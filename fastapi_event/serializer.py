@@ -0,0 +1,152 @@
+import dataclasses
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from fastapi_event.base import BaseEvent, is_parameter_type
+from fastapi_event.exceptions import (
+    InvalidParameterTypeException,
+    InvalidSerializedParameterException,
+)
+from fastapi_event.registry import EventDescriptor, EventRegistry, event_registry
+
+
+class ParameterSerializer:
+    """
+    Type names in serialized data are never imported. A parameter is loaded
+    only as the annotated type of the event, or as a registered type.
+    """
+
+    def __init__(self):
+        self._types: Dict[str, type] = {_get_type_name(dict): dict}
+
+    def register(self, *parameter_types: type) -> None:
+        """
+        Allow loading these types for events whose `run()` is not annotated.
+        Types dumped in this process are registered already.
+        """
+        for parameter_type in parameter_types:
+            if not is_parameter_type(parameter_type):
+                raise InvalidParameterTypeException
+
+            self._types[_get_type_name(parameter_type)] = parameter_type
+
+    def dumps(self, parameter: Any) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Return `(type name, JSON payload)` of the parameter.
+        """
+        if parameter is None:
+            return None, None
+
+        parameter_type = type(parameter)
+        type_name = _get_type_name(parameter_type)
+        if type_name not in self._types:
+            self.register(parameter_type)
+
+        if isinstance(parameter, BaseModel):
+            if hasattr(parameter, "model_dump_json"):
+                return type_name, parameter.model_dump_json()
+
+            return type_name, parameter.json()
+
+        if dataclasses.is_dataclass(parameter):
+            return type_name, json.dumps(dataclasses.asdict(parameter))
+
+        if isinstance(parameter, tuple):
+            return type_name, json.dumps(parameter._asdict())
+
+        return type_name, json.dumps(parameter)
+
+    def loads(
+        self,
+        type_name: Optional[str],
+        data: Optional[str],
+        descriptor: Optional[EventDescriptor] = None,
+    ) -> Any:
+        """
+        Dataclasses and NamedTuples are rebuilt from their top level fields.
+        Nested values are loaded as plain JSON.
+        """
+        if type_name is None:
+            return None
+
+        parameter_type = self._get_type(type_name=type_name, descriptor=descriptor)
+        if issubclass(parameter_type, BaseModel):
+            if hasattr(parameter_type, "model_validate_json"):
+                return parameter_type.model_validate_json(data)
+
+            return parameter_type.parse_raw(data)
+
+        value = json.loads(data)
+        if issubclass(parameter_type, dict):
+            return parameter_type(value)
+
+        return parameter_type(**value)
+
+    def _get_type(
+        self, type_name: str, descriptor: Optional[EventDescriptor] = None,
+    ) -> type:
+        annotated = descriptor.parameter_type if descriptor is not None else None
+        if annotated is not None and _get_type_name(annotated) == type_name:
+            return annotated
+
+        parameter_type = self._types.get(type_name)
+        if parameter_type is None or (
+            annotated is not None and not issubclass(parameter_type, annotated)
+        ):
+            raise InvalidSerializedParameterException(type_name=type_name)
+
+        return parameter_type
+
+
+def _get_type_name(parameter_type: type) -> str:
+    return f"{parameter_type.__module__}:{parameter_type.__qualname__}"
+
+
+parameter_serializer = ParameterSerializer()
+
+
+class EventCodec:
+    """
+    Encode `(event, parameter)` pairs into bytes so they can be sent
+    to another process. Events are encoded by their registered name.
+    """
+
+    def __init__(
+        self,
+        registry: EventRegistry = event_registry,
+        serializer: ParameterSerializer = parameter_serializer,
+    ):
+        self.registry = registry
+        self.serializer = serializer
+
+    def encode(
+        self, events: Iterable[Tuple[Type[BaseEvent], Any]],
+    ) -> bytes:
+        items = []
+        for event, parameter in events:
+            name = self.registry.get(event=event).name
+            items.append((name, *self.serializer.dumps(parameter=parameter)))
+
+        return json.dumps(items, separators=(",", ":")).encode()
+
+    def decode(
+        self, data: bytes,
+    ) -> List[Tuple[Type[BaseEvent], Any]]:
+        events = []
+        for name, type_name, parameter in json.loads(data):
+            descriptor = self.registry.get_by_name(name=name)
+            events.append(
+                (
+                    descriptor.event,
+                    self.serializer.loads(
+                        type_name=type_name, data=parameter, descriptor=descriptor,
+                    ),
+                ),
+            )
+
+        return events
+
+
+event_codec = EventCodec()
@@ -0,0 +1,135 @@
+import re
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Pattern, Tuple, Type
+
+from fastapi_event.base import BaseEvent
+from fastapi_event.exceptions import InvalidEventTypeException, InvalidTopicException
+from fastapi_event.registry import EventRegistry, event_registry
+
+Subscribers = Tuple[Type[BaseEvent], ...]
+
+
+class TopicRegistry:
+    """
+    Map topics such as `order.placed` to the events subscribed to them.
+    In patterns `*` matches one segment and `#` matches one or more segments.
+    """
+
+    MAX_CACHED_TOPICS = 1024
+
+    def __init__(self, registry: EventRegistry = event_registry):
+        self.registry = registry
+        self._subscriptions: List[Tuple[str, Type[BaseEvent]]] = []
+        self._wildcards: List[Tuple[Pattern, Type[BaseEvent]]] = []
+        self._table: Optional[Mapping[str, Subscribers]] = None
+        self._cache: Dict[str, Subscribers] = {}
+
+    def subscribe(
+        self, *patterns: str,
+    ) -> Callable[[Type[BaseEvent]], Type[BaseEvent]]:
+        for pattern in patterns:
+            _compile_pattern(pattern=pattern)
+
+        def decorator(event: Type[BaseEvent]) -> Type[BaseEvent]:
+            if not isinstance(event, type) or not issubclass(event, BaseEvent):
+                raise InvalidEventTypeException
+
+            for pattern in patterns:
+                self._subscriptions.append((pattern, event))
+
+            # Rebuilt on next use
+            self._table = None
+            return event
+
+        return decorator
+
+    def freeze(self) -> Mapping[str, Subscribers]:
+        """
+        Compile every subscriber and wildcard pattern and build
+        the dispatch table of the topics subscribed without wildcards.
+        """
+        self.registry.warm(events=[event for _, event in self._subscriptions])
+
+        wildcards = []
+        topics: Dict[str, List[Type[BaseEvent]]] = {}
+        for pattern, event in self._subscriptions:
+            regex = _compile_pattern(pattern=pattern)
+            if regex is None:
+                topics.setdefault(pattern, [])
+            else:
+                wildcards.append((regex, event))
+
+        self._wildcards = wildcards
+        self._cache = {}
+        self._table = MappingProxyType(
+            {topic: self._match(topic=topic) for topic in topics},
+        )
+        return self._table
+
+    def get(self, topic: str) -> Subscribers:
+        table = self._table
+        if table is None:
+            table = self.freeze()
+
+        events = table.get(topic)
+        if events is not None:
+            return events
+
+        # Topics only matched by wildcards are resolved on first use
+        events = self._cache.get(topic)
+        if events is None:
+            if len(self._cache) >= self.MAX_CACHED_TOPICS:
+                self._cache.clear()
+
+            events = self._cache[topic] = self._match(topic=topic)
+
+        return events
+
+    def clear(self) -> None:
+        self._subscriptions = []
+        self._wildcards = []
+        self._table = None
+        self._cache = {}
+
+    def _match(self, topic: str) -> Subscribers:
+        events: List[Type[BaseEvent]] = []
+        for pattern, event in self._subscriptions:
+            if pattern == topic and event not in events:
+                events.append(event)
+
+        for regex, event in self._wildcards:
+            if regex.fullmatch(topic) and event not in events:
+                events.append(event)
+
+        return tuple(events)
+
+
+def _compile_pattern(pattern: str) -> Optional[Pattern]:
+    """
+    Return the regex of a wildcard pattern, or `None` for a plain topic.
+    """
+    if not isinstance(pattern, str) or not pattern:
+        raise InvalidTopicException(pattern=pattern)
+
+    parts = []
+    wildcard = False
+    for segment in pattern.split("."):
+        if segment == "*":
+            parts.append(r"[^.]+")
+            wildcard = True
+        elif segment == "#":
+            parts.append(r"[^.]+(?:\.[^.]+)*")
+            wildcard = True
+        elif not segment or "*" in segment or "#" in segment:
+            raise InvalidTopicException(pattern=pattern)
+        else:
+            parts.append(re.escape(segment))
+
+    if not wildcard:
+        return None
+
+    return re.compile(r"\.".join(parts))
+
+
+topic_registry = TopicRegistry()
+subscribe = topic_registry.subscribe
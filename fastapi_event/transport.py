@@ -0,0 +1,254 @@
+import argparse
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+import socket
+import stat
+import struct
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Optional, Sequence, Set, Tuple, Type
+
+from pydantic import BaseModel
+
+from fastapi_event.base import BaseEvent
+from fastapi_event.exceptions import DispatcherNotRunningException
+from fastapi_event.runner import EventRunner
+from fastapi_event.serializer import EventCodec, event_codec
+
+logger = logging.getLogger(__name__)
+
+_FRAME_HEADER = struct.Struct("!I")
+
+
+class BaseTransport(ABC):
+    @abstractmethod
+    async def dispatch(
+        self, events: Iterable[Tuple[Type[BaseEvent], Optional[BaseModel]]],
+    ) -> None:
+        pass
+
+
+class InProcessTransport(BaseTransport):
+    def __init__(self, runner: Optional[EventRunner] = None):
+        self.runner = runner or EventRunner()
+
+    async def dispatch(
+        self, events: Iterable[Tuple[Type[BaseEvent], Optional[BaseModel]]],
+    ) -> None:
+        await self.runner.run_many(events=events)
+
+
+class MultiprocessingTransport(BaseTransport):
+    def __init__(
+        self,
+        workers: int = 1,
+        modules: Sequence[str] = (),
+        codec: EventCodec = event_codec,
+    ):
+        self.workers = workers
+        self.modules = list(modules)
+        self.codec = codec
+        self._queue: Optional[multiprocessing.Queue] = None
+        self._processes: List[multiprocessing.Process] = []
+
+    async def start(self) -> None:
+        if self._processes:
+            return
+
+        self._queue = multiprocessing.Queue()
+        for _ in range(self.workers):
+            process = multiprocessing.Process(
+                target=_consume_queue, args=(self._queue, self.modules), daemon=True,
+            )
+            process.start()
+            self._processes.append(process)
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Let the worker processes finish queued events until `timeout`
+        and terminate the ones still running.
+        """
+        processes, self._processes = self._processes, []
+        for _ in processes:
+            self._queue.put(None)
+
+        loop = asyncio.get_running_loop()
+        for process in processes:
+            await loop.run_in_executor(None, process.join, timeout)
+            if process.is_alive():
+                process.terminate()
+
+    async def dispatch(
+        self, events: Iterable[Tuple[Type[BaseEvent], Optional[BaseModel]]],
+    ) -> None:
+        if self._queue is None:
+            raise DispatcherNotRunningException
+
+        self._queue.put(self.codec.encode(events=events))
+
+
+class UnixSocketTransport(BaseTransport):
+    def __init__(self, path: str, codec: EventCodec = event_codec):
+        self.path = path
+        self.codec = codec
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def start(self) -> None:
+        self._lock = asyncio.Lock()
+        await self._connect()
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return
+
+        writer.close()
+        await asyncio.wait_for(writer.wait_closed(), timeout=timeout)
+
+    async def dispatch(
+        self, events: Iterable[Tuple[Type[BaseEvent], Optional[BaseModel]]],
+    ) -> None:
+        if self._lock is None:
+            raise DispatcherNotRunningException
+
+        data = self.codec.encode(events=events)
+        async with self._lock:
+            if self._writer is None or self._writer.is_closing():
+                await self._connect()
+
+            self._writer.write(_FRAME_HEADER.pack(len(data)) + data)
+            await self._writer.drain()
+
+    async def _connect(self) -> None:
+        _, self._writer = await asyncio.open_unix_connection(self.path)
+
+
+class EventSocketServer:
+    """
+    Receive events sent by `UnixSocketTransport` and run them.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        runner: Optional[EventRunner] = None,
+        codec: EventCodec = event_codec,
+    ):
+        self.path = path
+        self.runner = runner or EventRunner()
+        self.codec = codec
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        self._remove_socket_file()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(self.path)
+            # Only the owner may connect. Set before listening so no one connects first
+            os.chmod(self.path, 0o600)
+        except OSError:
+            sock.close()
+            raise
+
+        self._server = await asyncio.start_unix_server(self._handle, sock=sock)
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+            self._remove_socket_file()
+
+        if self._tasks:
+            await asyncio.wait(self._tasks, timeout=timeout)
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        await self._server.serve_forever()
+
+    def _remove_socket_file(self) -> None:
+        # Left by an earlier server, as `asyncio.start_unix_server` does
+        try:
+            if stat.S_ISSOCK(os.stat(self.path).st_mode):
+                os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+    ) -> None:
+        try:
+            while True:
+                header = await reader.readexactly(_FRAME_HEADER.size)
+                (length,) = _FRAME_HEADER.unpack(header)
+                self._run(data=await reader.readexactly(length))
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+    def _run(self, data: bytes) -> None:
+        task = asyncio.ensure_future(_run_encoded(self.runner, self.codec, data))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+async def _run_encoded(runner: EventRunner, codec: EventCodec, data: bytes) -> None:
+    try:
+        await runner.run_many(events=codec.decode(data=data))
+    except Exception:
+        logger.exception("Dispatched events failed")
+
+
+def _consume_queue(queue: multiprocessing.Queue, modules: Sequence[str]) -> None:
+    for module in modules:
+        importlib.import_module(module)
+
+    asyncio.run(_consume_queue_async(queue=queue))
+
+
+async def _consume_queue_async(queue: multiprocessing.Queue) -> None:
+    loop = asyncio.get_running_loop()
+    runner = EventRunner()
+    tasks: Set[asyncio.Task] = set()
+    while True:
+        data = await loop.run_in_executor(None, queue.get)
+        if data is None:
+            break
+
+        task = asyncio.ensure_future(_run_encoded(runner, event_codec, data))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    if tasks:
+        await asyncio.wait(tasks)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run fastapi-event dispatcher process")
+    parser.add_argument("path", help="path of the Unix domain socket to listen on")
+    parser.add_argument(
+        "--import",
+        dest="modules",
+        action="append",
+        default=[],
+        help="module that defines events (can be repeated)",
+    )
+    args = parser.parse_args(argv)
+
+    for module in args.modules:
+        importlib.import_module(module)
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        asyncio.run(EventSocketServer(path=args.path).serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
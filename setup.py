@@ -19,6 +19,12 @@ setuptools.setup(
         "pydantic",
     ],
     tests_require=['pytest'],
+    entry_points={
+        "console_scripts": [
+            "fastapi-event-outbox=fastapi_event.outbox:main",
+            "fastapi-event-dispatcher=fastapi_event.transport:main",
+        ],
+    },
     classifiers=[
         "Intended Audience :: Developers",
         "Programming Language :: Python",
@@ -1,3 +1,8 @@
+import dataclasses
+import os
+import threading
+from typing import NamedTuple, TypedDict
+
 from pydantic import BaseModel
 
 from fastapi_event import BaseEvent
@@ -35,3 +40,64 @@ class TestEventParameterNotNone(BaseEvent):
 
     async def run(self, parameter):
         pass
+
+
+class TestSyncEvent(BaseEvent):
+    __test__ = False
+
+    def run(self, parameter=None):
+        return threading.current_thread().name
+
+
+class TestProcessEvent(BaseEvent):
+    __test__ = False
+
+    EXECUTOR = "process"
+
+    def run(self, parameter=None):
+        if parameter.content == "error":
+            raise ValueError(parameter.content)
+
+        return os.getpid(), parameter.content.upper()
+
+
+class TestFileEvent(BaseEvent):
+    __test__ = False
+
+    async def run(self, parameter: TestEventParameter = None):
+        path, _, content = parameter.content.partition("|")
+        with open(path, "a") as f:
+            f.write(content + "\n")
+
+
+@dataclasses.dataclass(frozen=True)
+class TestDataclassParameter:
+    __test__ = False
+
+    content: str
+
+
+class TestNamedTupleParameter(NamedTuple):
+    __test__ = False
+
+    content: str
+
+
+class TestDataclassEvent(BaseEvent):
+    __test__ = False
+
+    async def run(self, parameter: TestDataclassParameter = None):
+        pass
+
+
+class TestTypedDictParameter(TypedDict):
+    __test__ = False
+
+    content: str
+
+
+class TestTypedDictEvent(BaseEvent):
+    __test__ = False
+
+    async def run(self, parameter: TestTypedDictParameter = None):
+        pass
@@ -0,0 +1,158 @@
+import asyncio
+
+import pytest
+from fastapi import WebSocket
+
+from fastapi_event import BaseEvent, EventConnection, event_handler
+from fastapi_event.exceptions import InvalidFlushPolicyException
+
+calls = []
+
+
+class MessageEvent(BaseEvent):
+    async def run(self, parameter=None) -> None:
+        calls.append(parameter["id"])
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+@pytest.mark.parametrize("kwargs", [{"flush_every": 0}, {"flush_interval_ms": -1}])
+def test_invalid_flush_policy(kwargs):
+    with pytest.raises(InvalidFlushPolicyException):
+        EventConnection(**kwargs)
+
+
+@pytest.mark.asyncio
+async def test_publish_after_each_message():
+    async with EventConnection() as connection:
+        for id in range(3):
+            async with connection.message():
+                await event_handler.store(event=MessageEvent, parameter={"id": id})
+            assert calls == list(range(id + 1))
+
+
+@pytest.mark.asyncio
+async def test_reuse_handler_of_connection():
+    handlers = []
+    async with EventConnection() as connection:
+        for id in range(3):
+            async with connection.message():
+                await event_handler.store(event=MessageEvent, parameter={"id": id})
+                handlers.append(event_handler._get_event_handler())
+
+    assert handlers[0] is handlers[1] is handlers[2]
+
+
+@pytest.mark.asyncio
+async def test_flush_every_n_messages():
+    async with EventConnection(flush_every=2) as connection:
+        for id in range(3):
+            async with connection.message():
+                await event_handler.store(event=MessageEvent, parameter={"id": id})
+
+        assert calls == [0, 1]
+
+    assert calls == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_flush_interval():
+    async with EventConnection(flush_every=100, flush_interval_ms=20) as connection:
+        async with connection.message():
+            await event_handler.store(event=MessageEvent, parameter={"id": 0})
+        assert calls == []
+
+        # Published by the timer while the connection is idle
+        await asyncio.sleep(0.03)
+        assert calls == [0]
+
+        async with connection.message():
+            await event_handler.store(event=MessageEvent, parameter={"id": 1})
+        assert calls == [0]
+
+        await asyncio.sleep(0.03)
+        assert calls == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_failed_message_discards_events():
+    async with EventConnection() as connection:
+        with pytest.raises(ValueError):
+            async with connection.message():
+                await event_handler.store(event=MessageEvent, parameter={"id": 0})
+                raise ValueError
+
+        async with connection.message():
+            await event_handler.store(event=MessageEvent, parameter={"id": 1})
+
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_failed_message_keeps_events_of_earlier_messages():
+    async with EventConnection(flush_every=3) as connection:
+        for id in range(2):
+            async with connection.message():
+                await event_handler.store(event=MessageEvent, parameter={"id": id})
+
+        with pytest.raises(ValueError):
+            async with connection.message():
+                await event_handler.store(event=MessageEvent, parameter={"id": 2})
+                raise ValueError
+
+        assert calls == []
+
+    assert calls == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_failed_message_rolls_back_dedup_and_batch():
+    class LastEvent(BaseEvent):
+        DEDUP = "keep_last"
+
+        async def run(self, parameter=None) -> None:
+            calls.append(("last", parameter["id"]))
+
+    class BatchEvent(BaseEvent):
+        async def run(self, parameter=None) -> None:
+            raise NotImplementedError
+
+        async def batch_run(self, parameters) -> None:
+            calls.append(("batch", [parameter["id"] for parameter in parameters]))
+
+    async with EventConnection(flush_every=2) as connection:
+        async with connection.message():
+            await event_handler.store(event=LastEvent, parameter={"id": 0})
+            await event_handler.store(event=BatchEvent, parameter={"id": 0})
+
+        with pytest.raises(ValueError):
+            async with connection.message():
+                await event_handler.store(event=LastEvent, parameter={"id": 1})
+                await event_handler.store(event=BatchEvent, parameter={"id": 1})
+                raise ValueError
+
+    assert sorted(calls) == [("batch", [0]), ("last", 0)]
+
+
+def test_websocket_with_middleware(app_with_middleware, client):
+    app = app_with_middleware
+
+    @app.websocket("/ws")
+    async def websocket_endpoint(websocket: WebSocket):
+        await websocket.accept()
+        async with EventConnection() as connection:
+            for _ in range(2):
+                message = await websocket.receive_json()
+                async with connection.message():
+                    await event_handler.store(event=MessageEvent, parameter=message)
+                await websocket.send_json(calls)
+        await websocket.close()
+
+    with client.websocket_connect("/ws") as websocket:
+        websocket.send_json({"id": 1})
+        assert websocket.receive_json() == [1]
+        websocket.send_json({"id": 2})
+        assert websocket.receive_json() == [1, 2]
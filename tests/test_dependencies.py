@@ -0,0 +1,191 @@
+import asyncio
+import time
+
+import pytest
+
+from fastapi_event import BaseEvent, EventDispatcher
+from fastapi_event.exceptions import (
+    CircularDependencyException,
+    UnsupportedDependencyException,
+)
+from fastapi_event.handler import EventHandler, EventHandlerValidator
+from fastapi_event.registry import EventRegistry
+
+calls = []
+
+
+class PaymentEvent(BaseEvent):
+    async def run(self, parameter=None) -> None:
+        await asyncio.sleep(0.05)
+        calls.append("payment")
+
+
+class InventoryEvent(BaseEvent):
+    async def run(self, parameter=None) -> None:
+        await asyncio.sleep(0.05)
+        calls.append("inventory")
+
+
+class ShipmentEvent(BaseEvent):
+    DEPENDS_ON = (PaymentEvent, InventoryEvent)
+
+    async def run(self, parameter=None) -> None:
+        calls.append("shipment")
+
+
+class EmailEvent(BaseEvent):
+    DEPENDS_ON = (ShipmentEvent,)
+
+    async def run(self, parameter=None) -> None:
+        calls.append("email")
+
+
+class FailingPaymentEvent(BaseEvent):
+    async def run(self, parameter=None) -> None:
+        raise ValueError("payment")
+
+
+class ReceiptEvent(BaseEvent):
+    DEPENDS_ON = (FailingPaymentEvent,)
+
+    async def run(self, parameter=None) -> None:
+        calls.append("receipt")
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+@pytest.fixture
+def handler():
+    return EventHandler(validator=EventHandlerValidator(registry=EventRegistry()))
+
+
+def test_circular_dependency():
+    class FirstEvent(BaseEvent):
+        async def run(self, parameter=None) -> None:
+            pass
+
+    class SecondEvent(BaseEvent):
+        DEPENDS_ON = (FirstEvent,)
+
+        async def run(self, parameter=None) -> None:
+            pass
+
+    FirstEvent.DEPENDS_ON = (SecondEvent,)
+    try:
+        with pytest.raises(CircularDependencyException):
+            EventRegistry().get(event=SecondEvent)
+    finally:
+        FirstEvent.DEPENDS_ON = ()
+
+
+def test_plan_is_cached_in_topological_order():
+    registry = EventRegistry()
+    events = frozenset((EmailEvent, ShipmentEvent, PaymentEvent, InventoryEvent))
+
+    plan = registry.get_plan(events=events)
+
+    order = [event for event, _ in plan]
+    assert order.index(ShipmentEvent) > order.index(PaymentEvent)
+    assert order.index(ShipmentEvent) > order.index(InventoryEvent)
+    assert order.index(EmailEvent) > order.index(ShipmentEvent)
+    assert registry.get_plan(events=events) is plan
+
+
+def test_plan_skips_events_not_stored():
+    registry = EventRegistry()
+
+    plan = registry.get_plan(events=frozenset((EmailEvent, PaymentEvent)))
+
+    assert dict(plan)[EmailEvent] == (PaymentEvent,)
+    assert registry.get_plan(events=frozenset((PaymentEvent, InventoryEvent))) is None
+
+
+@pytest.mark.asyncio
+async def test_run_dependencies_in_parallel(handler):
+    for event in (EmailEvent, ShipmentEvent, PaymentEvent, InventoryEvent):
+        await handler.store(event=event)
+
+    started = time.perf_counter()
+    await handler._publish(run_at_once=True)
+    elapsed = time.perf_counter() - started
+
+    assert sorted(calls[:2]) == ["inventory", "payment"]
+    assert calls[2:] == ["shipment", "email"]
+    assert elapsed < 0.09
+
+
+@pytest.mark.asyncio
+async def test_failed_dependency_skips_dependents(handler):
+    await handler.store(event=ReceiptEvent)
+    await handler.store(event=FailingPaymentEvent)
+
+    with pytest.raises(ValueError):
+        await handler._publish(run_at_once=True)
+
+    assert calls == []
+
+
+class AuditEvent(BaseEvent):
+    ORDER = 1
+    DEPENDS_ON = (PaymentEvent,)
+
+    async def run(self, parameter=None) -> None:
+        calls.append("audit")
+
+
+class MetricsEvent(BaseEvent):
+    ORDER = 1
+
+    async def run(self, parameter=None) -> None:
+        calls.append("metrics")
+
+
+@pytest.mark.asyncio
+async def test_run_sequentially_after_dependencies(handler):
+    await handler.store(event=EmailEvent)
+    await handler.store(event=ShipmentEvent)
+    await handler.store(event=PaymentEvent)
+    await handler.store(event=InventoryEvent)
+
+    await handler._publish(run_at_once=False)
+
+    assert calls == ["payment", "inventory", "shipment", "email"]
+
+
+@pytest.mark.asyncio
+async def test_run_sequentially_skips_dependents_of_failed_event(handler):
+    await handler.store(event=ReceiptEvent)
+    await handler.store(event=FailingPaymentEvent)
+
+    await handler._publish(run_at_once=False, on_error="isolate")
+
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_run_in_waves_after_dependencies(handler):
+    # `AuditEvent` has the lowest ORDER, but it waits for `PaymentEvent`
+    await handler.store(event=AuditEvent)
+    await handler.store(event=MetricsEvent)
+    await handler.store(event=PaymentEvent)
+
+    await handler._publish(waves=True)
+
+    assert calls == ["metrics", "payment", "audit"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_with_dependencies(handler):
+    dispatcher = EventDispatcher()
+    await dispatcher.start()
+    await handler.store(event=ShipmentEvent)
+    await handler.store(event=PaymentEvent)
+
+    with pytest.raises(UnsupportedDependencyException):
+        await handler._publish(dispatcher=dispatcher)
+
+    await dispatcher.stop(timeout=1)
+    assert calls == []
@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+
+from fastapi_event import BaseEvent, EventDispatcher, EventListener, event_handler
+from fastapi_event.exceptions import (
+    DispatcherNotRunningException,
+    EventQueueFullException,
+    InvalidOverflowPolicyException,
+)
+from tests.events import TestEventParameter
+
+
+class RecordEvent(BaseEvent):
+    calls = []
+
+    async def run(self, parameter=None) -> None:
+        await asyncio.sleep(0)
+        self.calls.append(parameter.content)
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    RecordEvent.calls = []
+    yield
+
+
+def make_events(*contents):
+    return [(RecordEvent, TestEventParameter(content=content)) for content in contents]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_and_drain_on_stop():
+    dispatcher = EventDispatcher(workers=2, queue_size=10)
+    await dispatcher.start()
+
+    await dispatcher.dispatch(events=make_events("a", "b", "c"))
+    await dispatcher.stop(timeout=1)
+
+    assert sorted(RecordEvent.calls) == ["a", "b", "c"]
+    assert dispatcher.is_running is False
+
+
+@pytest.mark.asyncio
+async def test_dispatch_with_not_running_exception():
+    dispatcher = EventDispatcher()
+
+    with pytest.raises(DispatcherNotRunningException):
+        await dispatcher.dispatch(events=make_events("a"))
+
+
+@pytest.mark.asyncio
+async def test_dispatch_with_reject_overflow():
+    dispatcher = EventDispatcher(workers=1, queue_size=1, overflow="reject")
+    await dispatcher.start()
+
+    with pytest.raises(EventQueueFullException):
+        await dispatcher.dispatch(events=make_events("a", "b"))
+    await dispatcher.stop(timeout=1)
+
+    assert RecordEvent.calls == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_with_drop_oldest_overflow():
+    dispatcher = EventDispatcher(workers=1, queue_size=2, overflow="drop_oldest")
+    await dispatcher.start()
+
+    await dispatcher.dispatch(events=make_events("a", "b", "c"))
+    assert dispatcher.qsize == 2
+    await dispatcher.stop(timeout=1)
+
+    assert RecordEvent.calls == ["b", "c"]
+
+
+def test_dispatcher_with_invalid_overflow_policy():
+    with pytest.raises(InvalidOverflowPolicyException):
+        EventDispatcher(overflow="ignore")
+
+
+@pytest.mark.asyncio
+async def test_listener_with_dispatcher():
+    dispatcher = EventDispatcher(workers=1)
+    await dispatcher.start()
+
+    @EventListener(dispatcher=dispatcher)
+    async def test():
+        await event_handler.store(
+            event=RecordEvent, parameter=TestEventParameter(content="content"),
+        )
+
+    with event_handler():
+        await test()
+        assert event_handler._get_event_handler().events == []
+
+    await dispatcher.stop(timeout=1)
+
+    assert RecordEvent.calls == ["content"]
+
+
+class BatchEvent(BaseEvent):
+    BATCH_MAX_SIZE = 3
+    BATCH_MAX_WAIT_MS = 10
+
+    batches = []
+
+    async def run(self, parameter=None) -> None:
+        raise NotImplementedError
+
+    async def batch_run(self, parameters) -> None:
+        self.batches.append([parameter.content for parameter in parameters])
+
+
+@pytest.mark.asyncio
+async def test_dispatch_batch_on_max_size():
+    BatchEvent.batches = []
+    dispatcher = EventDispatcher(workers=1)
+    await dispatcher.start()
+
+    for content in ("a", "b", "c", "d"):
+        await dispatcher.dispatch(
+            events=[(BatchEvent, TestEventParameter(content=content))],
+        )
+    await asyncio.sleep(0)
+    assert BatchEvent.batches == [["a", "b", "c"]]
+
+    await dispatcher.stop(timeout=1)
+    assert BatchEvent.batches == [["a", "b", "c"], ["d"]]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_batch_on_max_wait():
+    BatchEvent.batches = []
+    dispatcher = EventDispatcher(workers=1)
+    await dispatcher.start()
+
+    await dispatcher.dispatch(events=[(BatchEvent, TestEventParameter(content="a"))])
+    await dispatcher.dispatch(events=[(BatchEvent, TestEventParameter(content="b"))])
+    await asyncio.sleep(0.05)
+
+    assert BatchEvent.batches == [["a", "b"]]
+    await dispatcher.stop(timeout=1)
@@ -0,0 +1,137 @@
+import asyncio
+import sys
+import warnings
+
+import anyio
+import pytest
+
+from fastapi_event import BaseEvent, EventListener, eager
+from fastapi_event.eager import create_eager_task
+from fastapi_event.exceptions import EventExceptionGroup
+from fastapi_event.handler import EventHandler, EventHandlerValidator
+
+calls = []
+
+
+class CounterEvent(BaseEvent):
+    async def run(self, parameter=None) -> int:
+        calls.append(parameter["id"])
+        return parameter["id"]
+
+
+class SuspendingEvent(BaseEvent):
+    async def run(self, parameter=None) -> int:
+        await asyncio.sleep(0.01)
+        calls.append(parameter["id"])
+        return parameter["id"]
+
+
+class CancelScopeEvent(BaseEvent):
+    async def run(self, parameter=None) -> bool:
+        calls.append(asyncio.current_task())
+        with anyio.move_on_after(0.01) as scope:
+            await asyncio.sleep(1)
+        return scope.cancelled_caught
+
+
+class FailingEvent(BaseEvent):
+    async def run(self, parameter=None) -> None:
+        raise ValueError(parameter["id"])
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+@pytest.fixture
+def handler():
+    return EventHandler(validator=EventHandlerValidator())
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="eager tasks need 3.12+")
+@pytest.mark.asyncio
+async def test_coroutine_without_suspending_completes_inline():
+    async def add():
+        return 1 + 1
+
+    future = create_eager_task(add())
+
+    assert future.done()
+    assert future.result() == 2
+
+
+@pytest.mark.skipif(sys.version_info < (3, 12), reason="eager tasks need 3.12+")
+@pytest.mark.asyncio
+async def test_suspending_coroutine_becomes_task():
+    async def sleep():
+        calls.append("started")
+        await asyncio.sleep(0.01)
+        return "finished"
+
+    future = create_eager_task(sleep())
+
+    assert calls == ["started"]
+    assert not future.done()
+    assert await future == "finished"
+
+
+@pytest.mark.asyncio
+async def test_failed_and_cancelled_coroutine():
+    async def fail():
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        await create_eager_task(fail())
+
+    future = create_eager_task(asyncio.sleep(1))
+    await asyncio.sleep(0)
+    future.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await future
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 12), reason="warns only before 3.12")
+def test_listener_warns_once_without_eager_tasks(monkeypatch):
+    monkeypatch.setattr(eager, "_warned", False)
+
+    with pytest.warns(RuntimeWarning, match="no effect"):
+        EventListener(eager=True)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        EventListener(eager=True)
+
+
+@pytest.mark.asyncio
+async def test_publish_eagerly(handler):
+    await handler.store_many(event=CounterEvent, parameters=[{"id": 1}, {"id": 2}])
+    await handler.store(event=SuspendingEvent, parameter={"id": 3})
+
+    results = await handler.publish(eager=True)
+
+    assert [result.result for result in results] == [1, 2, 3]
+    assert calls == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_publish_eagerly_with_error_policy(handler):
+    await handler.store(event=CounterEvent, parameter={"id": 1})
+    await handler.store(event=FailingEvent, parameter={"id": 2})
+
+    with pytest.raises(EventExceptionGroup):
+        await handler._publish(eager=True, on_error="collect")
+
+    await handler.store(event=FailingEvent, parameter={"id": 3})
+    with pytest.raises(ValueError):
+        await handler._publish(eager=True)
+
+
+@pytest.mark.asyncio
+async def test_publish_eagerly_runs_event_in_its_own_task(handler):
+    await handler.store(event=CancelScopeEvent)
+
+    results = await handler.publish(eager=True)
+
+    assert results[0].result is True
+    assert calls[0] is not asyncio.current_task()
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from fastapi_event import BaseEvent, EventListener, event_handler
+from fastapi_event.exceptions import EventExceptionGroup, InvalidErrorPolicyException
+from fastapi_event.handler import EventHandler, EventHandlerValidator
+
+calls = []
+
+
+class SlowEvent(BaseEvent):
+    async def run(self, parameter=None) -> None:
+        calls.append("slow started")
+        await asyncio.sleep(0.05)
+        calls.append("slow finished")
+
+
+class FailingEvent(BaseEvent):
+    async def run(self, parameter=None) -> None:
+        raise ValueError(parameter["id"] if parameter else None)
+
+
+class ResultEvent(BaseEvent):
+    async def run(self, parameter=None) -> int:
+        return parameter["id"] * 2
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+@pytest.fixture
+def handler():
+    return EventHandler(validator=EventHandlerValidator())
+
+
+def test_invalid_error_policy():
+    with pytest.raises(InvalidErrorPolicyException):
+        EventListener(on_error="ignore")
+
+
+@pytest.mark.asyncio
+async def test_cancel_siblings_on_first_error(handler):
+    await handler.store(event=SlowEvent)
+    await handler.store(event=FailingEvent)
+
+    with pytest.raises(ValueError):
+        await handler._publish(on_error="cancel")
+
+    await asyncio.sleep(0.06)
+    assert calls == ["slow started"]
+
+
+@pytest.mark.asyncio
+async def test_collect_errors(handler):
+    await handler.store(event=SlowEvent)
+    await handler.store_many(event=FailingEvent, parameters=[{"id": 1}, {"id": 2}])
+
+    with pytest.raises(EventExceptionGroup) as e:
+        await handler._publish(on_error="collect")
+
+    assert sorted(str(error) for error in e.value.exceptions) == ["1", "2"]
+    assert calls == ["slow started", "slow finished"]
+    assert handler.events == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("run_at_once", [True, False])
+async def test_isolate_errors(handler, run_at_once, caplog):
+    await handler.store(event=FailingEvent)
+    await handler.store(event=SlowEvent)
+
+    await handler._publish(run_at_once=run_at_once, on_error="isolate")
+
+    assert calls == ["slow started", "slow finished"]
+    assert "FailingEvent failed" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_publish_returns_results(handler):
+    await handler.store(event=ResultEvent, parameter={"id": 1})
+    await handler.store(event=FailingEvent, parameter={"id": 2})
+    await handler.store(event=ResultEvent, parameter={"id": 3})
+
+    results = await handler.publish(on_error="isolate")
+
+    assert [result.result for result in results] == [2, None, 6]
+    assert [result.done for result in results] == [True, False, True]
+    assert isinstance(results[1].exception, ValueError)
+    assert results[2].parameter == {"id": 3}
+
+
+@pytest.mark.asyncio
+async def test_publish_with_event_handler():
+    with event_handler():
+        assert await event_handler.publish() == []
+
+        await event_handler.store(event=ResultEvent, parameter={"id": 2})
+        results = await event_handler.publish()
+
+    assert [result.result for result in results] == [4]
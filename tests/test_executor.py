@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+from fastapi_event import BaseEvent
+from fastapi_event.exceptions import InvalidExecutorException
+from fastapi_event.executor import EventExecutor
+from fastapi_event.handler import EventHandler, EventHandlerValidator
+from fastapi_event.registry import EventRegistry
+from fastapi_event.runner import EventRunner
+from tests.events import TestEventParameter, TestProcessEvent, TestSyncEvent
+
+
+@pytest.fixture
+def executor():
+    executor = EventExecutor(thread_workers=1, process_workers=1)
+    yield executor
+    executor.shutdown()
+
+
+def test_sync_event_defaults_to_thread_executor():
+    descriptor = EventRegistry().get(event=TestSyncEvent)
+
+    assert descriptor.executor == "thread"
+
+
+def test_invalid_executor():
+    class InvalidExecutorEvent(BaseEvent):
+        EXECUTOR = "gpu"
+
+        async def run(self, parameter=None) -> None:
+            pass
+
+    with pytest.raises(InvalidExecutorException):
+        EventRegistry().get(event=InvalidExecutorEvent)
+
+
+@pytest.mark.asyncio
+async def test_run_in_thread(executor):
+    runner = EventRunner(registry=EventRegistry(), executor=executor)
+
+    result = await runner.run(event=TestSyncEvent)
+
+    assert result.startswith("fastapi-event")
+
+
+@pytest.mark.asyncio
+async def test_run_in_process(executor):
+    runner = EventRunner(registry=EventRegistry(), executor=executor)
+
+    pid, content = await runner.run(
+        event=TestProcessEvent, parameter=TestEventParameter(content="content"),
+    )
+
+    assert pid != os.getpid()
+    assert content == "CONTENT"
+
+
+@pytest.mark.asyncio
+async def test_publish_raises_exception_from_process(executor):
+    registry = EventRegistry()
+    handler = EventHandler(
+        validator=EventHandlerValidator(registry=registry),
+        runner=EventRunner(registry=registry, executor=executor),
+    )
+    await handler.store(
+        event=TestProcessEvent, parameter=TestEventParameter(content="error"),
+    )
+
+    with pytest.raises(ValueError):
+        await handler._publish()
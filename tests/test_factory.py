@@ -0,0 +1,149 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from fastapi_event import BaseEvent, EventDispatcher
+from fastapi_event.base import DEDUP_KEEP_FIRST
+from fastapi_event.exceptions import (
+    InvalidParameterFactoryException,
+    InvalidParameterTypeException,
+)
+from fastapi_event.handler import EventHandler, EventHandlerValidator
+from fastapi_event.limiter import Throttle
+from fastapi_event.registry import EventRegistry
+from fastapi_event.scheduler import EventScheduler
+
+built = []
+calls = []
+
+
+def factory(id):
+    def build():
+        built.append(id)
+        return {"id": id}
+
+    return build
+
+
+class PayloadEvent(BaseEvent):
+    async def run(self, parameter=None) -> int:
+        calls.append(parameter["id"])
+        return parameter["id"]
+
+
+class FirstOnlyEvent(BaseEvent):
+    DEDUP = DEDUP_KEEP_FIRST
+
+    async def run(self, parameter=None) -> None:
+        calls.append(parameter["id"])
+
+
+class ThrottledEvent(BaseEvent):
+    LIMIT = Throttle(window=60)
+
+    async def run(self, parameter=None) -> None:
+        calls.append(parameter["id"])
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    built.clear()
+    calls.clear()
+
+
+@pytest_asyncio.fixture
+async def handler():
+    scheduler = EventScheduler()
+    await scheduler.start()
+    yield EventHandler(
+        validator=EventHandlerValidator(registry=EventRegistry()), scheduler=scheduler,
+    )
+    await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_build_parameter_when_event_runs(handler):
+    await handler.store(event=PayloadEvent, parameter_factory=factory(1))
+    assert built == []
+
+    results = await handler.publish()
+
+    assert built == [1]
+    assert results[0].result == 1
+    assert results[0].parameter == {"id": 1}
+
+
+@pytest.mark.asyncio
+async def test_build_parameter_with_coroutine(handler):
+    async def build():
+        await asyncio.sleep(0)
+        return {"id": 2}
+
+    await handler.store(event=PayloadEvent, parameter_factory=build)
+    await handler._publish()
+
+    assert calls == [2]
+
+
+@pytest.mark.asyncio
+async def test_skip_factory_of_skipped_events(handler):
+    await handler.store(event=FirstOnlyEvent, parameter_factory=factory(1))
+    await handler.store(event=FirstOnlyEvent, parameter_factory=factory(2))
+    await handler._publish()
+
+    for id in (3, 4):
+        await handler.store(event=ThrottledEvent, parameter_factory=factory(id))
+        await handler._publish()
+
+    cancelled = await handler.store(
+        event=PayloadEvent, parameter_factory=factory(5), delay=0.01,
+    )
+    cancelled.cancel()
+    await handler.store(event=PayloadEvent, parameter_factory=factory(6), delay=0.01)
+    await handler._publish()
+    await asyncio.sleep(0.03)
+
+    assert built == [1, 3, 6]
+    assert calls == [1, 3, 6]
+
+
+@pytest.mark.asyncio
+async def test_build_parameter_before_dispatch(handler):
+    dispatcher = EventDispatcher(workers=1)
+    await dispatcher.start()
+
+    await handler.store(event=PayloadEvent, parameter_factory=factory(1))
+    await handler._publish(dispatcher=dispatcher)
+    assert built == [1]
+
+    await dispatcher.stop(timeout=1)
+    assert calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_invalid_parameter_factory(handler):
+    with pytest.raises(InvalidParameterFactoryException):
+        await handler.store(
+            event=PayloadEvent, parameter={"id": 1}, parameter_factory=factory(1),
+        )
+
+    with pytest.raises(InvalidParameterFactoryException):
+        await handler.store(event=PayloadEvent, parameter_factory=1)
+
+
+@pytest.mark.asyncio
+async def test_validate_built_parameter(handler):
+    await handler.store(event=PayloadEvent, parameter_factory=lambda: 1)
+    with pytest.raises(InvalidParameterTypeException):
+        await handler._publish()
+
+
+@pytest.mark.asyncio
+async def test_trusted_parameter_factory(handler):
+    await handler.store(
+        event=PayloadEvent, parameter_factory=lambda: {"id": 1}, trusted=True,
+    )
+    await handler._publish()
+
+    assert calls == [1]
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Union, Type
 
 import pytest
@@ -10,6 +11,8 @@ from fastapi_event.exceptions import (
     ParameterCountException,
     RequiredParameterException,
 )
+from fastapi_event.handler import EventHandler, EventHandlerValidator
+from fastapi_event.registry import EventRegistry
 from tests.events import (
     TestSecondEvent,
     TestEventParameterNotNone,
@@ -47,8 +50,9 @@ async def test_store_without_parameter(app_with_middleware, client):
             event=TestEvent
         )
         handler = event_handler._get_event_handler()
-        assert TestEvent in handler.events
-        assert handler.events[TestEvent] is None
+        assert [(each.event, each.parameter) for each in handler.events] == [
+            (TestEvent, None),
+        ]
 
     @app.get("/")
     async def get():
@@ -70,10 +74,10 @@ async def test_multiple_store_without_parameter(app_with_middleware, client):
         )
         handler = event_handler._get_event_handler()
         assert len(handler.events) == 2
-        assert TestEvent in handler.events
-        assert TestSecondEvent in handler.events
-        assert handler.events[TestEvent] is None
-        assert handler.events[TestSecondEvent] is None
+        assert [(each.event, each.parameter) for each in handler.events] == [
+            (TestEvent, None),
+            (TestSecondEvent, None),
+        ]
 
     @app.get("/")
     async def get():
@@ -93,8 +97,8 @@ async def test_store_with_parameter(app_with_middleware, client):
         )
         handler = event_handler._get_event_handler()
         assert len(handler.events) == 1
-        assert TestEvent in handler.events
-        assert isinstance(handler.events[TestEvent], TestEventParameter)
+        assert handler.events[0].event == TestEvent
+        assert isinstance(handler.events[0].parameter, TestEventParameter)
 
     @app.get("/")
     async def get():
@@ -118,10 +122,10 @@ async def test_multiple_store_with_parameter(app_with_middleware, client):
         )
         handler = event_handler._get_event_handler()
         assert len(handler.events) == 2
-        assert TestEvent in handler.events
-        assert TestSecondEvent in handler.events
-        assert isinstance(handler.events[TestEvent], TestEventParameter)
-        assert isinstance(handler.events[TestSecondEvent], TestEventParameter)
+        assert handler.events[0].event == TestEvent
+        assert handler.events[1].event == TestSecondEvent
+        assert isinstance(handler.events[0].parameter, TestEventParameter)
+        assert isinstance(handler.events[1].parameter, TestEventParameter)
 
     @app.get("/")
     async def get():
@@ -210,17 +214,17 @@ async def test_order(app_with_middleware, client):
     async def test():
         await event_handler.store(event=FirstEvent)
         await event_handler.store(event=SecondEvent)
-        maps = await event_handler._get_event_handler()._get_sorted_event_maps()
+        buckets = event_handler._get_event_handler()._get_buckets()
 
-        assert maps.get(None) == []
+        assert len(buckets) == 2
 
-        assert len(maps.get(1)) == 1
-        assert maps.get(1)[0].event == FirstEvent
-        assert maps.get(1)[0].parameter is None
+        assert len(buckets[0]) == 1
+        assert buckets[0][0].event == FirstEvent
+        assert buckets[0][0].parameter is None
 
-        assert len(maps.get(2)) == 1
-        assert maps.get(2)[0].event == SecondEvent
-        assert maps.get(2)[0].parameter is None
+        assert len(buckets[1]) == 1
+        assert buckets[1][0].event == SecondEvent
+        assert buckets[1][0].parameter is None
 
     @app.get("/")
     async def test_get():
@@ -237,17 +241,17 @@ async def test_order_if_the_order_of_the_store_is_different(app_with_middleware,
     async def test():
         await event_handler.store(event=SecondEvent)
         await event_handler.store(event=FirstEvent)
-        maps = await event_handler._get_event_handler()._get_sorted_event_maps()
+        buckets = event_handler._get_event_handler()._get_buckets()
 
-        assert maps.get(None) == []
+        assert len(buckets) == 2
 
-        assert len(maps.get(1)) == 1
-        assert maps.get(1)[0].event == FirstEvent
-        assert maps.get(1)[0].parameter is None
+        assert len(buckets[0]) == 1
+        assert buckets[0][0].event == FirstEvent
+        assert buckets[0][0].parameter is None
 
-        assert len(maps.get(2)) == 1
-        assert maps.get(2)[0].event == SecondEvent
-        assert maps.get(2)[0].parameter is None
+        assert len(buckets[1]) == 1
+        assert buckets[1][0].event == SecondEvent
+        assert buckets[1][0].parameter is None
 
     @app.get("/")
     async def test_get():
@@ -265,18 +269,20 @@ async def test_order_with_none_order(app_with_middleware, client):
         await event_handler.store(event=FirstEvent)
         await event_handler.store(event=SecondEvent)
         await event_handler.store(event=NoneOrderEvent)
-        maps = await event_handler._get_event_handler()._get_sorted_event_maps()
+        buckets = event_handler._get_event_handler()._get_buckets()
 
-        assert maps.get(None)[0].event == NoneOrderEvent
-        assert maps.get(None)[0].parameter is None
+        assert len(buckets) == 3
 
-        assert len(maps.get(1)) == 1
-        assert maps.get(1)[0].event == FirstEvent
-        assert maps.get(1)[0].parameter is None
+        assert len(buckets[0]) == 1
+        assert buckets[0][0].event == FirstEvent
+        assert buckets[0][0].parameter is None
 
-        assert len(maps.get(2)) == 1
-        assert maps.get(2)[0].event == SecondEvent
-        assert maps.get(2)[0].parameter is None
+        assert len(buckets[1]) == 1
+        assert buckets[1][0].event == SecondEvent
+        assert buckets[1][0].parameter is None
+
+        assert buckets[2][0].event == NoneOrderEvent
+        assert buckets[2][0].parameter is None
 
     @app.get("/")
     async def test_get():
@@ -294,21 +300,264 @@ async def test_order_with_none_order_if_the_order_of_the_store_is_different(app_
         await event_handler.store(event=SecondEvent)
         await event_handler.store(event=FirstEvent)
         await event_handler.store(event=NoneOrderEvent)
-        maps = await event_handler._get_event_handler()._get_sorted_event_maps()
+        buckets = event_handler._get_event_handler()._get_buckets()
+
+        assert len(buckets) == 3
 
-        assert maps.get(None)[0].event == NoneOrderEvent
-        assert maps.get(None)[0].parameter is None
+        assert len(buckets[0]) == 1
+        assert buckets[0][0].event == FirstEvent
+        assert buckets[0][0].parameter is None
 
-        assert len(maps.get(1)) == 1
-        assert maps.get(1)[0].event == FirstEvent
-        assert maps.get(1)[0].parameter is None
+        assert len(buckets[1]) == 1
+        assert buckets[1][0].event == SecondEvent
+        assert buckets[1][0].parameter is None
 
-        assert len(maps.get(2)) == 1
-        assert maps.get(2)[0].event == SecondEvent
-        assert maps.get(2)[0].parameter is None
+        assert buckets[2][0].event == NoneOrderEvent
+        assert buckets[2][0].parameter is None
 
     @app.get("/")
     async def test_get():
         await test()
 
     client.get("/")
+
+
+@pytest.mark.asyncio
+async def test_publish_in_waves():
+    calls = []
+
+    class FirstWaveEvent(BaseEvent):
+        ORDER = 1
+
+        async def run(self, parameter=None) -> None:
+            await asyncio.sleep(0.01)
+            calls.append(("first", parameter.content))
+
+    class SecondWaveEvent(BaseEvent):
+        ORDER = 2
+
+        async def run(self, parameter=None) -> None:
+            calls.append(("second", parameter.content))
+
+    handler = EventHandler(validator=EventHandlerValidator())
+    await handler.store(event=SecondWaveEvent, parameter=TestEventParameter(content="b"))
+    await handler.store(event=FirstWaveEvent, parameter=TestEventParameter(content="a"))
+    await handler._publish(run_at_once=True, waves=True)
+
+    assert calls == [("first", "a"), ("second", "b")]
+    assert handler.events == []
+
+
+@pytest.mark.asyncio
+async def test_publish_with_concurrency():
+    running = []
+    peak = []
+
+    def make_event():
+        class ConcurrentEvent(BaseEvent):
+            async def run(self, parameter=None) -> None:
+                running.append(1)
+                peak.append(len(running))
+                await asyncio.sleep(0.01)
+                running.pop()
+
+        return ConcurrentEvent
+
+    handler = EventHandler(validator=EventHandlerValidator())
+    for _ in range(4):
+        await handler.store(event=make_event())
+    await handler._publish(run_at_once=True, concurrency=2)
+
+    assert len(peak) == 4
+    assert max(peak) == 2
+
+
+@pytest.mark.asyncio
+async def test_publish_with_event_timeout():
+    class SlowEvent(BaseEvent):
+        TIMEOUT = 0.01
+
+        async def run(self, parameter=None) -> None:
+            await asyncio.sleep(1)
+
+    handler = EventHandler(validator=EventHandlerValidator())
+    await handler.store(event=SlowEvent)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await handler._publish(run_at_once=False)
+
+
+@pytest.mark.asyncio
+async def test_publish_with_publish_timeout():
+    cancelled = []
+
+    class SlowEvent(BaseEvent):
+        async def run(self, parameter=None) -> None:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+    handler = EventHandler(validator=EventHandlerValidator())
+    await handler.store(event=SlowEvent)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await handler._publish(run_at_once=True, timeout=0.01)
+    assert cancelled == [True]
+
+
+@pytest.mark.asyncio
+async def test_publish_with_event_concurrency():
+    running = []
+    peak = []
+
+    class LimitedEvent(BaseEvent):
+        CONCURRENCY = 1
+
+        async def run(self, parameter=None) -> None:
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+    handlers = [EventHandler(validator=EventHandlerValidator()) for _ in range(3)]
+    for handler in handlers:
+        await handler.store(event=LimitedEvent)
+    await asyncio.gather(*[handler._publish() for handler in handlers])
+
+    assert peak == [1, 1, 1]
+
+
+def test_event_concurrency_in_new_event_loop():
+    peak = []
+    running = []
+
+    class LimitedEvent(BaseEvent):
+        CONCURRENCY = 1
+
+        async def run(self, parameter=None) -> None:
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+
+    registry = EventRegistry()
+
+    async def publish():
+        handlers = [
+            EventHandler(validator=EventHandlerValidator(registry=registry))
+            for _ in range(2)
+        ]
+        for handler in handlers:
+            await handler.store(event=LimitedEvent)
+        await asyncio.gather(*[handler._publish() for handler in handlers])
+
+    # Every app restart or TestClient runs in a new event loop
+    asyncio.run(publish())
+    asyncio.run(publish())
+
+    assert peak == [1, 1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_store_same_event_multiple_times():
+    calls = []
+
+    class RecordEvent(BaseEvent):
+        async def run(self, parameter=None) -> None:
+            calls.append(parameter.content)
+
+    handler = EventHandler(validator=EventHandlerValidator())
+    await handler.store(event=RecordEvent, parameter=TestEventParameter(content="a"))
+    await handler.store_many(
+        event=RecordEvent,
+        parameters=[TestEventParameter(content="b"), TestEventParameter(content="c")],
+    )
+    assert len(handler.events) == 3
+
+    await handler._publish(run_at_once=False)
+    assert calls == ["a", "b", "c"]
+    assert handler.events == []
+
+
+@pytest.mark.asyncio
+async def test_store_many_with_invalid_parameter_type_exception():
+    handler = EventHandler(validator=EventHandlerValidator())
+
+    with pytest.raises(InvalidParameterTypeException):
+        await handler.store_many(
+            event=TestEvent, parameters=[TestEventParameter(content="a"), "b"],
+        )
+    assert handler.events == []
+
+
+@pytest.mark.asyncio
+async def test_store_with_dedup_policy():
+    class KeepFirstEvent(BaseEvent):
+        DEDUP = "keep_first"
+
+        async def run(self, parameter=None) -> None:
+            ...
+
+    class KeepLastEvent(BaseEvent):
+        DEDUP = "keep_last"
+
+        async def run(self, parameter=None) -> None:
+            ...
+
+    handler = EventHandler(validator=EventHandlerValidator())
+    for content in ("a", "b"):
+        await handler.store(event=KeepFirstEvent, parameter=TestEventParameter(content=content))
+        await handler.store(event=KeepLastEvent, parameter=TestEventParameter(content=content))
+
+    assert [(each.event, each.parameter.content) for each in handler.events] == [
+        (KeepFirstEvent, "a"),
+        (KeepLastEvent, "b"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_run_with_stored_parameters():
+    batches = []
+
+    class BatchEvent(BaseEvent):
+        async def run(self, parameter=None) -> None:
+            raise NotImplementedError
+
+        async def batch_run(self, parameters) -> None:
+            batches.append([parameter.content for parameter in parameters])
+
+    handler = EventHandler(validator=EventHandlerValidator())
+    await handler.store(event=BatchEvent, parameter=TestEventParameter(content="a"))
+    await handler.store(event=TestEvent)
+    await handler.store(event=BatchEvent, parameter=TestEventParameter(content="b"))
+    assert len(handler.events) == 2
+
+    await handler._publish()
+    assert batches == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_publish_sequentially_by_order():
+    calls = []
+
+    def make_event(order):
+        class OrderedEvent(BaseEvent):
+            ORDER = order
+
+            async def run(self, parameter=None) -> None:
+                calls.append((order, parameter.content))
+
+        return OrderedEvent
+
+    handler = EventHandler(validator=EventHandlerValidator())
+    for order, content in ((3, "a"), (None, "b"), (1, "c"), (3, "d"), (2, "e")):
+        await handler.store(
+            event=make_event(order), parameter=TestEventParameter(content=content),
+        )
+    assert handler._orders == [1, 2, 3]
+
+    await handler._publish(run_at_once=False)
+
+    assert calls == [(1, "c"), (2, "e"), (3, "a"), (3, "d"), (None, "b")]
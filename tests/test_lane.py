@@ -0,0 +1,180 @@
+import asyncio
+
+import pytest
+
+from fastapi_event import BaseEvent, Lane, LaneDispatcher
+from fastapi_event.exceptions import (
+    EventQueueFullException,
+    InvalidLaneException,
+    InvalidLaneSettingException,
+    UnknownLaneException,
+)
+from fastapi_event.registry import EventRegistry
+
+calls = []
+
+
+class HighEvent(BaseEvent):
+    LANE = "high"
+
+    async def run(self, parameter=None) -> None:
+        calls.append(("high", parameter["id"]))
+
+
+class LowEvent(BaseEvent):
+    LANE = "low"
+
+    async def run(self, parameter=None) -> None:
+        calls.append(("low", parameter["id"]))
+
+
+class DefaultEvent(BaseEvent):
+    async def run(self, parameter=None) -> None:
+        calls.append(("default", parameter["id"]))
+
+
+class SlowEvent(BaseEvent):
+    LANE = "slow"
+    running = 0
+    max_running = 0
+
+    async def run(self, parameter=None) -> None:
+        SlowEvent.running += 1
+        SlowEvent.max_running = max(SlowEvent.max_running, SlowEvent.running)
+        await asyncio.sleep(0.01)
+        SlowEvent.running -= 1
+
+
+class UnknownLaneEvent(BaseEvent):
+    LANE = "unknown"
+
+    async def run(self, parameter=None) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+def make_events(event, count):
+    return [(event, {"id": id}) for id in range(count)]
+
+
+@pytest.mark.parametrize(
+    "lanes",
+    [
+        [Lane(name="high", weight=0)],
+        [Lane(name="high", queue_size=-1)],
+        [Lane(name="high", concurrency=0)],
+        [Lane(name="high", overflow="ignore")],
+        [Lane(name="high"), Lane(name="high")],
+    ],
+)
+def test_invalid_lane_setting(lanes):
+    with pytest.raises(InvalidLaneSettingException):
+        LaneDispatcher(lanes=lanes)
+
+
+def test_invalid_lane_of_event():
+    class InvalidLaneEvent(BaseEvent):
+        LANE = 1
+
+        async def run(self, parameter=None) -> None:
+            pass
+
+    with pytest.raises(InvalidLaneException):
+        EventRegistry().get(event=InvalidLaneEvent)
+
+
+@pytest.mark.asyncio
+async def test_weighted_fair_scheduling():
+    dispatcher = LaneDispatcher(
+        lanes=[Lane(name="high", weight=3), Lane(name="low", weight=1)], workers=1,
+    )
+    await dispatcher.start()
+
+    await dispatcher.dispatch(events=make_events(LowEvent, 8))
+    await dispatcher.dispatch(events=make_events(HighEvent, 6))
+    await dispatcher.stop(timeout=1)
+
+    lanes = [lane for lane, _ in calls]
+    assert lanes[:8].count("high") == 6
+    assert "low" in lanes[:4]
+    assert [id for lane, id in calls if lane == "low"] == list(range(8))
+
+
+@pytest.mark.asyncio
+async def test_depths_and_default_lane():
+    dispatcher = LaneDispatcher(lanes=[Lane(name="high")], workers=1)
+    await dispatcher.start()
+
+    await dispatcher.dispatch(events=make_events(HighEvent, 2))
+    await dispatcher.dispatch(events=make_events(DefaultEvent, 3))
+
+    assert dispatcher.depths() == {"high": 2, "default": 3}
+    assert dispatcher.qsize == 5
+
+    await dispatcher.stop(timeout=1)
+
+    assert dispatcher.depths() == {"high": 0, "default": 0}
+    assert len(calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_lane_concurrency():
+    dispatcher = LaneDispatcher(lanes=[Lane(name="slow", concurrency=2)], workers=4)
+    await dispatcher.start()
+
+    await dispatcher.dispatch(events=make_events(SlowEvent, 6))
+    await dispatcher.dispatch(events=make_events(DefaultEvent, 2))
+    await asyncio.sleep(0.005)
+
+    assert sorted(calls) == [("default", 0), ("default", 1)]
+    await dispatcher.stop(timeout=1)
+
+    assert SlowEvent.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_lane_overflow():
+    dispatcher = LaneDispatcher(
+        lanes=[
+            Lane(name="high", queue_size=1, overflow="reject"),
+            Lane(name="low", queue_size=2, overflow="drop_oldest"),
+        ],
+        workers=1,
+    )
+    await dispatcher.start()
+
+    await dispatcher.dispatch(events=make_events(LowEvent, 3))
+    with pytest.raises(EventQueueFullException):
+        await dispatcher.dispatch(events=make_events(HighEvent, 2))
+    await dispatcher.stop(timeout=1)
+
+    assert sorted(calls) == [("high", 0), ("low", 1), ("low", 2)]
+
+
+@pytest.mark.asyncio
+async def test_block_until_lane_has_room():
+    dispatcher = LaneDispatcher(lanes=[Lane(name="high", queue_size=1)], workers=1)
+    await dispatcher.start()
+
+    await dispatcher.dispatch(events=make_events(HighEvent, 3))
+    await dispatcher.stop(timeout=1)
+
+    assert calls == [("high", 0), ("high", 1), ("high", 2)]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_to_unknown_lane():
+    dispatcher = LaneDispatcher()
+    await dispatcher.start()
+
+    with pytest.raises(UnknownLaneException):
+        await dispatcher.dispatch(
+            events=make_events(DefaultEvent, 1) + make_events(UnknownLaneEvent, 1),
+        )
+    assert dispatcher.qsize == 0
+
+    await dispatcher.stop(timeout=1)
@@ -0,0 +1,123 @@
+import asyncio
+
+import pytest
+
+from fastapi_event import BaseEvent
+from fastapi_event.registry import EventRegistry
+from fastapi_event.runner import EventRunner
+from tests.events import TestEventParameter
+
+
+class SingletonEvent(BaseEvent):
+    SINGLETON = True
+    instances = []
+
+    def __init__(self):
+        self.started = 0
+        self.stopped = 0
+        self.runs = []
+        SingletonEvent.instances.append(self)
+
+    async def startup(self) -> None:
+        await asyncio.sleep(0.01)
+        self.started += 1
+
+    async def shutdown(self) -> None:
+        self.stopped += 1
+
+    async def run(self, parameter=None) -> None:
+        assert self.started == 1
+        self.runs.append(parameter.content)
+
+
+class FailingStartupEvent(BaseEvent):
+    SINGLETON = True
+    attempts = 0
+
+    async def startup(self) -> None:
+        FailingStartupEvent.attempts += 1
+        if FailingStartupEvent.attempts == 1:
+            raise ValueError("startup")
+
+    async def run(self, parameter=None) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def reset_instances():
+    SingletonEvent.instances = []
+    FailingStartupEvent.attempts = 0
+
+
+@pytest.mark.asyncio
+async def test_singleton_is_started_once_on_first_run():
+    runner = EventRunner(registry=EventRegistry())
+
+    await asyncio.gather(*[
+        runner.run(event=SingletonEvent, parameter=TestEventParameter(content=str(i)))
+        for i in range(5)
+    ])
+
+    assert len(SingletonEvent.instances) == 1
+    instance = SingletonEvent.instances[0]
+    assert instance.started == 1
+    assert sorted(instance.runs) == ["0", "1", "2", "3", "4"]
+
+
+def test_singleton_is_started_again_in_new_event_loop():
+    registry = EventRegistry()
+    runner = EventRunner(registry=registry)
+
+    async def run():
+        await runner.run(event=SingletonEvent, parameter=TestEventParameter(content="a"))
+
+    asyncio.run(run())
+    asyncio.run(run())
+    asyncio.run(registry.shutdown())
+
+    assert len(SingletonEvent.instances) == 2
+    assert [instance.stopped for instance in SingletonEvent.instances] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_startup_and_shutdown():
+    registry = EventRegistry()
+    runner = EventRunner(registry=registry)
+
+    await registry.startup(events=[SingletonEvent])
+    assert SingletonEvent.instances[0].started == 1
+
+    await runner.run(event=SingletonEvent, parameter=TestEventParameter(content="a"))
+    await registry.shutdown()
+
+    instance = SingletonEvent.instances[0]
+    assert instance.runs == ["a"]
+    assert instance.stopped == 1
+
+    await runner.run(event=SingletonEvent, parameter=TestEventParameter(content="b"))
+    assert len(SingletonEvent.instances) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_startup_is_retried_on_next_run():
+    runner = EventRunner(registry=EventRegistry())
+
+    with pytest.raises(ValueError):
+        await runner.run(event=FailingStartupEvent)
+
+    await runner.run(event=FailingStartupEvent)
+
+    assert FailingStartupEvent.attempts == 2
+
+
+def test_process_event_is_not_singleton():
+    class ProcessSingletonEvent(BaseEvent):
+        SINGLETON = True
+        EXECUTOR = "process"
+
+        def run(self, parameter=None) -> None:
+            pass
+
+    descriptor = EventRegistry().get(event=ProcessSingletonEvent)
+
+    assert descriptor.singleton is False
@@ -0,0 +1,150 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from fastapi_event import BaseEvent
+from fastapi_event.exceptions import InvalidLimitException, SchedulerNotRunningException
+from fastapi_event.handler import EventHandler, EventHandlerValidator
+from fastapi_event.limiter import Debounce, Limiter, RateLimit, Throttle
+from fastapi_event.registry import EventRegistry
+from fastapi_event.scheduler import EventScheduler
+
+calls = []
+
+
+def by_id(parameter):
+    return parameter["id"]
+
+
+class RateLimitedEvent(BaseEvent):
+    LIMIT = RateLimit(rate=2, per=60, key=by_id)
+
+    async def run(self, parameter=None) -> None:
+        calls.append(("rate", parameter["id"]))
+
+
+class ThrottledEvent(BaseEvent):
+    LIMIT = Throttle(window=0.05)
+
+    async def run(self, parameter=None) -> None:
+        calls.append(("throttle", parameter["id"]))
+
+
+class DebouncedEvent(BaseEvent):
+    LIMIT = Debounce(window=0.02, key=by_id)
+
+    async def run(self, parameter=None) -> None:
+        calls.append(("debounce", parameter["id"], parameter["version"]))
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+@pytest_asyncio.fixture
+async def handler():
+    scheduler = EventScheduler()
+    await scheduler.start()
+    yield EventHandler(
+        validator=EventHandlerValidator(registry=EventRegistry()), scheduler=scheduler,
+    )
+    await scheduler.stop()
+
+
+def test_rate_limit_refills():
+    limit = RateLimit(rate=1, per=1, burst=2)
+
+    allowed, state = limit.acquire(None, now=0)
+    assert allowed is True
+    allowed, state = limit.acquire(state, now=0)
+    assert allowed is True
+    allowed, state = limit.acquire(state, now=0.5)
+    assert allowed is False
+    allowed, state = limit.acquire(state, now=1.0)
+    assert allowed is True
+
+
+def test_limiter_is_bounded():
+    limiter = Limiter(limit=Throttle(window=60, key=by_id, max_keys=2))
+
+    for id in range(3):
+        assert limiter.acquire(parameter={"id": id}) is True
+
+    assert len(limiter) == 2
+    assert limiter.acquire(parameter={"id": 0}) is True
+    assert limiter.acquire(parameter={"id": 2}) is False
+
+
+@pytest.mark.parametrize(
+    "limit", [RateLimit(rate=0), Throttle(window=-1), Debounce(window=1, max_keys=0), 1],
+)
+def test_invalid_limit(limit):
+    class InvalidLimitEvent(BaseEvent):
+        LIMIT = limit
+
+        async def run(self, parameter=None) -> None:
+            pass
+
+    with pytest.raises(InvalidLimitException):
+        EventRegistry().get(event=InvalidLimitEvent)
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_per_key(handler):
+    for _ in range(2):
+        for id in (1, 1, 2):
+            await handler.store(event=RateLimitedEvent, parameter={"id": id})
+        await handler._publish()
+
+    assert sorted(calls) == [("rate", 1), ("rate", 1), ("rate", 2), ("rate", 2)]
+
+
+@pytest.mark.asyncio
+async def test_throttle(handler):
+    for id in range(3):
+        await handler.store(event=ThrottledEvent, parameter={"id": id})
+        await handler._publish()
+
+    await asyncio.sleep(0.06)
+    await handler.store(event=ThrottledEvent, parameter={"id": 3})
+    await handler._publish()
+
+    assert calls == [("throttle", 0), ("throttle", 3)]
+
+
+@pytest.mark.asyncio
+async def test_debounce_runs_last_parameter(handler):
+    for version in range(3):
+        await handler.store(event=DebouncedEvent, parameter={"id": 1, "version": version})
+        await handler.store(event=DebouncedEvent, parameter={"id": 2, "version": version})
+        await handler._publish()
+
+    assert calls == []
+    assert handler.scheduler.pending == 2
+
+    await asyncio.sleep(0.05)
+
+    assert sorted(calls) == [("debounce", 1, 2), ("debounce", 2, 2)]
+
+
+@pytest.mark.asyncio
+async def test_debounce_without_running_scheduler():
+    scheduler = EventScheduler()
+    handler = EventHandler(
+        validator=EventHandlerValidator(registry=EventRegistry()), scheduler=scheduler,
+    )
+
+    with pytest.raises(SchedulerNotRunningException):
+        await handler.store(event=DebouncedEvent, parameter={"id": 1, "version": 0})
+
+    await scheduler.start()
+    await handler.store(event=ThrottledEvent, parameter={"id": 1})
+    await handler.store(event=DebouncedEvent, parameter={"id": 1, "version": 0})
+    await scheduler.stop()
+
+    # Stopped after storing: nothing stored is lost
+    with pytest.raises(SchedulerNotRunningException):
+        await handler._publish()
+    assert len(handler.events) == 2
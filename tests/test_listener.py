@@ -1,6 +1,8 @@
 import pytest
 
 from fastapi_event import EventListener, event_handler, BaseEvent
+from fastapi_event.exceptions import InvalidDispatchModeException
+from fastapi_event.handler import EventHandler, EventHandlerValidator
 from tests.events import TestEvent, TestEventParameter
 
 GLOBAL_VAR = 0
@@ -19,9 +21,9 @@ async def test_listener_is_publish_works_well(app_with_middleware, client):
 
     @app.get("/")
     async def test_get():
-        assert event_handler._get_event_handler().events == {}
+        assert event_handler._get_event_handler().events == []
         await test()
-        assert event_handler._get_event_handler().events == {}
+        assert event_handler._get_event_handler().events == []
 
     client.get("/")
 
@@ -44,9 +46,9 @@ async def test_listener_is_event_emitted_well(app_with_middleware, client):
     @app.get("/")
     async def test_get():
         global GLOBAL_VAR
-        assert event_handler._get_event_handler().events == {}
+        assert event_handler._get_event_handler().events == []
         await test()
-        assert event_handler._get_event_handler().events == {}
+        assert event_handler._get_event_handler().events == []
         assert GLOBAL_VAR == 1
 
     client.get("/")
@@ -65,8 +67,69 @@ async def test_listener_run_at_once(app_with_middleware, client):
 
     @app.get("/")
     async def test_get():
-        assert event_handler._get_event_handler().events == {}
+        assert event_handler._get_event_handler().events == []
         await test()
-        assert event_handler._get_event_handler().events == {}
+        assert event_handler._get_event_handler().events == []
 
     client.get("/")
+
+
+@pytest.mark.asyncio
+async def test_listener_dispatch_after_response(app_with_middleware, client):
+    app = app_with_middleware
+    calls = []
+
+    class TestEventThatRecordCall(BaseEvent):
+        async def run(self, parameter=None) -> None:
+            calls.append(parameter.content)
+
+    @EventListener(dispatch="after_response")
+    async def test():
+        await event_handler.store(
+            event=TestEventThatRecordCall,
+            parameter=TestEventParameter(content="content"),
+        )
+
+    @app.get("/")
+    async def test_get():
+        await test()
+        handler = event_handler._get_event_handler()
+        assert handler.events == []
+        assert len(handler.deferred) == 1
+        assert calls == []
+        return "ok"
+
+    response = client.get("/")
+
+    assert response.json() == "ok"
+    assert calls == ["content"]
+
+
+@pytest.mark.asyncio
+async def test_failed_deferred_publish_does_not_drop_others(caplog):
+    calls = []
+
+    class FailingDeferredEvent(BaseEvent):
+        async def run(self, parameter=None) -> None:
+            raise ValueError("deferred")
+
+    class RecordDeferredEvent(BaseEvent):
+        async def run(self, parameter=None) -> None:
+            calls.append("recorded")
+
+    handler = EventHandler(validator=EventHandlerValidator())
+    await handler.store(event=FailingDeferredEvent)
+    handler._defer()
+    await handler.store(event=RecordDeferredEvent)
+    handler._defer()
+
+    await handler._publish_deferred()
+
+    assert calls == ["recorded"]
+    assert handler.deferred == []
+    assert "Deferred events failed" in caplog.text
+
+
+def test_listener_with_invalid_dispatch_mode():
+    with pytest.raises(InvalidDispatchModeException):
+        EventListener(dispatch="later")
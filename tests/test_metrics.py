@@ -0,0 +1,88 @@
+import pytest
+
+from fastapi_event import BaseEvent, EventDispatcher
+from fastapi_event.handler import EventHandler, EventHandlerValidator
+from fastapi_event.metrics import (
+    PrometheusMetricsSink,
+    get_metrics_sink,
+    set_metrics_sink,
+)
+from tests.events import TestEventParameter
+
+
+class MetricsEvent(BaseEvent):
+    NAME = "metrics.event"
+
+    async def run(self, parameter=None) -> None:
+        if parameter and parameter.content == "error":
+            raise ValueError(parameter.content)
+
+
+@pytest.fixture
+def sink():
+    sink = PrometheusMetricsSink(buckets=(0.1, 1.0))
+    set_metrics_sink(sink)
+    yield sink
+    set_metrics_sink(None)
+
+
+@pytest.mark.asyncio
+async def test_record_store_run_and_publish(sink):
+    handler = EventHandler(validator=EventHandlerValidator())
+    await handler.store(event=MetricsEvent)
+    await handler.store_many(
+        event=MetricsEvent, parameters=[TestEventParameter(content="error")],
+    )
+
+    with pytest.raises(ValueError):
+        await handler._publish()
+
+    assert sink.stored == {"metrics.event": 2}
+    assert sink.runs == {"metrics.event": 2}
+    assert sink.failures == {"metrics.event": 1}
+    assert sink.run_durations["metrics.event"].count == 2
+    assert sink.publish_duration.count == 1
+
+
+@pytest.mark.asyncio
+async def test_record_queue_depth(sink):
+    dispatcher = EventDispatcher(workers=1, name="events")
+    await dispatcher.start()
+    await dispatcher.dispatch(events=[(MetricsEvent, None), (MetricsEvent, None)])
+
+    assert sink.queue_depths == {"events": 2}
+
+    await dispatcher.stop(timeout=1)
+    assert sink.queue_depths == {"events": 0}
+
+
+def test_render(sink):
+    sink.record_store(event="metrics.event")
+    sink.record_run(event="metrics.event", duration=0.5)
+    sink.record_publish(duration=0.05)
+
+    text = sink.render()
+
+    assert 'fastapi_event_stored_total{event="metrics.event"} 1' in text
+    assert 'fastapi_event_runs_total{event="metrics.event"} 1' in text
+    assert 'fastapi_event_run_duration_seconds_bucket{event="metrics.event",le="0.1"} 0' in text
+    assert 'fastapi_event_run_duration_seconds_bucket{event="metrics.event",le="1.0"} 1' in text
+    assert 'fastapi_event_run_duration_seconds_bucket{event="metrics.event",le="+Inf"} 1' in text
+    assert 'fastapi_event_run_duration_seconds_sum{event="metrics.event"} 0.5' in text
+    assert 'fastapi_event_publish_duration_seconds_bucket{le="0.1"} 1' in text
+    assert "fastapi_event_publish_duration_seconds_count 1" in text
+
+
+def test_mount_metrics_app(sink, app, client):
+    app.mount("/metrics", sink.app)
+    sink.record_store(event="metrics.event")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'fastapi_event_stored_total{event="metrics.event"} 1' in response.text
+
+
+def test_disabled_by_default():
+    assert get_metrics_sink() is None
@@ -1,6 +1,9 @@
+import pytest
 from fastapi import FastAPI
+from fastapi.testclient import TestClient
 
-from fastapi_event import EventHandlerMiddleware
+from fastapi_event import EventHandlerMiddleware, event_handler
+from fastapi_event.exceptions import EmptyContextException
 
 
 def test_init(app: FastAPI):
@@ -20,7 +23,11 @@ def test_middleware_set_context_properly(app_with_middleware, client):
     @app.get("/")
     async def test_get():
         from fastapi_event.handler import EventHandler, _handler_context  # noqa
-        assert isinstance(_handler_context.get(), EventHandler)
+        assert _handler_context.get() is not None
+        assert _handler_context.get().handler is None
+
+        assert isinstance(event_handler._get_event_handler(), EventHandler)
+        assert _handler_context.get().handler is not None
 
     client.get("/")
 
@@ -32,3 +39,46 @@ def test_middleware_does_not_set_context(app, client):
         assert _handler_context.get() is None
 
     client.get("/")
+
+
+def test_middleware_with_include_and_exclude(app: FastAPI):
+    app.add_middleware(
+        EventHandlerMiddleware, include=["/api/*"], exclude=["/api/health"],
+    )
+
+    @app.get("/api/users")
+    async def users():
+        from fastapi_event.handler import _handler_context  # noqa
+        return _handler_context.get() is not None
+
+    @app.get("/api/health")
+    async def health():
+        from fastapi_event.handler import _handler_context  # noqa
+        return _handler_context.get() is not None
+
+    @app.get("/static/file")
+    async def static():
+        with pytest.raises(EmptyContextException):
+            event_handler._get_event_handler()
+        return False
+
+    with TestClient(app) as client:
+        assert client.get("/api/users").json() is True
+        assert client.get("/api/health").json() is False
+        assert client.get("/static/file").json() is False
+
+
+@pytest.mark.asyncio
+async def test_middleware_skips_scope_types():
+    scopes = []
+
+    async def inner_app(scope, receive, send):
+        from fastapi_event.handler import _handler_context  # noqa
+        scopes.append((scope["type"], _handler_context.get() is not None))
+
+    middleware = EventHandlerMiddleware(inner_app, scope_types=("http",))
+    await middleware({"type": "lifespan"}, None, None)
+    await middleware({"type": "websocket", "path": "/"}, None, None)
+    await middleware({"type": "http", "path": "/"}, None, None)
+
+    assert scopes == [("lifespan", False), ("websocket", False), ("http", True)]
@@ -0,0 +1,172 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from fastapi_event import BaseEvent, EventListener, event_handler
+from fastapi_event.outbox import OutboxWorker, SQLiteOutbox
+from fastapi_event.resilience import RetryPolicy
+from tests.events import TestEventParameter
+
+
+class OutboxEvent(BaseEvent):
+    calls = []
+
+    async def run(self, parameter=None) -> None:
+        if parameter.content == "error":
+            raise ValueError(parameter.content)
+
+        self.calls.append(parameter.content)
+
+
+class NamedOutboxEvent(BaseEvent):
+    NAME = "outbox.named"
+    calls = []
+
+    async def run(self, parameter=None) -> None:
+        self.calls.append(parameter)
+
+
+class RetriedOutboxEvent(BaseEvent):
+    RETRY = RetryPolicy(max_attempts=2, backoff=0, jitter=False)
+    calls = 0
+
+    async def run(self, parameter=None) -> None:
+        RetriedOutboxEvent.calls += 1
+        raise ValueError("broken")
+
+
+@pytest_asyncio.fixture
+async def outbox(tmp_path):
+    OutboxEvent.calls = []
+    NamedOutboxEvent.calls = []
+    outbox = SQLiteOutbox(path=str(tmp_path / "outbox.db"))
+    yield outbox
+    await outbox.close()
+
+
+@pytest.mark.asyncio
+async def test_dispatch_and_drain(outbox):
+    await outbox.dispatch(
+        events=[
+            (OutboxEvent, TestEventParameter(content="a")),
+            (NamedOutboxEvent, None),
+            (OutboxEvent, TestEventParameter(content="b")),
+        ],
+    )
+    assert await outbox.count() == 3
+
+    rows = await outbox.fetch()
+    assert [row.event for row in rows] == [
+        "tests.test_outbox.OutboxEvent",
+        "outbox.named",
+        "tests.test_outbox.OutboxEvent",
+    ]
+
+    processed = await OutboxWorker(outbox=outbox).run_once()
+
+    assert processed == 3
+    assert OutboxEvent.calls == ["a", "b"]
+    assert NamedOutboxEvent.calls == [None]
+    assert await outbox.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_drain_keeps_failed_rows(outbox):
+    await outbox.dispatch(
+        events=[
+            (OutboxEvent, TestEventParameter(content="error")),
+            (OutboxEvent, TestEventParameter(content="a")),
+        ],
+    )
+    worker = OutboxWorker(outbox=outbox, max_attempts=1)
+
+    assert await worker.run_once() == 2
+    assert OutboxEvent.calls == ["a"]
+    rows = await outbox.fetch()
+    assert len(rows) == 1
+    assert rows[0].attempts == 1
+
+    assert await worker.run_once() == 0
+
+
+@pytest.mark.asyncio
+async def test_drain_keeps_rows_of_failed_retries(outbox):
+    await outbox.dispatch(events=[(RetriedOutboxEvent, None)])
+
+    await OutboxWorker(outbox=outbox).run_once()
+
+    assert RetriedOutboxEvent.calls == 2
+    assert await outbox.count() == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_start_and_stop(outbox):
+    await outbox.dispatch(events=[(OutboxEvent, TestEventParameter(content="a"))])
+    worker = OutboxWorker(outbox=outbox, interval=0.01)
+
+    await worker.start()
+    await asyncio.sleep(0.05)
+    await worker.stop(timeout=1)
+
+    assert OutboxEvent.calls == ["a"]
+    assert await outbox.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_listener_with_outbox(outbox):
+    @EventListener(dispatcher=outbox)
+    async def test():
+        await event_handler.store(
+            event=OutboxEvent, parameter=TestEventParameter(content="content"),
+        )
+
+    with event_handler():
+        await test()
+
+    assert OutboxEvent.calls == []
+    assert await outbox.count() == 1
+
+
+@pytest.mark.asyncio
+async def test_failing_rows_do_not_block_newer_rows(outbox):
+    await outbox.dispatch(
+        events=[(OutboxEvent, TestEventParameter(content="error"))] * 3
+        + [(OutboxEvent, TestEventParameter(content="a"))],
+    )
+    worker = OutboxWorker(outbox=outbox, chunk_size=3, max_attempts=None)
+
+    assert await worker.run_once() == 3
+    assert OutboxEvent.calls == []
+
+    assert await worker.run_once() == 3
+    assert OutboxEvent.calls == ["a"]
+    assert await outbox.count() == 3
+
+
+@pytest.mark.asyncio
+async def test_worker_waits_after_failed_chunk(outbox):
+    await outbox.dispatch(
+        events=[(OutboxEvent, TestEventParameter(content="error"))] * 3,
+    )
+    worker = OutboxWorker(outbox=outbox, chunk_size=3, interval=1, max_attempts=None)
+
+    await worker.start()
+    await asyncio.sleep(0.05)
+    await worker.stop(timeout=1)
+
+    rows = await outbox.fetch()
+    assert [row.attempts for row in rows] == [1, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_worker_stops_after_max_attempts(outbox):
+    await outbox.dispatch(events=[(OutboxEvent, TestEventParameter(content="error"))])
+    worker = OutboxWorker(outbox=outbox)
+
+    for _ in range(6):
+        await worker.run_once()
+
+    rows = await outbox.fetch()
+    assert rows[0].attempts == 5
+    assert await worker.run_once() == 0
@@ -0,0 +1,129 @@
+import pytest
+from pydantic import BaseModel
+
+from fastapi_event import BaseEvent
+from fastapi_event.exceptions import (
+    InvalidBatchSettingException,
+    InvalidEventTypeException,
+    InvalidOrderTypeException,
+    InvalidParameterTypeException,
+    ParameterCountException,
+)
+from fastapi_event.handler import EventHandlerValidator
+from fastapi_event.registry import EventRegistry
+from tests.events import (
+    TestEvent,
+    TestEventDoNotHaveParameter,
+    TestEventParameter,
+    TestEventParameterNotNone,
+)
+
+
+class OrderedEvent(BaseEvent):
+    ORDER = 3
+
+    async def run(self, parameter=None) -> None:
+        pass
+
+
+class InvalidOrderEvent(BaseEvent):
+    ORDER = "1"
+
+    async def run(self, parameter=None) -> None:
+        pass
+
+
+class TypedParameterEvent(BaseEvent):
+    async def run(self, parameter: TestEventParameter = None) -> None:
+        pass
+
+
+def test_get_compiles_once():
+    registry = EventRegistry()
+
+    descriptor = registry.get(event=TestEvent)
+
+    assert registry.get(event=TestEvent) is descriptor
+
+
+def test_get_descriptor():
+    registry = EventRegistry()
+
+    descriptor = registry.get(event=OrderedEvent)
+    assert descriptor.event is OrderedEvent
+    assert descriptor.parameter_count == 2
+    assert descriptor.parameter_required is False
+    assert descriptor.parameter_type is None
+    assert descriptor.order == 3
+
+    descriptor = registry.get(event=TestEventParameterNotNone)
+    assert descriptor.parameter_required is True
+    assert descriptor.order is None
+
+    descriptor = registry.get(event=TypedParameterEvent)
+    assert descriptor.parameter_type is TestEventParameter
+
+
+def test_get_with_invalid_event():
+    registry = EventRegistry()
+
+    class Event:
+        pass
+
+    with pytest.raises(InvalidEventTypeException):
+        registry.get(event=Event)
+
+    with pytest.raises(ParameterCountException):
+        registry.get(event=TestEventDoNotHaveParameter)
+
+    with pytest.raises(InvalidOrderTypeException):
+        registry.get(event=InvalidOrderEvent)
+
+
+def test_warm():
+    registry = EventRegistry()
+
+    descriptors = registry.warm(events=[TestEvent, OrderedEvent])
+
+    assert [descriptor.event for descriptor in descriptors] == [
+        TestEvent,
+        OrderedEvent,
+    ]
+    assert registry.get(event=TestEvent) is descriptors[0]
+
+    with pytest.raises(ParameterCountException):
+        registry.warm(events=[TestEvent, TestEventDoNotHaveParameter])
+
+
+@pytest.mark.asyncio
+async def test_validate_with_annotated_parameter_type():
+    class OtherParameter(TestEventParameter):
+        pass
+
+    validator = EventHandlerValidator(registry=EventRegistry())
+    await validator.validate(
+        event=TypedParameterEvent, parameter=OtherParameter(content="content"),
+    )
+
+    class UnrelatedParameter(BaseModel):
+        content: str
+
+    with pytest.raises(InvalidParameterTypeException):
+        await validator.validate(
+            event=TypedParameterEvent,
+            parameter=UnrelatedParameter(content="content"),
+        )
+
+
+def test_get_with_invalid_batch_setting():
+    class InvalidBatchEvent(BaseEvent):
+        BATCH_MAX_SIZE = 0
+
+        async def run(self, parameter=None) -> None:
+            pass
+
+        async def batch_run(self, parameters) -> None:
+            pass
+
+    with pytest.raises(InvalidBatchSettingException):
+        EventRegistry().get(event=InvalidBatchEvent)
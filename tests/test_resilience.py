@@ -0,0 +1,172 @@
+import asyncio
+
+import pytest
+
+from fastapi_event import BaseEvent
+from fastapi_event.exceptions import (
+    CircuitOpenException,
+    InvalidCircuitBreakerException,
+    InvalidRetryPolicyException,
+)
+from fastapi_event.registry import EventRegistry
+from fastapi_event.resilience import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    CircuitBreakerPolicy,
+    RetryPolicy,
+)
+from fastapi_event.handler import EventHandler, EventHandlerValidator
+from fastapi_event.runner import RETRY_SCHEDULED, SKIPPED, EventRunner
+
+
+class FlakyEvent(BaseEvent):
+    RETRY = RetryPolicy(max_attempts=3, backoff=0.01, jitter=False)
+    calls = 0
+
+    async def run(self, parameter=None) -> None:
+        FlakyEvent.calls += 1
+        if FlakyEvent.calls < 3:
+            raise ValueError("flaky")
+
+
+class BrokenEvent(BaseEvent):
+    CIRCUIT_BREAKER = CircuitBreakerPolicy(failure_threshold=2, recovery_timeout=0.05)
+    calls = 0
+    fail = True
+
+    async def run(self, parameter=None) -> None:
+        BrokenEvent.calls += 1
+        if BrokenEvent.fail:
+            raise ValueError("broken")
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    FlakyEvent.calls = 0
+    BrokenEvent.calls = 0
+    BrokenEvent.fail = True
+
+
+def test_retry_delay():
+    policy = RetryPolicy(backoff=0.1, max_backoff=0.3, jitter=False)
+
+    assert [policy.get_delay(attempt=attempt) for attempt in (2, 3, 4)] == [0.1, 0.2, 0.3]
+    assert 0 <= RetryPolicy(backoff=0.1).get_delay(attempt=3) <= 0.2
+
+
+@pytest.mark.parametrize("policy", ["retry", RetryPolicy(max_attempts=0)])
+def test_invalid_retry_policy(policy):
+    class InvalidRetryEvent(BaseEvent):
+        RETRY = policy
+
+        async def run(self, parameter=None) -> None:
+            pass
+
+    with pytest.raises(InvalidRetryPolicyException):
+        EventRegistry().get(event=InvalidRetryEvent)
+
+
+def test_invalid_circuit_breaker():
+    class InvalidBreakerEvent(BaseEvent):
+        CIRCUIT_BREAKER = CircuitBreakerPolicy(failure_threshold=0)
+
+        async def run(self, parameter=None) -> None:
+            pass
+
+    with pytest.raises(InvalidCircuitBreakerException):
+        EventRegistry().get(event=InvalidBreakerEvent)
+
+
+@pytest.mark.asyncio
+async def test_retry_in_background():
+    runner = EventRunner(registry=EventRegistry())
+
+    assert await runner.run(event=FlakyEvent) is RETRY_SCHEDULED
+
+    assert FlakyEvent.calls == 1
+    assert runner.pending_retries == 1
+
+    await runner.wait_retries(timeout=1)
+
+    assert FlakyEvent.calls == 3
+    assert runner.pending_retries == 0
+
+
+@pytest.mark.asyncio
+async def test_retry_inline():
+    runner = EventRunner(registry=EventRegistry())
+
+    assert await runner.run(event=FlakyEvent, retry_inline=True) is None
+    assert FlakyEvent.calls == 3
+    assert runner.pending_retries == 0
+
+    class AlwaysFailingEvent(BaseEvent):
+        RETRY = RetryPolicy(max_attempts=2, backoff=0, jitter=False)
+
+        async def run(self, parameter=None) -> None:
+            raise ValueError("broken")
+
+    with pytest.raises(ValueError):
+        await runner.run(event=AlwaysFailingEvent, retry_inline=True)
+
+
+@pytest.mark.asyncio
+async def test_publish_reports_scheduled_retry_as_not_done():
+    registry = EventRegistry()
+    handler = EventHandler(
+        validator=EventHandlerValidator(registry=registry),
+        runner=EventRunner(registry=registry),
+    )
+    await handler.store(event=FlakyEvent)
+
+    results = await handler.publish()
+
+    assert results[0].done is False
+    assert results[0].exception is None
+    await handler.runner.wait_retries(timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_opens_and_recovers():
+    registry = EventRegistry()
+    runner = EventRunner(registry=registry)
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            await runner.run(event=BrokenEvent)
+
+    breaker = registry.get_circuit_breakers()[registry.get(event=BrokenEvent).name]
+    assert breaker.state == CIRCUIT_OPEN
+
+    with pytest.raises(CircuitOpenException):
+        await runner.run(event=BrokenEvent)
+    assert BrokenEvent.calls == 2
+
+    await asyncio.sleep(0.06)
+    assert breaker.state == CIRCUIT_HALF_OPEN
+
+    BrokenEvent.fail = False
+    await runner.run(event=BrokenEvent)
+
+    assert BrokenEvent.calls == 3
+    assert breaker.state == CIRCUIT_CLOSED
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_skips_without_fail_fast():
+    class SkippedEvent(BaseEvent):
+        CIRCUIT_BREAKER = CircuitBreakerPolicy(failure_threshold=1, fail_fast=False)
+        calls = 0
+
+        async def run(self, parameter=None) -> None:
+            SkippedEvent.calls += 1
+            raise ValueError("broken")
+
+    runner = EventRunner(registry=EventRegistry())
+
+    with pytest.raises(ValueError):
+        await runner.run(event=SkippedEvent)
+
+    assert await runner.run(event=SkippedEvent) is SKIPPED
+    assert SkippedEvent.calls == 1
@@ -0,0 +1,139 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+import pytest_asyncio
+
+from fastapi_event import BaseEvent
+from fastapi_event.exceptions import (
+    InvalidScheduleException,
+    SchedulerNotRunningException,
+)
+from fastapi_event.handler import EventHandler, EventHandlerValidator
+from fastapi_event.scheduler import EventScheduler
+
+
+class ReminderEvent(BaseEvent):
+    calls = []
+
+    async def run(self, parameter=None) -> None:
+        ReminderEvent.calls.append(parameter["id"])
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    ReminderEvent.calls = []
+
+
+@pytest_asyncio.fixture
+async def scheduler():
+    scheduler = EventScheduler()
+    await scheduler.start()
+    yield scheduler
+    await scheduler.stop()
+
+
+@pytest.mark.asyncio
+async def test_run_in_order_of_time(scheduler):
+    handles = [
+        scheduler.create(event=ReminderEvent, parameter={"id": id}, delay=delay)
+        for id, delay in ((1, 0.04), (2, 0.01), (3, 0.02))
+    ]
+    scheduler.schedule(handles=handles)
+    assert scheduler.pending == 3
+
+    await asyncio.sleep(0.08)
+
+    assert ReminderEvent.calls == [2, 3, 1]
+    assert scheduler.pending == 0
+    assert all(handle.done for handle in handles)
+
+
+@pytest.mark.asyncio
+async def test_earlier_event_wakes_up_scheduler(scheduler):
+    scheduler.schedule(
+        handles=[scheduler.create(event=ReminderEvent, parameter={"id": 1}, delay=10)],
+    )
+    await asyncio.sleep(0)
+    scheduler.schedule(
+        handles=[scheduler.create(event=ReminderEvent, parameter={"id": 2}, delay=0.01)],
+    )
+
+    await asyncio.sleep(0.05)
+
+    assert ReminderEvent.calls == [2]
+    assert scheduler.pending == 1
+
+
+@pytest.mark.asyncio
+async def test_cancel(scheduler):
+    handles = [
+        scheduler.create(event=ReminderEvent, parameter={"id": id}, delay=0.01)
+        for id in range(100)
+    ]
+    scheduler.schedule(handles=handles)
+    for handle in handles[1:]:
+        assert handle.cancel() is True
+
+    assert scheduler.pending == 1
+    await asyncio.sleep(0.05)
+
+    assert ReminderEvent.calls == [0]
+    assert handles[0].cancel() is False
+
+
+@pytest.mark.asyncio
+async def test_stop_drops_pending_events():
+    scheduler = EventScheduler()
+    await scheduler.start()
+    handle = scheduler.create(event=ReminderEvent, parameter={"id": 1}, delay=0.01)
+    scheduler.schedule(handles=[handle])
+
+    await scheduler.stop()
+
+    assert scheduler.pending == 0
+    assert handle.cancelled
+
+    await scheduler.start()
+    await asyncio.sleep(0.03)
+    await scheduler.stop()
+
+    assert ReminderEvent.calls == []
+
+
+@pytest.mark.asyncio
+async def test_create_with_invalid_schedule(scheduler):
+    for kwargs in ({}, {"delay": -1}, {"delay": 1, "at": datetime.now()}, {"at": 1}):
+        with pytest.raises(InvalidScheduleException):
+            scheduler.create(event=ReminderEvent, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_create_with_not_running_exception():
+    with pytest.raises(SchedulerNotRunningException):
+        EventScheduler().create(event=ReminderEvent, delay=1)
+
+
+@pytest.mark.asyncio
+async def test_store_with_delay(scheduler):
+    handler = EventHandler(validator=EventHandlerValidator(), scheduler=scheduler)
+
+    handle = await handler.store(event=ReminderEvent, parameter={"id": 1}, delay=0.01)
+    await handler.store(
+        event=ReminderEvent,
+        parameter={"id": 2},
+        at=datetime.now() + timedelta(milliseconds=20),
+    )
+    cancelled = await handler.store(event=ReminderEvent, parameter={"id": 3}, delay=0)
+    cancelled.cancel()
+
+    assert handler.events == []
+    assert scheduler.pending == 0
+
+    await handler._publish()
+    assert scheduler.pending == 2
+
+    await asyncio.sleep(0.06)
+
+    assert ReminderEvent.calls == [1, 2]
+    assert handle.done
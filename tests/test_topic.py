@@ -0,0 +1,125 @@
+import pytest
+
+from fastapi_event import BaseEvent, EventListener, event_handler
+from fastapi_event.exceptions import InvalidParameterTypeException, InvalidTopicException
+from fastapi_event.handler import EventHandler, EventHandlerValidator
+from fastapi_event.registry import EventRegistry
+from fastapi_event.topic import TopicRegistry
+from tests.events import TestEventParameter
+
+calls = []
+
+
+class OrderEmailEvent(BaseEvent):
+    async def run(self, parameter=None) -> None:
+        calls.append(("email", parameter))
+
+
+class OrderStockEvent(BaseEvent):
+    async def run(self, parameter=None) -> None:
+        calls.append(("stock", parameter))
+
+
+class OrderAuditEvent(BaseEvent):
+    async def run(self, parameter=None) -> None:
+        calls.append(("audit", parameter))
+
+
+class TypedOrderEvent(BaseEvent):
+    async def run(self, parameter: TestEventParameter = None) -> None:
+        calls.append(("typed", parameter))
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+@pytest.fixture
+def topics():
+    topics = TopicRegistry(registry=EventRegistry())
+    topics.subscribe("order.placed")(OrderEmailEvent)
+    topics.subscribe("order.placed", "order.cancelled")(OrderStockEvent)
+    topics.subscribe("order.#")(OrderAuditEvent)
+    return topics
+
+
+def test_get_subscribers(topics):
+    table = topics.freeze()
+
+    assert table["order.placed"] == (OrderEmailEvent, OrderStockEvent, OrderAuditEvent)
+    assert table["order.cancelled"] == (OrderStockEvent, OrderAuditEvent)
+    assert topics.get("order.refunded.partial") == (OrderAuditEvent,)
+    assert topics.get("order") == ()
+    assert topics.get("user.created") == ()
+    with pytest.raises(TypeError):
+        table["user.created"] = ()
+
+
+def test_single_segment_wildcard():
+    topics = TopicRegistry(registry=EventRegistry())
+    topics.subscribe("*.placed")(OrderEmailEvent)
+
+    assert topics.get("order.placed") == (OrderEmailEvent,)
+    assert topics.get("eu.order.placed") == ()
+
+
+@pytest.mark.parametrize("pattern", ["", "order..placed", "order.pla*", "order.#x"])
+def test_invalid_topic(pattern):
+    with pytest.raises(InvalidTopicException):
+        TopicRegistry().subscribe(pattern)
+
+
+def test_subscribe_after_freeze_rebuilds_table(topics):
+    topics.freeze()
+    topics.subscribe("order.placed")(TypedOrderEvent)
+
+    assert TypedOrderEvent in topics.get("order.placed")
+
+
+@pytest.mark.asyncio
+async def test_emit(topics):
+    handler = EventHandler(
+        validator=EventHandlerValidator(registry=topics.registry), topics=topics,
+    )
+    payload = {"id": 1}
+
+    await handler.emit(topic="order.placed", payload=payload)
+    await handler._publish(run_at_once=True)
+
+    assert sorted(calls) == [("audit", payload), ("email", payload), ("stock", payload)]
+
+
+@pytest.mark.asyncio
+async def test_emit_validates_every_subscriber_first(topics):
+    topics.subscribe("order.placed")(TypedOrderEvent)
+    handler = EventHandler(
+        validator=EventHandlerValidator(registry=topics.registry), topics=topics,
+    )
+
+    with pytest.raises(InvalidParameterTypeException):
+        await handler.emit(topic="order.placed", payload={"id": 1})
+
+    assert handler.events == []
+
+
+@pytest.mark.asyncio
+async def test_emit_with_event_handler():
+    topics = event_handler.topics
+
+    @topics.subscribe("test.emitted")
+    class EmittedEvent(BaseEvent):
+        async def run(self, parameter=None) -> None:
+            calls.append(("emitted", parameter))
+
+    @EventListener()
+    async def emit():
+        await event_handler.emit("test.emitted", {"id": 1})
+
+    try:
+        with event_handler():
+            await emit()
+    finally:
+        topics.clear()
+
+    assert calls == [("emitted", {"id": 1})]
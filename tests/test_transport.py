@@ -0,0 +1,175 @@
+import asyncio
+import os
+import socket
+import stat
+import sys
+
+import pytest
+
+from fastapi_event import (
+    BaseEvent,
+    EventListener,
+    InProcessTransport,
+    MultiprocessingTransport,
+    UnixSocketTransport,
+    event_handler,
+)
+from fastapi_event.exceptions import (
+    DispatcherNotRunningException,
+    InvalidSerializedParameterException,
+)
+from fastapi_event.serializer import EventCodec, ParameterSerializer
+from fastapi_event.transport import EventSocketServer
+from tests.events import (
+    TestDataclassParameter,
+    TestEventParameter,
+    TestFileEvent,
+    TestNamedTupleParameter,
+)
+
+
+class TransportEvent(BaseEvent):
+    calls = []
+
+    async def run(self, parameter=None) -> None:
+        self.calls.append(parameter.content if parameter else None)
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    TransportEvent.calls = []
+    yield
+
+
+def test_codec():
+    codec = EventCodec()
+
+    data = codec.encode(
+        events=[(TransportEvent, TestEventParameter(content="a")), (TransportEvent, None)],
+    )
+    events = codec.decode(data=data)
+
+    assert isinstance(data, bytes)
+    assert events == [(TransportEvent, TestEventParameter(content="a")), (TransportEvent, None)]
+
+
+
+def test_codec_with_lightweight_parameters():
+    codec = EventCodec()
+    events = [
+        (TransportEvent, TestDataclassParameter(content="a")),
+        (TransportEvent, TestNamedTupleParameter(content="b")),
+        (TransportEvent, {"content": "c"}),
+    ]
+
+    assert codec.decode(data=codec.encode(events=events)) == events
+
+
+def test_codec_does_not_import_type_names_of_data():
+    codec = EventCodec(serializer=ParameterSerializer())
+    data = b'[["tests.test_transport.TransportEvent","tests.not_imported:Parameter","{}"]]'
+
+    with pytest.raises(InvalidSerializedParameterException):
+        codec.decode(data=data)
+
+    assert "tests.not_imported" not in sys.modules
+
+
+def test_codec_loads_annotated_and_registered_types():
+    serializer = ParameterSerializer()
+    codec = EventCodec(serializer=serializer)
+    data = EventCodec().encode(events=[(TransportEvent, TestEventParameter(content="a"))])
+
+    with pytest.raises(InvalidSerializedParameterException):
+        codec.decode(data=data)
+
+    serializer.register(TestEventParameter)
+    assert codec.decode(data=data) == [(TransportEvent, TestEventParameter(content="a"))]
+
+    data = EventCodec().encode(
+        events=[(TestFileEvent, TestEventParameter(content="b"))],
+    )
+    assert EventCodec(serializer=ParameterSerializer()).decode(data=data) == [
+        (TestFileEvent, TestEventParameter(content="b")),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_listener_with_in_process_transport():
+    @EventListener(dispatcher=InProcessTransport())
+    async def test():
+        await event_handler.store(
+            event=TransportEvent, parameter=TestEventParameter(content="content"),
+        )
+
+    with event_handler():
+        await test()
+
+    assert TransportEvent.calls == ["content"]
+
+
+@pytest.mark.asyncio
+async def test_unix_socket_transport(tmp_path):
+    path = str(tmp_path / "events.sock")
+    server = EventSocketServer(path=path)
+    await server.start()
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+    transport = UnixSocketTransport(path=path)
+    await transport.start()
+
+    await transport.dispatch(events=[(TransportEvent, TestEventParameter(content="a"))])
+    await transport.dispatch(events=[(TransportEvent, None)])
+    for _ in range(100):
+        if len(TransportEvent.calls) == 2:
+            break
+        await asyncio.sleep(0.01)
+
+    await transport.stop(timeout=1)
+    await server.stop(timeout=1)
+
+    assert TransportEvent.calls == ["a", None]
+
+
+@pytest.mark.asyncio
+async def test_unix_socket_server_restart(tmp_path):
+    path = str(tmp_path / "events.sock")
+    # Socket file left by a server that crashed
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+
+    server = EventSocketServer(path=path)
+    await server.start()
+    await server.stop(timeout=1)
+    assert not os.path.exists(path)
+
+    await server.start()
+    await server.stop(timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_multiprocessing_transport(tmp_path):
+    path = str(tmp_path / "events.txt")
+    transport = MultiprocessingTransport(workers=1, modules=["tests.events"])
+    await transport.start()
+
+    await transport.dispatch(
+        events=[
+            (TestFileEvent, TestEventParameter(content=f"{path}|a")),
+            (TestFileEvent, TestEventParameter(content=f"{path}|b")),
+        ],
+    )
+    await transport.stop(timeout=5)
+
+    assert os.path.exists(path)
+    with open(path) as f:
+        assert sorted(f.read().split()) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_with_not_running_exception():
+    with pytest.raises(DispatcherNotRunningException):
+        await MultiprocessingTransport().dispatch(events=[(TransportEvent, None)])
+
+    with pytest.raises(DispatcherNotRunningException):
+        await UnixSocketTransport(path="events.sock").dispatch(events=[(TransportEvent, None)])
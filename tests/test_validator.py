@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 
 from fastapi_event.exceptions import (
@@ -6,8 +8,12 @@ from fastapi_event.exceptions import (
     ParameterCountException,
     RequiredParameterException,
 )
-from fastapi_event.handler import EventHandlerValidator
+from fastapi_event.handler import EventHandler, EventHandlerValidator
 from tests.events import (
+    TestDataclassEvent,
+    TestDataclassParameter,
+    TestNamedTupleParameter,
+    TestTypedDictEvent,
     TestEvent,
     TestEventParameter,
     TestEventDoNotHaveParameter,
@@ -61,3 +67,66 @@ async def test_validate():
         parameter=TestEventParameter(content="content")
     )
     assert result is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "parameter",
+    [
+        TestDataclassParameter(content="content"),
+        TestNamedTupleParameter(content="content"),
+        {"content": "content"},
+        {},
+    ],
+)
+async def test_validate_with_lightweight_parameter(parameter):
+    result = await EventHandlerValidator().validate(event=TestEvent, parameter=parameter)
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_validate_with_slots_dataclass_parameter():
+    @dataclasses.dataclass
+    class SlotsParameter:
+        __slots__ = ("content",)
+        content: str
+
+    result = await EventHandlerValidator().validate(
+        event=TestEvent, parameter=SlotsParameter(content="content"),
+    )
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_validate_with_annotated_lightweight_parameter():
+    validator = EventHandlerValidator()
+    await validator.validate(
+        event=TestDataclassEvent, parameter=TestDataclassParameter(content="content"),
+    )
+
+    with pytest.raises(InvalidParameterTypeException):
+        await validator.validate(
+            event=TestDataclassEvent, parameter={"content": "content"},
+        )
+
+
+@pytest.mark.asyncio
+async def test_validate_with_typed_dict_parameter():
+    validator = EventHandlerValidator()
+    await validator.validate(event=TestTypedDictEvent, parameter={"content": "content"})
+
+    with pytest.raises(InvalidParameterTypeException):
+        await validator.validate(
+            event=TestTypedDictEvent,
+            parameter=TestDataclassParameter(content="content"),
+        )
+
+
+@pytest.mark.asyncio
+async def test_store_trusted_parameter_skips_validation():
+    handler = EventHandler(validator=EventHandlerValidator())
+
+    await handler.store(event=TestEvent, parameter="content", trusted=True)
+    await handler.store_many(event=TestEvent, parameters=[1, 2], trusted=True)
+
+    assert [record.parameter for record in handler.events] == ["content", 1, 2]